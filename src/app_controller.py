@@ -448,6 +448,7 @@ class AppController:
         self._song_note_off_callback: Optional[Callable[[int], None]] = None
         self._song_progress_callback: Optional[Callable[[float, float], None]] = None
         self._song_complete_callback: Optional[Callable[[], None]] = None
+        self._song_names: Optional[List[str]] = None  # Built on first use
 
         # Set up audio callback
         self._engine.set_callback(self._audio_callback)
@@ -1136,8 +1137,10 @@ class AppController:
         Returns:
             List of song names
         """
-        songs = get_all_songs()
-        return [song.name for song in songs]
+        # The song catalog is fixed for the process lifetime
+        if self._song_names is None:
+            self._song_names = [song.name for song in get_all_songs()]
+        return list(self._song_names)
 
     def load_song(self, song_name: str) -> bool:
         """Load a song by name.
@@ -33,6 +33,7 @@ from .styles import (
     FONTS,
     DIMENSIONS,
     ColorScheme,
+    MeterService,
     configure_dark_theme,
     create_panel_frame,
     create_slider_with_label
@@ -83,6 +84,7 @@ __all__ = [
     'FONTS',
     'DIMENSIONS',
     'ColorScheme',
+    'MeterService',
     'configure_dark_theme',
     'create_panel_frame',
     'create_slider_with_label',
@@ -12,7 +12,7 @@ from typing import Callable, Dict, Optional, Any
 
 from .styles import (
     COLORS, FONTS, DIMENSIONS, ColorScheme,
-    configure_dark_theme
+    configure_dark_theme, MeterService
 )
 from .controls_panel import (
     OscillatorPanel, FilterPanel, EnvelopePanel,
@@ -87,6 +87,15 @@ class StatusBar(ttk.Frame):
         )
         self.cpu_label.pack(side='right', padx=8)
 
+        # Shared level meter canvas (panels register their bars here)
+        self.meters = MeterService(self, width=120, height=16)
+        self.meters.canvas.pack(side='right', padx=8)
+        ttk.Label(
+            self,
+            text="Rec",
+            style='Dark.TLabel'
+        ).pack(side='right')
+
     def set_status(self, message: str):
         """Set status message."""
         self.status_label.config(text=message)
@@ -624,6 +633,10 @@ class MainWindow(tk.Tk):
         )
         self.visualization_panel.pack(side='left', fill='both', expand=True)
 
+        # Status bar is created early so panels can share its meter canvas;
+        # it is packed last, below the keyboard
+        self.status_bar = StatusBar(main_frame)
+
         # Row 4: Preset + Master + Song + Metronome + Recording
         row4_frame = ttk.Frame(main_frame, style='Dark.TFrame')
         row4_frame.pack(fill='x', pady=(0, 8))
@@ -669,7 +682,8 @@ class MainWindow(tk.Tk):
             on_arm=self._on_record_arm,
             on_export=self._on_record_export,
             on_clear=self._on_record_clear,
-            on_undo=self._on_record_undo
+            on_undo=self._on_record_undo,
+            meter_service=self.status_bar.meters
         )
         self.recording_panel.pack(side='left', fill='both', expand=True)
 
@@ -687,7 +701,6 @@ class MainWindow(tk.Tk):
         self.keyboard.pack(fill='x', pady=(0, 8))
 
         # Row 6: Status bar
-        self.status_bar = StatusBar(main_frame)
         self.status_bar.pack(fill='x', side='bottom')
 
     # BOLT-004: Keyboard callback methods (delegating to PianoKeyboard widget)
@@ -885,6 +898,17 @@ Built with Python and tkinter.
 
     # BOLT-007: Visualization public methods
 
+    def is_waveform_visible(self) -> bool:
+        """Check whether the waveform display is on screen.
+
+        Returns:
+            False if the window is minimized/withdrawn or the
+            visualization panel is not mapped
+        """
+        if self.state() in ('iconic', 'withdrawn'):
+            return False
+        return bool(self.visualization_panel.winfo_ismapped())
+
     def update_waveform(self, samples):
         """Update oscilloscope with new audio samples.
 
@@ -19,11 +19,14 @@ Usage:
     panel.pack()
 """
 
+import time
 import tkinter as tk
+from concurrent.futures import Future, ThreadPoolExecutor
+from math import log10
 from tkinter import ttk, filedialog
 from typing import Callable, Optional
 
-from .styles import COLORS, FONTS, DIMENSIONS, ColorScheme
+from .styles import COLORS, FONTS, DIMENSIONS, MeterService
 
 
 class RecordingPanel(ttk.LabelFrame):
@@ -37,6 +40,12 @@ class RecordingPanel(ttk.LabelFrame):
         duration: Current recording duration in seconds
     """
 
+    # Interval for polling a background export (milliseconds)
+    EXPORT_POLL_INTERVAL = 100
+
+    # Minimum interval between time/meter repaints (milliseconds, ~60 FPS)
+    FRAME_INTERVAL = 16
+
     def __init__(
         self,
         parent: tk.Widget,
@@ -48,6 +57,8 @@ class RecordingPanel(ttk.LabelFrame):
         on_export: Optional[Callable[[str], None]] = None,
         on_clear: Optional[Callable[[], None]] = None,
         on_undo: Optional[Callable[[], None]] = None,
+        meter_service: Optional[MeterService] = None,
+        lazy: bool = False,
         **kwargs
     ):
         """Initialize recording panel.
@@ -62,6 +73,9 @@ class RecordingPanel(ttk.LabelFrame):
             on_export: Callback for export (filepath)
             on_clear: Callback to clear recording
             on_undo: Callback to undo last take
+            meter_service: Shared meter canvas to draw the level bar on
+                (a private one is created if omitted)
+            lazy: Defer widget creation until the panel is first mapped
         """
         super().__init__(
             parent,
@@ -81,6 +95,9 @@ class RecordingPanel(ttk.LabelFrame):
         self._on_clear = on_clear
         self._on_undo = on_undo
 
+        # Level meter host (may be shared with other panels)
+        self._meter_service = meter_service
+
         # State
         self._recording = False
         self._paused = False
@@ -89,10 +106,38 @@ class RecordingPanel(ttk.LabelFrame):
         self._peak_level = 0.0
         self._has_recording = False
         self._can_undo = False
+        self._exporting = False
+        self._status_text = "IDLE"
+        self._last_state = 'IDLE'
+        self._info_text = ""
+
+        # Pending coalesced repaint of time display + level meter
+        self._frame_job = None
+        self._last_frame_time = 0.0
+
+        # Pending poll for a running background export
+        self._export_job = None
 
-        # Create widgets
+        # Export runs off the Tk thread so the meter/timer keep updating
+        self._io_pool = ThreadPoolExecutor(max_workers=1)
+
+        # Create widgets (public setters only stash state until built)
+        self._widgets_built = False
+        if lazy:
+            self._map_binding = self.bind('<Map>', self._lazy_init, add='+')
+        else:
+            self._create_widgets()
+
+    def _lazy_init(self, event=None):
+        """Build widgets on first map and replay any stashed state."""
+        self.unbind('<Map>', self._map_binding)
         self._create_widgets()
 
+        self._status_label.configure(text=self._status_text)
+        self._info_label.configure(text=self._info_text)
+        self._sync_widgets()
+        self._render_frame()
+
     def _create_widgets(self):
         """Create panel widgets."""
         # Main container
@@ -175,22 +220,15 @@ class RecordingPanel(ttk.LabelFrame):
         ).pack(side='left', padx=(0, 8))
 
         # Level meter canvas
-        self._meter_canvas = tk.Canvas(
-            meter_frame,
-            width=200,
-            height=16,
-            bg=ColorScheme.bg_input,
-            highlightthickness=1,
-            highlightbackground=ColorScheme.border
-        )
-        self._meter_canvas.pack(side='left', fill='x', expand=True, padx=(0, 8))
+        if self._meter_service is None:
+            self._meter_service = MeterService(meter_frame)
+            self._meter_service.canvas.pack(
+                side='left', fill='x', expand=True, padx=(0, 8)
+            )
+        self._meter_canvas = self._meter_service.canvas
 
         # Draw initial meter
-        self._meter_bar = self._meter_canvas.create_rectangle(
-            2, 2, 2, 14,
-            fill=ColorScheme.success,
-            outline=''
-        )
+        self._meter_bar = self._meter_service.register('rec_level')
 
         # Peak level label
         self._level_label = ttk.Label(
@@ -243,6 +281,8 @@ class RecordingPanel(ttk.LabelFrame):
         )
         self._info_label.pack(side='right')
 
+        self._widgets_built = True
+
     def _on_record_click(self):
         """Handle record button click."""
         if not self._recording:
@@ -276,7 +316,34 @@ class RecordingPanel(ttk.LabelFrame):
             filetypes=[("WAV files", "*.wav"), ("All files", "*.*")]
         )
         if filepath and self._on_export:
-            self._on_export(filepath)
+            self._exporting = True
+            self._status_before_export = self._status_text
+            self._set_status("EXPORTING")
+            self._update_button_states()
+
+            future = self._io_pool.submit(self._on_export, filepath)
+            self._poll_export(future)
+
+    def _poll_export(self, future: Future):
+        """Wait for a background export to finish without blocking Tk.
+
+        Args:
+            future: Future returned by the export worker
+        """
+        if not future.done():
+            self._export_job = self.after(
+                self.EXPORT_POLL_INTERVAL, self._poll_export, future
+            )
+            return
+
+        self._export_job = None
+        self._exporting = False
+        if future.exception() is not None:
+            self._set_status("EXPORT FAILED")
+        elif self._status_text == "EXPORTING":
+            # Only restore if no state change replaced the status meanwhile
+            self._set_status(self._status_before_export)
+        self._update_button_states()
 
     def _on_clear_click(self):
         """Handle clear button click."""
@@ -298,9 +365,10 @@ class RecordingPanel(ttk.LabelFrame):
         self._paused = False
         self._armed = False
         self._has_recording = True
+        self._last_state = 'RECORDING'
 
         self._record_btn.configure(text="REC", style='Record.TButton')
-        self._status_label.configure(text="RECORDING")
+        self._set_status("RECORDING")
         self._update_button_states()
 
         if self._on_record:
@@ -311,9 +379,11 @@ class RecordingPanel(ttk.LabelFrame):
         self._recording = False
         self._paused = False
         self._armed = False
+        # Cache what is shown so the controller's IDLE still re-renders
+        self._last_state = 'STOPPED'
 
         self._record_btn.configure(text="REC", style='Record.TButton')
-        self._status_label.configure(text="STOPPED")
+        self._set_status("STOPPED")
         self._update_button_states()
 
         if self._on_stop:
@@ -322,9 +392,10 @@ class RecordingPanel(ttk.LabelFrame):
     def _pause_recording(self):
         """Pause recording."""
         self._paused = True
+        self._last_state = 'PAUSED'
 
         self._pause_btn.configure(text="RESUME")
-        self._status_label.configure(text="PAUSED")
+        self._set_status("PAUSED")
 
         if self._on_pause:
             self._on_pause()
@@ -332,9 +403,10 @@ class RecordingPanel(ttk.LabelFrame):
     def _resume_recording(self):
         """Resume recording."""
         self._paused = False
+        self._last_state = 'RECORDING'
 
         self._pause_btn.configure(text="PAUSE")
-        self._status_label.configure(text="RECORDING")
+        self._set_status("RECORDING")
 
         if self._on_resume:
             self._on_resume()
@@ -342,9 +414,10 @@ class RecordingPanel(ttk.LabelFrame):
     def _arm_recording(self):
         """Arm for recording (auto-start on input)."""
         self._armed = True
+        self._last_state = 'ARMED'
 
         self._arm_btn.configure(style='Record.TButton')
-        self._status_label.configure(text="ARMED")
+        self._set_status("ARMED")
 
         if self._on_arm:
             self._on_arm()
@@ -352,12 +425,27 @@ class RecordingPanel(ttk.LabelFrame):
     def _disarm_recording(self):
         """Disarm recording."""
         self._armed = False
+        self._last_state = 'IDLE'
 
         self._arm_btn.configure(style='Dark.TButton')
-        self._status_label.configure(text="IDLE")
+        self._set_status("IDLE")
+
+    def _sync_widgets(self):
+        """Bring transport button looks and states in line with state flags."""
+        if not self._widgets_built:
+            return
+
+        self._arm_btn.configure(
+            style='Record.TButton' if self._armed else 'Dark.TButton'
+        )
+        self._pause_btn.configure(text="RESUME" if self._paused else "PAUSE")
+        self._update_button_states()
 
     def _update_button_states(self):
         """Update button enabled/disabled states."""
+        if not self._widgets_built:
+            return
+
         if self._recording:
             self._record_btn.configure(state='normal')
             self._arm_btn.configure(state='disabled')
@@ -367,12 +455,14 @@ class RecordingPanel(ttk.LabelFrame):
             self._clear_btn.configure(state='disabled')
             self._undo_btn.configure(state='disabled')
         else:
-            self._record_btn.configure(state='normal')
-            self._arm_btn.configure(state='normal')
+            # Don't start a new take while the current one is being exported
+            transport_state = 'disabled' if self._exporting else 'normal'
+            self._record_btn.configure(state=transport_state)
+            self._arm_btn.configure(state=transport_state)
             self._pause_btn.configure(state='disabled')
             self._stop_btn.configure(state='disabled')
 
-            if self._has_recording:
+            if self._has_recording and not self._exporting:
                 self._export_btn.configure(state='normal')
                 self._clear_btn.configure(state='normal')
             else:
@@ -384,35 +474,44 @@ class RecordingPanel(ttk.LabelFrame):
             else:
                 self._undo_btn.configure(state='disabled')
 
+    def _set_status(self, text: str):
+        """Set the status indicator text."""
+        self._status_text = text
+        if self._widgets_built:
+            self._status_label.configure(text=text)
+
     def _update_time_display(self):
         """Update the time display label."""
         minutes = int(self._duration // 60)
         seconds = self._duration % 60
         self._time_label.configure(text=f"{minutes:02d}:{seconds:05.2f}")
 
-    def _update_level_meter(self):
-        """Update the level meter display."""
-        # Calculate meter width (0-196 pixels)
-        meter_width = self._meter_canvas.winfo_width() - 4
-        bar_width = int(self._peak_level * meter_width)
-        bar_width = max(0, min(meter_width, bar_width))
-
-        # Determine color based on level
-        if self._peak_level > 0.9:
-            color = ColorScheme.error  # Red for clipping
-        elif self._peak_level > 0.7:
-            color = ColorScheme.warning  # Yellow for hot
+    def _request_frame(self):
+        """Schedule one repaint covering both the time display and meter."""
+        if self._frame_job is not None or not self._widgets_built:
+            return
+
+        elapsed_ms = (time.perf_counter() - self._last_frame_time) * 1000
+        if elapsed_ms >= self.FRAME_INTERVAL:
+            self._frame_job = self.after_idle(self._render_frame)
         else:
-            color = ColorScheme.success  # Green for normal
+            delay = int(self.FRAME_INTERVAL - elapsed_ms) + 1
+            self._frame_job = self.after(delay, self._render_frame)
 
-        # Update bar
-        self._meter_canvas.coords(self._meter_bar, 2, 2, 2 + bar_width, 14)
-        self._meter_canvas.itemconfig(self._meter_bar, fill=color)
+    def _render_frame(self):
+        """Paint the latest duration and peak level together."""
+        self._frame_job = None
+        self._last_frame_time = time.perf_counter()
+        self._update_time_display()
+        self._update_level_meter()
+
+    def _update_level_meter(self):
+        """Update the level meter display."""
+        self._meter_service.update('rec_level', self._peak_level)
 
         # Update dB label
         if self._peak_level > 0:
-            import math
-            db = 20 * math.log10(max(self._peak_level, 0.0001))
+            db = 20 * log10(max(self._peak_level, 0.0001))
             self._level_label.configure(text=f"{db:.1f} dB")
         else:
             self._level_label.configure(text="-inf dB")
@@ -426,7 +525,7 @@ class RecordingPanel(ttk.LabelFrame):
             seconds: Duration in seconds
         """
         self._duration = seconds
-        self._update_time_display()
+        self._request_frame()
 
     def update_level(self, peak: float):
         """Update audio level meter.
@@ -435,7 +534,7 @@ class RecordingPanel(ttk.LabelFrame):
             peak: Peak level (0.0-1.0)
         """
         self._peak_level = peak
-        self._update_level_meter()
+        self._request_frame()
 
     def update_state(self, state_name: str):
         """Update recording state from external source.
@@ -444,30 +543,28 @@ class RecordingPanel(ttk.LabelFrame):
             state_name: State name (IDLE, ARMED, RECORDING, PAUSED)
         """
         state_name = state_name.upper()
-        self._status_label.configure(text=state_name)
+        if state_name == self._last_state:
+            return
+        self._last_state = state_name
+        self._set_status(state_name)
 
         if state_name == 'RECORDING':
             self._recording = True
             self._paused = False
             self._armed = False
             self._has_recording = True
-            self._record_btn.configure(style='Record.TButton')
         elif state_name == 'PAUSED':
             self._recording = True
             self._paused = True
-            self._pause_btn.configure(text="RESUME")
         elif state_name == 'ARMED':
             self._recording = False
             self._armed = True
-            self._arm_btn.configure(style='Record.TButton')
         else:  # IDLE
             self._recording = False
             self._paused = False
             self._armed = False
-            self._arm_btn.configure(style='Dark.TButton')
-            self._pause_btn.configure(text="PAUSE")
 
-        self._update_button_states()
+        self._sync_widgets()
 
     def set_can_undo(self, can_undo: bool):
         """Set whether undo is available.
@@ -487,13 +584,29 @@ class RecordingPanel(ttk.LabelFrame):
         self._has_recording = has_recording
         self._update_button_states()
 
+    def destroy(self):
+        """Destroy panel and release the export worker."""
+        if self._frame_job is not None:
+            self.after_cancel(self._frame_job)
+            self._frame_job = None
+        if self._export_job is not None:
+            self.after_cancel(self._export_job)
+            self._export_job = None
+        if self._widgets_built:
+            # The meter may live on a shared canvas that outlives this panel
+            self._meter_service.unregister('rec_level')
+        self._io_pool.shutdown(wait=False)
+        super().destroy()
+
     def set_info(self, info_text: str):
         """Set recording info text.
 
         Args:
             info_text: Info to display (e.g., "2.5 MB, 44100 Hz")
         """
-        self._info_label.configure(text=info_text)
+        self._info_text = info_text
+        if self._widgets_built:
+            self._info_label.configure(text=info_text)
 
     # Properties
 
@@ -67,12 +67,25 @@ class ReverbPanel(ttk.LabelFrame):
 
         # Variables
         self._enabled_var = tk.BooleanVar(value=False)
-        self._wet_dry_var = tk.DoubleVar(value=0.3)
+        # Wet/dry is read straight from the Scale command argument, skipping
+        # a DoubleVar Tcl round-trip per drag event
+        self._wet_dry = 0.3
         self._room_size_var = tk.DoubleVar(value=0.5)
 
+        # Last room size percent shown, to skip sub-percent drag events
+        self._room_pct_last = -1
+
+        # Set while a property setter writes a variable so the trace
+        # handlers don't echo programmatic changes back to the callbacks
+        self._suppress = False
+
         # Create widgets
         self._create_widgets()
 
+        # Single dispatch path for both user edits and setter writes
+        self._enabled_var.trace_add('write', self._on_enabled_var_write)
+        self._room_size_var.trace_add('write', self._on_room_size_var_write)
+
     def _create_widgets(self):
         """Create panel widgets."""
         # Main container
@@ -87,8 +100,7 @@ class ReverbPanel(ttk.LabelFrame):
             top_frame,
             text="Enable",
             variable=self._enabled_var,
-            style='Dark.TCheckbutton',
-            command=self._on_enable_toggle
+            style='Dark.TCheckbutton'
         )
         self._enable_btn.pack(side='left')
 
@@ -116,7 +128,7 @@ class ReverbPanel(ttk.LabelFrame):
             wetdry_frame,
             from_=0.0,
             to=1.0,
-            variable=self._wet_dry_var,
+            value=self._wet_dry,
             orient='horizontal',
             length=100,
             style='Dark.Horizontal.TScale',
@@ -150,8 +162,7 @@ class ReverbPanel(ttk.LabelFrame):
             variable=self._room_size_var,
             orient='horizontal',
             length=100,
-            style='Dark.Horizontal.TScale',
-            command=self._on_room_size_slider_change
+            style='Dark.Horizontal.TScale'
         )
         self._room_size_slider.pack(side='left', fill='x', expand=True, padx=(0, 4))
 
@@ -163,8 +174,8 @@ class ReverbPanel(ttk.LabelFrame):
         )
         self._room_size_label.pack(side='right')
 
-    def _on_enable_toggle(self):
-        """Handle enable toggle."""
+    def _on_enabled_var_write(self, *args):
+        """Handle writes to the enable variable."""
         enabled = self._enabled_var.get()
 
         if enabled:
@@ -172,25 +183,43 @@ class ReverbPanel(ttk.LabelFrame):
         else:
             self._status_label.configure(text="OFF", foreground=ColorScheme.fg_muted)
 
+        if self._suppress:
+            return
         if self._on_enable_change:
             self._on_enable_change(enabled)
 
     def _on_wet_dry_slider_change(self, value):
         """Handle wet/dry slider change."""
-        mix = float(value)
+        mix = self._wet_dry = float(value)
         self._wet_dry_label.configure(text=f"{int(mix * 100)}%")
 
+        if self._suppress:
+            return
         if self._on_wet_dry_change:
             self._on_wet_dry_change(mix)
 
-    def _on_room_size_slider_change(self, value):
-        """Handle room size slider change."""
-        size = float(value)
-        self._room_size_label.configure(text=f"{int(size * 100)}%")
-
+    def _on_room_size_var_write(self, *args):
+        """Handle writes to the room size variable."""
+        size = self._room_size_var.get()
+        pct = int(size * 100)
+        if pct == self._room_pct_last:
+            return
+        self._room_pct_last = pct
+        self._room_size_label.configure(text=f"{pct}%")
+
+        if self._suppress:
+            return
         if self._on_room_size_change:
             self._on_room_size_change(size)
 
+    def _set_var_quietly(self, var: tk.Variable, value):
+        """Write a variable without firing the change callback."""
+        self._suppress = True
+        try:
+            var.set(value)
+        finally:
+            self._suppress = False
+
     # Public properties
 
     @property
@@ -201,20 +230,24 @@ class ReverbPanel(ttk.LabelFrame):
     @enabled.setter
     def enabled(self, value: bool):
         """Set whether reverb is enabled."""
-        self._enabled_var.set(value)
-        self._on_enable_toggle()
+        self._set_var_quietly(self._enabled_var, value)
 
     @property
     def wet_dry(self) -> float:
         """Get wet/dry mix."""
-        return self._wet_dry_var.get()
+        return self._wet_dry
 
     @wet_dry.setter
     def wet_dry(self, value: float):
         """Set wet/dry mix."""
         value = max(0.0, min(1.0, value))
-        self._wet_dry_var.set(value)
+        self._wet_dry = value
         self._wet_dry_label.configure(text=f"{int(value * 100)}%")
+        self._suppress = True
+        try:
+            self._wet_dry_slider.set(value)
+        finally:
+            self._suppress = False
 
     @property
     def room_size(self) -> float:
@@ -225,8 +258,7 @@ class ReverbPanel(ttk.LabelFrame):
     def room_size(self, value: float):
         """Set room size."""
         value = max(0.0, min(1.0, value))
-        self._room_size_var.set(value)
-        self._room_size_label.configure(text=f"{int(value * 100)}%")
+        self._set_var_quietly(self._room_size_var, value)
 
     def get_values(self) -> dict:
         """Get all reverb values as dict."""
@@ -19,12 +19,24 @@ Usage:
 """
 
 import tkinter as tk
+from concurrent.futures import Future, ThreadPoolExecutor
 from tkinter import ttk
 from typing import Callable, List, Optional
 
 from .styles import COLORS, FONTS, DIMENSIONS, ColorScheme
 
 
+# Time label template: current M:SS / total M:SS
+_TIME_FORMAT = "%d:%02d / %d:%02d"
+
+# Keys accepted by SongPlayerPanel.set_values
+_SETTABLE_KEYS = frozenset({'song_selected'})
+
+
+def _noop(*args, **kwargs):
+    """Stand-in for callbacks that were not supplied."""
+
+
 class SongPlayerPanel(ttk.LabelFrame):
     """Song player control panel.
 
@@ -37,6 +49,18 @@ class SongPlayerPanel(ttk.LabelFrame):
         progress: Current progress (0.0-1.0)
     """
 
+    # Minimum interval between progress repaints (milliseconds, ~30 FPS)
+    PROGRESS_FLUSH_INTERVAL = 33
+
+    # Quiet time before a song selection triggers a load (milliseconds)
+    SELECT_DEBOUNCE_INTERVAL = 250
+
+    # Interval for checking whether a song load has finished (milliseconds)
+    LOAD_POLL_INTERVAL = 20
+
+    # Height of the canvas progress bar (pixels)
+    PROGRESS_BAR_HEIGHT = 10
+
     def __init__(
         self,
         parent: tk.Widget,
@@ -65,11 +89,11 @@ class SongPlayerPanel(ttk.LabelFrame):
             **kwargs
         )
 
-        # Callbacks
-        self._on_play = on_play
-        self._on_stop = on_stop
-        self._on_pause = on_pause
-        self._on_song_select = on_song_select
+        # Callbacks (missing ones are no-ops, so handlers call unconditionally)
+        self._on_play = on_play or _noop
+        self._on_stop = on_stop or _noop
+        self._on_pause = on_pause or _noop
+        self._on_song_select = on_song_select or _noop
 
         # State
         self._is_playing = False
@@ -77,133 +101,288 @@ class SongPlayerPanel(ttk.LabelFrame):
 
         # Variables
         self._song_var = tk.StringVar()
-        self._progress_var = tk.DoubleVar(value=0.0)
 
-        # Song list
+        # Song list (ordered) and membership index
         self._song_list = song_list or []
+        self._song_set = set(self._song_list)
 
-        # Create widgets
-        self._create_widgets()
+        # Latest (current, total) awaiting a coalesced repaint
+        self._pending_progress = None
+        self._flush_job = None
 
-    def _create_widgets(self):
-        """Create panel widgets."""
-        # Main container
-        main_frame = ttk.Frame(self, style='Dark.TFrame')
-        main_frame.pack(fill='both', expand=True)
+        # (is_playing, is_paused) last reflected in the buttons
+        self._last_applied_state = None
 
-        # Top row: Song selector
-        selector_frame = ttk.Frame(main_frame, style='Dark.TFrame')
-        selector_frame.pack(fill='x', pady=(0, 8))
+        # Pending debounced song selection
+        self._select_after_id = None
+
+        # Set while the panel writes the song variable itself, so the trace
+        # only loads songs the user picked
+        self._suppress = False
+
+        # Song loading runs off the Tk thread so the UI stays responsive
+        self._io_pool = ThreadPoolExecutor(max_workers=1)
+        self._select_future: Optional[Future] = None
+        self._load_poll_job = None
+
+        # Set while a play click waits for the song load to finish
+        self._play_pending = False
+
+        # Whole seconds shown in the time label, to skip no-op relabels
+        self._last_time_int = (0, 0)
+
+        # Cleared while unmapped so progress/button repaints are skipped
+        self._visible = True
+
+        # Reused get_values() snapshot
+        self._values_cache = {'song_selected': '', 'song_is_playing': False}
 
+        # Progress bar fill fraction and current canvas width
+        self._progress_value = 0.0
+        self._progress_width = 200
+
+        # Create widgets (progress row is built on first use)
+        self._create_top_widgets()
+
+        self.bind('<Map>', self._on_map, add='+')
+        self.bind('<Unmap>', self._on_unmap, add='+')
+
+    def _create_top_widgets(self):
+        """Create song selector and transport widgets.
+
+        Children are gridded directly on the panel rather than in nested
+        row frames, so the panel holds no intermediate container windows.
+        Columns 0-3 hold the transport buttons and status; column 4 takes
+        the spare width.
+        """
+        self.columnconfigure(4, weight=1)
+
+        # Top row: Song selector
         ttk.Label(
-            selector_frame,
+            self,
             text="Song",
             style='Dark.TLabel'
-        ).pack(side='left', padx=(0, 8))
+        ).grid(row=0, column=0, sticky='w', padx=(0, 8), pady=(0, 8))
 
         self._song_combo = ttk.Combobox(
-            selector_frame,
+            self,
             textvariable=self._song_var,
             values=self._song_list,
             state='readonly',
             width=20,
             style='Dark.TCombobox'
         )
-        self._song_combo.pack(side='left', fill='x', expand=True)
-        self._song_combo.bind('<<ComboboxSelected>>', self._on_song_selected)
+        self._song_combo.grid(
+            row=0, column=1, columnspan=4, sticky='ew', pady=(0, 8)
+        )
+        self._song_var.trace_add('write', self._on_song_var_write)
 
         # Middle row: Control buttons
-        controls_frame = ttk.Frame(main_frame, style='Dark.TFrame')
-        controls_frame.pack(fill='x', pady=(0, 8))
-
         # Play button
         self._play_btn = ttk.Button(
-            controls_frame,
+            self,
             text="PLAY",
             style='Accent.TButton',
             width=8,
             command=self._on_play_click
         )
-        self._play_btn.pack(side='left', padx=(0, 4))
+        self._play_btn.grid(row=1, column=0, sticky='w', padx=(0, 4), pady=(0, 8))
 
         # Pause button
         self._pause_btn = ttk.Button(
-            controls_frame,
+            self,
             text="PAUSE",
             style='Dark.TButton',
             width=8,
             command=self._on_pause_click,
             state='disabled'
         )
-        self._pause_btn.pack(side='left', padx=(0, 4))
+        self._pause_btn.grid(row=1, column=1, sticky='w', padx=(0, 4), pady=(0, 8))
 
         # Stop button
         self._stop_btn = ttk.Button(
-            controls_frame,
+            self,
             text="STOP",
             style='Dark.TButton',
             width=8,
             command=self._on_stop_click,
             state='disabled'
         )
-        self._stop_btn.pack(side='left', padx=(0, 8))
+        self._stop_btn.grid(row=1, column=2, sticky='w', padx=(0, 8), pady=(0, 8))
 
         # Status label
         self._status_label = ttk.Label(
-            controls_frame,
+            self,
             text="Stopped",
             style='Dark.TLabel',
             foreground=ColorScheme.fg_muted
         )
-        self._status_label.pack(side='left', padx=(8, 0))
+        self._status_label.grid(
+            row=1, column=3, columnspan=2, sticky='w', padx=(8, 0), pady=(0, 8)
+        )
 
-        # Bottom row: Progress bar and time display
-        progress_frame = ttk.Frame(main_frame, style='Dark.TFrame')
-        progress_frame.pack(fill='x')
+    def _create_progress_widgets(self):
+        """Create progress bar and time display if not built yet."""
+        if hasattr(self, '_progress_bar'):
+            return
 
-        # Time display (current / total)
+        # Bottom row: Progress bar and time display. The time label spans
+        # the PLAY/PAUSE columns so adding it later does not widen column 0.
         self._time_label = ttk.Label(
-            progress_frame,
+            self,
             text="0:00 / 0:00",
             style='Value.TLabel',
             width=12
         )
-        self._time_label.pack(side='left', padx=(0, 8))
-
-        # Progress bar
-        self._progress_bar = ttk.Progressbar(
-            progress_frame,
-            variable=self._progress_var,
-            maximum=1.0,
-            mode='determinate',
-            style='Dark.Horizontal.TProgressbar',
-            length=200
+        self._time_label.grid(row=2, column=0, columnspan=2, sticky='w', padx=(0, 8))
+
+        # Progress bar: a single canvas rectangle, resized via coords()
+        self._progress_bar = tk.Canvas(
+            self,
+            width=200,
+            height=self.PROGRESS_BAR_HEIGHT,
+            bg=COLORS['bg_input'],
+            highlightthickness=0
+        )
+        self._progress_bar.grid(row=2, column=2, columnspan=3, sticky='ew')
+        self._progress_rect = self._progress_bar.create_rectangle(
+            0, 0, 0, self.PROGRESS_BAR_HEIGHT,
+            fill=COLORS['accent_primary'],
+            outline=''
+        )
+        self._progress_bar.bind('<Configure>', self._on_progress_configure)
+
+    def _on_progress_configure(self, event):
+        """Track progress bar width and rescale the filled rectangle."""
+        self._progress_width = event.width
+        self._set_progress_fill(self._progress_value)
+
+    def _set_progress_fill(self, progress: float):
+        """Resize the filled rectangle to the given fraction (0.0-1.0)."""
+        self._progress_value = progress
+        self._progress_bar.coords(
+            self._progress_rect,
+            0, 0, self._progress_width * progress, self.PROGRESS_BAR_HEIGHT
         )
-        self._progress_bar.pack(side='left', fill='x', expand=True)
+
+    def _on_map(self, event):
+        """Resume repaints and catch up on state missed while hidden."""
+        if event.widget is not self:
+            return
+        self._visible = True
+        self._update_button_states()
+        if self._pending_progress is not None and self._flush_job is None:
+            self._flush_job = self.after_idle(self._flush_progress)
+
+    def _on_unmap(self, event):
+        """Stop repainting while the panel is not on screen."""
+        if event.widget is self:
+            self._visible = False
+
+    def _on_song_var_write(self, *args):
+        """Handle writes to the song variable made by the user."""
+        if self._suppress:
+            return
+        self._on_song_selected()
+
+    def _set_song_quietly(self, name: str):
+        """Write the song variable without triggering a song load."""
+        self._suppress = True
+        try:
+            self._song_var.set(name)
+        finally:
+            self._suppress = False
 
     def _on_song_selected(self, event=None):
-        """Handle song selection change."""
+        """Handle song selection change.
+
+        Debounced so that arrowing through the list only loads the song
+        the user settles on.
+        """
+        if self._select_after_id is not None:
+            self.after_cancel(self._select_after_id)
+        self._select_after_id = self.after(
+            self.SELECT_DEBOUNCE_INTERVAL, self._fire_song_select
+        )
+
+    def _fire_song_select(self):
+        """Load the currently selected song on the I/O worker."""
+        self._select_after_id = None
         song_name = self._song_var.get()
-        if song_name and self._on_song_select:
-            self._on_song_select(song_name)
+        if song_name and self._on_song_select is not _noop:
+            self._select_future = self._io_pool.submit(
+                self._on_song_select, song_name
+            )
 
     def _on_play_click(self):
-        """Handle play button click."""
+        """Handle play button click.
+
+        A just-picked song is loaded first; playback starts once the load
+        finishes, without blocking the Tk thread.
+        """
+        if self._select_after_id is not None:
+            self.after_cancel(self._select_after_id)
+            self._fire_song_select()
+
+        if self._select_future is not None:
+            if not self._play_pending:
+                self._play_pending = True
+                self._poll_song_load(self._select_future)
+            return
+
+        self._start_playback()
+
+    def _poll_song_load(self, future: Future):
+        """Start a pending play once the song load has finished.
+
+        Args:
+            future: Future returned by the song loading worker
+        """
+        if not future.done():
+            self._load_poll_job = self.after(
+                self.LOAD_POLL_INTERVAL, self._poll_song_load, future
+            )
+            return
+        self._load_poll_job = None
+
+        if self._select_future is future:
+            self._select_future = None
+        if not self._play_pending:
+            # Stopped while waiting
+            return
+        self._play_pending = False
+
+        if future.exception() is not None:
+            self._last_applied_state = None
+            self._status_label.configure(
+                text="Load failed",
+                foreground=ColorScheme.error
+            )
+            return
+
+        if self._select_future is not None:
+            # Another song was picked meanwhile; wait for that one too
+            self._on_play_click()
+            return
+        self._start_playback()
+
+    def _start_playback(self):
+        """Start or resume playback of the loaded song."""
+        self._create_progress_widgets()
+
         if self._is_paused:
             # Resume from pause
             self._is_paused = False
             self._is_playing = True
             self._update_button_states()
 
-            if self._on_play:
-                self._on_play()
+            self._on_play()
         elif not self._is_playing:
             # Start playback
             self._is_playing = True
             self._update_button_states()
 
-            if self._on_play:
-                self._on_play()
+            self._on_play()
 
     def _on_pause_click(self):
         """Handle pause button click."""
@@ -212,22 +391,29 @@ class SongPlayerPanel(ttk.LabelFrame):
             self._is_playing = False
             self._update_button_states()
 
-            if self._on_pause:
-                self._on_pause()
+            self._on_pause()
 
     def _on_stop_click(self):
         """Handle stop button click."""
+        self._play_pending = False
         self._is_playing = False
         self._is_paused = False
-        self._progress_var.set(0.0)
-        self._time_label.configure(text="0:00 / 0:00")
+        self._pending_progress = None
+        self._last_time_int = (0, 0)
+        if hasattr(self, '_progress_bar'):
+            self._set_progress_fill(0.0)
+            self._time_label.configure(text="0:00 / 0:00")
         self._update_button_states()
 
-        if self._on_stop:
-            self._on_stop()
+        self._on_stop()
 
     def _update_button_states(self):
         """Update button enabled states based on playback state."""
+        state = (self._is_playing, self._is_paused)
+        if not self._visible or state == self._last_applied_state:
+            return
+        self._last_applied_state = state
+
         if self._is_playing:
             self._play_btn.configure(state='disabled')
             self._pause_btn.configure(state='normal')
@@ -253,12 +439,6 @@ class SongPlayerPanel(ttk.LabelFrame):
                 foreground=ColorScheme.fg_muted
             )
 
-    def _format_time(self, seconds: float) -> str:
-        """Format seconds as M:SS."""
-        minutes = int(seconds // 60)
-        secs = int(seconds % 60)
-        return f"{minutes}:{secs:02d}"
-
     # Public methods
 
     def set_song_list(self, songs: List[str]):
@@ -267,26 +447,57 @@ class SongPlayerPanel(ttk.LabelFrame):
         Args:
             songs: List of song names
         """
-        self._song_list = songs
-        self._song_combo['values'] = songs
+        # Song catalogs are often re-sent unchanged; skip the Tk list rebuild
+        if songs != self._song_list:
+            self._song_list = list(songs)
+            self._song_set = set(self._song_list)
+            self._song_combo['values'] = self._song_list
 
         if songs and not self._song_var.get():
-            self._song_var.set(songs[0])
+            self._set_song_quietly(songs[0])
             self._on_song_selected()
 
     def update_progress(self, current: float, total: float):
         """Update progress display.
 
+        Only the latest position is kept; the display is repainted at most
+        once per PROGRESS_FLUSH_INTERVAL however often this is called, and
+        not at all while the panel is unmapped.
+
         Args:
             current: Current position in seconds
             total: Total duration in seconds
         """
+        self._create_progress_widgets()
+
+        self._pending_progress = (current, total)
+        if self._visible and self._flush_job is None:
+            self._flush_job = self.after(
+                self.PROGRESS_FLUSH_INTERVAL, self._flush_progress
+            )
+
+    def _flush_progress(self):
+        """Repaint progress bar and time label from the latest position."""
+        self._flush_job = None
+        if self._pending_progress is None:
+            return
+        current, total = self._pending_progress
+        self._pending_progress = None
+
         if total > 0:
             progress = min(1.0, current / total)
-            self._progress_var.set(progress)
+            self._set_progress_fill(progress)
+
+        time_int = (int(current), int(total))
+        if time_int == self._last_time_int:
+            return
+        self._last_time_int = time_int
 
-        time_str = f"{self._format_time(current)} / {self._format_time(total)}"
-        self._time_label.configure(text=time_str)
+        cur_min, cur_sec = divmod(time_int[0], 60)
+        tot_min, tot_sec = divmod(time_int[1], 60)
+        self._time_label.configure(
+            text=_TIME_FORMAT % (cur_min, cur_sec, tot_min, tot_sec)
+        )
 
     def set_playing(self, is_playing: bool):
         """Set playing state.
@@ -314,10 +525,27 @@ class SongPlayerPanel(ttk.LabelFrame):
         """Set stopped state."""
         self._is_playing = False
         self._is_paused = False
-        self._progress_var.set(0.0)
-        self._time_label.configure(text="0:00 / 0:00")
+        self._pending_progress = None
+        self._last_time_int = (0, 0)
+        if hasattr(self, '_progress_bar'):
+            self._set_progress_fill(0.0)
+            self._time_label.configure(text="0:00 / 0:00")
         self._update_button_states()
 
+    def destroy(self):
+        """Destroy panel and release the song loading worker."""
+        if self._select_after_id is not None:
+            self.after_cancel(self._select_after_id)
+            self._select_after_id = None
+        if self._load_poll_job is not None:
+            self.after_cancel(self._load_poll_job)
+            self._load_poll_job = None
+        if self._flush_job is not None:
+            self.after_cancel(self._flush_job)
+            self._flush_job = None
+        self._io_pool.shutdown(wait=False)
+        super().destroy()
+
     @property
     def selected_song(self) -> str:
         """Get currently selected song name."""
@@ -326,8 +554,9 @@ class SongPlayerPanel(ttk.LabelFrame):
     @selected_song.setter
     def selected_song(self, name: str):
         """Set selected song."""
-        if name in self._song_list:
-            self._song_var.set(name)
+        if name in self._song_set and name != self._song_var.get():
+            self._set_song_quietly(name)
+            self._on_song_selected()
 
     @property
     def is_playing(self) -> bool:
@@ -340,13 +569,18 @@ class SongPlayerPanel(ttk.LabelFrame):
         return self._is_paused
 
     def get_values(self) -> dict:
-        """Get song player values as dict."""
-        return {
-            'song_selected': self.selected_song,
-            'song_is_playing': self.is_playing,
-        }
+        """Get song player values as dict.
+
+        The same dict is refreshed and returned on every call; treat it as
+        a read-only snapshot and copy it if it must outlive the next call.
+        """
+        values = self._values_cache
+        values['song_selected'] = self.selected_song
+        values['song_is_playing'] = self._is_playing
+        return values
 
     def set_values(self, values: dict):
         """Set song player values from dict."""
-        if 'song_selected' in values:
-            self.selected_song = values['song_selected']
+        for key in _SETTABLE_KEYS & values.keys():
+            if key == 'song_selected':
+                self.selected_song = values[key]
@@ -5,9 +5,10 @@ styles - Dark theme configuration for the Mini Synthesizer GUI.
 Provides consistent colors, fonts, and styling for tkinter/ttk widgets.
 """
 
+import sys
 import tkinter as tk
 from tkinter import ttk
-from typing import Dict, Any
+from typing import Callable, Dict, Any, List, NamedTuple
 
 
 # Color Palette (Dark Theme)
@@ -72,255 +73,244 @@ DIMENSIONS: Dict[str, int] = {
 }
 
 
-def configure_dark_theme(root: tk.Tk) -> ttk.Style:
-    """
-    Configure the dark theme for the application.
-
-    Args:
-        root: The root tkinter window
-
-    Returns:
-        The configured ttk.Style object
-    """
-    style = ttk.Style(root)
-
-    # Try to use a theme that supports customization
-    try:
-        style.theme_use('clam')
-    except tk.TclError:
-        pass  # Fall back to default theme
-
-    # Configure general styles
-    style.configure(
-        '.',
-        background=COLORS['bg_dark'],
-        foreground=COLORS['fg_primary'],
-        font=FONTS['label']
-    )
+def _tcl_word(value: Any) -> str:
+    """Quote a Python option value as a single Tcl word."""
+    if isinstance(value, (tuple, list)):
+        return '{' + ' '.join(_tcl_word(v) for v in value) + '}'
+    text = str(value)
+    if not text or any(c in text for c in ' \t\n{}[]$";\\'):
+        return '{' + text + '}'
+    return text
+
+
+def _tcl_style_command(
+    command: str,
+    style_name: str,
+    options: Dict[str, Any]
+) -> str:
+    """Build one ``ttk::style configure|map`` line."""
+    parts = [f'ttk::style {command} {_tcl_word(style_name)}']
+    for option, value in options.items():
+        if command == 'map':
+            # [(state, value), ...] -> {state value state value}
+            value = [item for pair in value for item in pair]
+        parts.append(f'-{option} {_tcl_word(value)}')
+    return ' '.join(parts)
+
+
+# Style options applied by configure_dark_theme, built once at import
+_STYLE_SPEC = (
+    # General styles
+    ('.', {
+        'background': COLORS['bg_dark'],
+        'foreground': COLORS['fg_primary'],
+        'font': FONTS['label'],
+    }),
 
     # Frame styles
-    style.configure(
-        'Dark.TFrame',
-        background=COLORS['bg_dark']
-    )
-
-    style.configure(
-        'Panel.TFrame',
-        background=COLORS['bg_panel']
-    )
+    ('Dark.TFrame', {'background': COLORS['bg_dark']}),
+    ('Panel.TFrame', {'background': COLORS['bg_panel']}),
 
     # LabelFrame styles
-    style.configure(
-        'Dark.TLabelframe',
-        background=COLORS['bg_panel'],
-        foreground=COLORS['fg_primary'],
-        bordercolor=COLORS['border'],
-        lightcolor=COLORS['border'],
-        darkcolor=COLORS['border']
-    )
-
-    style.configure(
-        'Dark.TLabelframe.Label',
-        background=COLORS['bg_panel'],
-        foreground=COLORS['accent_primary'],
-        font=FONTS['title']
-    )
+    ('Dark.TLabelframe', {
+        'background': COLORS['bg_panel'],
+        'foreground': COLORS['fg_primary'],
+        'bordercolor': COLORS['border'],
+        'lightcolor': COLORS['border'],
+        'darkcolor': COLORS['border'],
+    }),
+    ('Dark.TLabelframe.Label', {
+        'background': COLORS['bg_panel'],
+        'foreground': COLORS['accent_primary'],
+        'font': FONTS['title'],
+    }),
 
     # Label styles
-    style.configure(
-        'Dark.TLabel',
-        background=COLORS['bg_dark'],
-        foreground=COLORS['fg_primary'],
-        font=FONTS['label']
-    )
-
-    style.configure(
-        'Title.TLabel',
-        background=COLORS['bg_dark'],
-        foreground=COLORS['accent_primary'],
-        font=FONTS['title']
-    )
-
-    style.configure(
-        'Value.TLabel',
-        background=COLORS['bg_dark'],
-        foreground=COLORS['fg_secondary'],
-        font=FONTS['value']
-    )
-
-    style.configure(
-        'Panel.TLabel',
-        background=COLORS['bg_panel'],
-        foreground=COLORS['fg_primary'],
-        font=FONTS['label']
-    )
+    ('Dark.TLabel', {
+        'background': COLORS['bg_dark'],
+        'foreground': COLORS['fg_primary'],
+        'font': FONTS['label'],
+    }),
+    ('Title.TLabel', {
+        'background': COLORS['bg_dark'],
+        'foreground': COLORS['accent_primary'],
+        'font': FONTS['title'],
+    }),
+    ('Value.TLabel', {
+        'background': COLORS['bg_dark'],
+        'foreground': COLORS['fg_secondary'],
+        'font': FONTS['value'],
+    }),
+    ('Panel.TLabel', {
+        'background': COLORS['bg_panel'],
+        'foreground': COLORS['fg_primary'],
+        'font': FONTS['label'],
+    }),
 
     # Button styles
-    style.configure(
-        'Dark.TButton',
-        background=COLORS['bg_widget'],
-        foreground=COLORS['fg_primary'],
-        bordercolor=COLORS['border'],
-        focuscolor=COLORS['accent_primary'],
-        font=FONTS['label'],
-        padding=(8, 4)
-    )
-
-    style.map(
-        'Dark.TButton',
-        background=[
-            ('active', COLORS['bg_panel']),
-            ('pressed', COLORS['accent_secondary'])
-        ],
-        foreground=[
-            ('active', COLORS['fg_primary'])
-        ]
-    )
-
-    style.configure(
-        'Accent.TButton',
-        background=COLORS['accent_primary'],
-        foreground='#ffffff',
-        bordercolor=COLORS['accent_secondary'],
-        focuscolor=COLORS['accent_hover'],
-        font=FONTS['label'],
-        padding=(8, 4)
-    )
-
-    style.map(
-        'Accent.TButton',
-        background=[
-            ('active', COLORS['accent_hover']),
-            ('pressed', COLORS['accent_secondary'])
-        ]
-    )
-
-    style.configure(
-        'Record.TButton',
-        background=COLORS['record'],
-        foreground='#ffffff',
-        bordercolor='#dc2626',
-        font=FONTS['label'],
-        padding=(8, 4)
-    )
-
-    style.map(
-        'Record.TButton',
-        background=[
-            ('active', '#dc2626'),
-            ('pressed', '#b91c1c')
-        ]
-    )
+    ('Dark.TButton', {
+        'background': COLORS['bg_widget'],
+        'foreground': COLORS['fg_primary'],
+        'bordercolor': COLORS['border'],
+        'focuscolor': COLORS['accent_primary'],
+        'font': FONTS['label'],
+        'padding': (8, 4),
+    }),
+    ('Accent.TButton', {
+        'background': COLORS['accent_primary'],
+        'foreground': '#ffffff',
+        'bordercolor': COLORS['accent_secondary'],
+        'focuscolor': COLORS['accent_hover'],
+        'font': FONTS['label'],
+        'padding': (8, 4),
+    }),
+    ('Record.TButton', {
+        'background': COLORS['record'],
+        'foreground': '#ffffff',
+        'bordercolor': '#dc2626',
+        'font': FONTS['label'],
+        'padding': (8, 4),
+    }),
 
     # Scale (slider) styles
-    style.configure(
-        'Dark.Horizontal.TScale',
-        background=COLORS['bg_dark'],
-        troughcolor=COLORS['bg_input'],
-        sliderrelief='flat'
-    )
-
-    style.configure(
-        'Dark.Vertical.TScale',
-        background=COLORS['bg_dark'],
-        troughcolor=COLORS['bg_input'],
-        sliderrelief='flat'
-    )
+    ('Dark.Horizontal.TScale', {
+        'background': COLORS['bg_dark'],
+        'troughcolor': COLORS['bg_input'],
+        'sliderrelief': 'flat',
+    }),
+    ('Dark.Vertical.TScale', {
+        'background': COLORS['bg_dark'],
+        'troughcolor': COLORS['bg_input'],
+        'sliderrelief': 'flat',
+    }),
 
     # Combobox styles
-    style.configure(
-        'Dark.TCombobox',
-        background=COLORS['bg_input'],
-        foreground=COLORS['fg_primary'],
-        fieldbackground=COLORS['bg_input'],
-        selectbackground=COLORS['accent_primary'],
-        selectforeground='#ffffff',
-        arrowcolor=COLORS['fg_primary']
-    )
-
-    style.map(
-        'Dark.TCombobox',
-        fieldbackground=[('readonly', COLORS['bg_input'])],
-        selectbackground=[('readonly', COLORS['accent_primary'])]
-    )
+    ('Dark.TCombobox', {
+        'background': COLORS['bg_input'],
+        'foreground': COLORS['fg_primary'],
+        'fieldbackground': COLORS['bg_input'],
+        'selectbackground': COLORS['accent_primary'],
+        'selectforeground': '#ffffff',
+        'arrowcolor': COLORS['fg_primary'],
+    }),
 
     # Radiobutton styles
-    style.configure(
-        'Dark.TRadiobutton',
-        background=COLORS['bg_dark'],
-        foreground=COLORS['fg_primary'],
-        font=FONTS['small']
-    )
-
-    style.map(
-        'Dark.TRadiobutton',
-        background=[
-            ('active', COLORS['bg_panel'])
-        ]
-    )
+    ('Dark.TRadiobutton', {
+        'background': COLORS['bg_dark'],
+        'foreground': COLORS['fg_primary'],
+        'font': FONTS['small'],
+    }),
 
     # Checkbutton styles
-    style.configure(
-        'Dark.TCheckbutton',
-        background=COLORS['bg_dark'],
-        foreground=COLORS['fg_primary'],
-        font=FONTS['label']
-    )
-
-    style.map(
-        'Dark.TCheckbutton',
-        background=[
-            ('active', COLORS['bg_panel'])
-        ]
-    )
+    ('Dark.TCheckbutton', {
+        'background': COLORS['bg_dark'],
+        'foreground': COLORS['fg_primary'],
+        'font': FONTS['label'],
+    }),
 
     # Spinbox styles
-    style.configure(
-        'Dark.TSpinbox',
-        background=COLORS['bg_input'],
-        foreground=COLORS['fg_primary'],
-        fieldbackground=COLORS['bg_input'],
-        arrowcolor=COLORS['fg_primary']
-    )
+    ('Dark.TSpinbox', {
+        'background': COLORS['bg_input'],
+        'foreground': COLORS['fg_primary'],
+        'fieldbackground': COLORS['bg_input'],
+        'arrowcolor': COLORS['fg_primary'],
+    }),
 
     # Separator styles
-    style.configure(
-        'Dark.TSeparator',
-        background=COLORS['border']
-    )
+    ('Dark.TSeparator', {'background': COLORS['border']}),
 
     # Notebook (tab) styles
-    style.configure(
-        'Dark.TNotebook',
-        background=COLORS['bg_dark'],
-        bordercolor=COLORS['border']
-    )
+    ('Dark.TNotebook', {
+        'background': COLORS['bg_dark'],
+        'bordercolor': COLORS['border'],
+    }),
+    ('Dark.TNotebook.Tab', {
+        'background': COLORS['bg_panel'],
+        'foreground': COLORS['fg_primary'],
+        'padding': (12, 4),
+        'font': FONTS['label'],
+    }),
 
-    style.configure(
-        'Dark.TNotebook.Tab',
-        background=COLORS['bg_panel'],
-        foreground=COLORS['fg_primary'],
-        padding=(12, 4),
-        font=FONTS['label']
-    )
-
-    style.map(
-        'Dark.TNotebook.Tab',
-        background=[
+    # Progressbar styles
+    ('Dark.Horizontal.TProgressbar', {
+        'background': COLORS['accent_primary'],
+        'troughcolor': COLORS['bg_input'],
+    }),
+)
+
+# State-dependent style options (ttk::style map)
+_STYLE_MAP_SPEC = (
+    ('Dark.TButton', {
+        'background': [
+            ('active', COLORS['bg_panel']),
+            ('pressed', COLORS['accent_secondary'])
+        ],
+        'foreground': [
+            ('active', COLORS['fg_primary'])
+        ],
+    }),
+    ('Accent.TButton', {
+        'background': [
+            ('active', COLORS['accent_hover']),
+            ('pressed', COLORS['accent_secondary'])
+        ],
+    }),
+    ('Record.TButton', {
+        'background': [
+            ('active', '#dc2626'),
+            ('pressed', '#b91c1c')
+        ],
+    }),
+    ('Dark.TCombobox', {
+        'fieldbackground': [('readonly', COLORS['bg_input'])],
+        'selectbackground': [('readonly', COLORS['accent_primary'])],
+    }),
+    ('Dark.TRadiobutton', {
+        'background': [('active', COLORS['bg_panel'])],
+    }),
+    ('Dark.TCheckbutton', {
+        'background': [('active', COLORS['bg_panel'])],
+    }),
+    ('Dark.TNotebook.Tab', {
+        'background': [
             ('selected', COLORS['bg_dark']),
             ('active', COLORS['bg_widget'])
         ],
-        foreground=[
+        'foreground': [
             ('selected', COLORS['accent_primary'])
-        ]
-    )
+        ],
+    }),
+)
 
-    # Progressbar styles
-    style.configure(
-        'Dark.Horizontal.TProgressbar',
-        background=COLORS['accent_primary'],
-        troughcolor=COLORS['bg_input']
-    )
+# The whole theme as one Tcl script
+_THEME_SCRIPT = '\n'.join(
+    [_tcl_style_command('configure', name, opts) for name, opts in _STYLE_SPEC]
+    + [_tcl_style_command('map', name, opts) for name, opts in _STYLE_MAP_SPEC]
+)
+
+
+def configure_dark_theme(root: tk.Tk) -> ttk.Style:
+    """
+    Configure the dark theme for the application.
+
+    All style definitions are sent to Tcl as one script rather than one
+    style.configure()/style.map() round-trip each.
+
+    Args:
+        root: The root tkinter window
+
+    Returns:
+        The configured ttk.Style object
+    """
+    style = ttk.Style(root)
+
+    # Try to use a theme that supports customization
+    try:
+        style.theme_use('clam')
+    except tk.TclError:
+        pass  # Fall back to default theme
+
+    root.tk.eval(_THEME_SCRIPT)
 
     return style
 
@@ -425,31 +415,159 @@ def create_slider_with_label(
     return container, label, slider, value_label
 
 
-class ColorScheme:
-    """Convenience class for accessing color values."""
+class _ColorScheme(NamedTuple):
+    """Immutable named access to the theme colors."""
+
+    bg_dark: str
+    bg_panel: str
+    bg_widget: str
+    bg_input: str
+
+    fg_primary: str
+    fg_secondary: str
+    fg_muted: str
+
+    accent: str
+    accent_hover: str
+
+    success: str
+    warning: str
+    error: str
+    record: str
 
-    bg_dark = COLORS['bg_dark']
-    bg_panel = COLORS['bg_panel']
-    bg_widget = COLORS['bg_widget']
-    bg_input = COLORS['bg_input']
+    key_white: str
+    key_black: str
+    key_pressed: str
 
-    fg_primary = COLORS['fg_primary']
-    fg_secondary = COLORS['fg_secondary']
-    fg_muted = COLORS['fg_muted']
+    waveform: str
+    filter_curve: str
+    grid: str
+    border: str
 
-    accent = COLORS['accent_primary']
-    accent_hover = COLORS['accent_hover']
 
-    success = COLORS['success']
-    warning = COLORS['warning']
-    error = COLORS['error']
-    record = COLORS['record']
+# Convenience singleton for accessing color values (ColorScheme.success, ...)
+ColorScheme = _ColorScheme(**{
+    field: sys.intern(COLORS['accent_primary' if field == 'accent' else field])
+    for field in _ColorScheme._fields
+})
 
-    key_white = COLORS['key_white']
-    key_black = COLORS['key_black']
-    key_pressed = COLORS['key_pressed']
 
-    waveform = COLORS['waveform']
-    filter_curve = COLORS['filter_curve']
-    grid = COLORS['grid']
-    border = COLORS['border']
+def level_meter_color(level: float) -> str:
+    """
+    Default color policy for level meters.
+
+    Args:
+        level: Peak level (0.0-1.0)
+
+    Returns:
+        Red when clipping, yellow when hot, green otherwise
+    """
+    if level > 0.9:
+        return ColorScheme.error
+    if level > 0.7:
+        return ColorScheme.warning
+    return ColorScheme.success
+
+
+class MeterService:
+    """Shared canvas host for horizontal level meters.
+
+    Each registered meter is a single line item on one canvas, so several
+    panels can draw their bars without each owning a dedicated tk.Canvas.
+
+    Usage:
+        meters = MeterService(parent)
+        meters.canvas.pack(fill='x')
+        meters.register('rec_level')
+        meters.update('rec_level', 0.5)
+        meters.unregister('rec_level')
+    """
+
+    def __init__(
+        self,
+        parent: tk.Widget,
+        width: int = 200,
+        height: int = 16,
+        **kwargs
+    ):
+        """
+        Initialize meter service.
+
+        Args:
+            parent: Parent widget for the shared canvas
+            width: Canvas width in pixels
+            height: Canvas height in pixels
+        """
+        self.canvas = tk.Canvas(
+            parent,
+            width=width,
+            height=height,
+            bg=ColorScheme.bg_input,
+            highlightthickness=1,
+            highlightbackground=ColorScheme.border,
+            **kwargs
+        )
+        # name -> [item_id, y, color_policy, current_color]
+        self._meters: Dict[str, List[Any]] = {}
+
+    def register(
+        self,
+        name: str,
+        y: int = 8,
+        thickness: int = 12,
+        color_policy: Callable[[float], str] = level_meter_color
+    ) -> int:
+        """
+        Add a meter bar to the shared canvas.
+
+        Args:
+            name: Unique meter name
+            y: Vertical center of the bar in pixels
+            thickness: Bar thickness in pixels
+            color_policy: Maps a level (0.0-1.0) to a fill color
+
+        Returns:
+            Canvas item id of the meter bar
+        """
+        color = color_policy(0.0)
+        item = self.canvas.create_line(
+            2, y, 2, y,
+            width=thickness,
+            fill=color,
+            capstyle='butt'
+        )
+        self._meters[name] = [item, y, color_policy, color]
+        return item
+
+    def update(self, name: str, level: float):
+        """
+        Redraw a meter bar for a new level.
+
+        Args:
+            name: Meter name passed to register()
+            level: Level (0.0-1.0)
+        """
+        meter = self._meters[name]
+        item, y, color_policy, current_color = meter
+
+        meter_width = self.canvas.winfo_width() - 4
+        bar_width = max(0, min(meter_width, int(level * meter_width)))
+        self.canvas.coords(item, 2, y, 2 + bar_width, y)
+
+        color = color_policy(level)
+        if color != current_color:
+            self.canvas.itemconfig(item, fill=color)
+            meter[3] = color
+
+    def unregister(self, name: str):
+        """
+        Remove a meter bar from the shared canvas.
+
+        Unknown names are ignored.
+
+        Args:
+            name: Meter name passed to register()
+        """
+        meter = self._meters.pop(name, None)
+        if meter is not None:
+            self.canvas.delete(meter[0])
@@ -11,29 +11,165 @@ Usage:
     python main.py
 """
 
+from __future__ import annotations
+
 import sys
 import os
-import argparse
-from typing import Optional
+import threading
+from collections import deque
+from collections.abc import Callable
+from functools import partial
+from types import SimpleNamespace
 
-# Add src to path for imports
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+# Source directory and default presets path (project root is parent of src/)
+_SRC_DIR = os.path.dirname(os.path.abspath(__file__))
+_DEFAULT_PRESETS_DIR = os.path.join(os.path.dirname(_SRC_DIR), 'presets')
 
-from app_controller import AppController
-from gui import MainWindow
+# Add src to path for imports, unless it is already importable (e.g. when
+# run as 'python main.py', where it is sys.path[0])
+if _SRC_DIR not in sys.path:
+    sys.path.insert(0, _SRC_DIR)
 
 
-def parse_args() -> argparse.Namespace:
-    """Parse command line arguments."""
-    parser = argparse.ArgumentParser(
-        description='KarokeLite Mini Synthesizer',
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
+_EPILOG = """
 Examples:
     python main.py                    # Run with defaults
     python main.py --buffer 256       # Lower latency
     python main.py --voices 4         # Limit polyphony
         """
+
+# Pre-rendered --help output, printed without building the ArgumentParser.
+# Keep in sync with the arguments added in parse_args().
+_HELP_TEXT = """\
+usage: {prog} [-h] [--sample-rate SAMPLE_RATE] [--buffer BUFFER]
+               [--voices VOICES] [--presets-dir PRESETS_DIR] [--no-audio]
+
+KarokeLite Mini Synthesizer
+
+options:
+  -h, --help            show this help message and exit
+  --sample-rate SAMPLE_RATE, -s SAMPLE_RATE
+                        Audio sample rate in Hz (default: 44100)
+  --buffer BUFFER, -b BUFFER
+                        Audio buffer size in samples (default: 512)
+  --voices VOICES, -v VOICES
+                        Maximum polyphony (default: 8)
+  --presets-dir PRESETS_DIR, -p PRESETS_DIR
+                        Directory for preset files (default:
+                        {presets_dir})
+  --no-audio            Run without audio (for testing GUI)
+""" + _EPILOG
+
+
+# MainWindow callbacks that only forward their arguments to an AppController
+# setter: callback name -> (controller method, status format or None)
+_CONTROLLER_CALLBACKS = {
+    # BOLT-007: Metronome
+    'on_metronome_bpm_change': ('set_metronome_bpm', None),
+    'on_metronome_time_sig_change': ('set_metronome_time_signature', None),
+    'on_metronome_volume_change': ('set_metronome_volume', None),
+    # BOLT-008: Reverb
+    'on_reverb_wet_dry': ('set_reverb_wet_dry', None),
+    'on_reverb_room_size': ('set_reverb_room_size', None),
+    # BOLT-009: Delay
+    'on_delay_time': ('set_delay_time', None),
+    'on_delay_feedback': ('set_delay_feedback', None),
+    'on_delay_wet_dry': ('set_delay_wet_dry', None),
+    # BOLT-009: Chorus
+    'on_chorus_rate': ('set_chorus_rate', None),
+    'on_chorus_depth': ('set_chorus_depth', None),
+    'on_chorus_voices': ('set_chorus_voices', None),
+    'on_chorus_wet_dry': ('set_chorus_wet_dry', None),
+    # BOLT-009: Distortion
+    'on_distortion_drive': ('set_distortion_drive', None),
+    'on_distortion_tone': ('set_distortion_tone', None),
+    'on_distortion_mode': ('set_distortion_mode', "Distortion mode: {}"),
+    'on_distortion_mix': ('set_distortion_mix', None),
+    # BOLT-010: Flanger
+    'on_flanger_rate': ('set_flanger_rate', None),
+    'on_flanger_depth': ('set_flanger_depth', None),
+    'on_flanger_feedback': ('set_flanger_feedback', None),
+    'on_flanger_wet_dry': ('set_flanger_wet_dry', None),
+}
+
+
+# Options understood by the fast argv parser: flag -> (dest, converter)
+_VALUE_OPTIONS = {
+    '--sample-rate': ('sample_rate', int),
+    '-s': ('sample_rate', int),
+    '--buffer': ('buffer', int),
+    '-b': ('buffer', int),
+    '--voices': ('voices', int),
+    '-v': ('voices', int),
+    '--presets-dir': ('presets_dir', str),
+    '-p': ('presets_dir', str),
+}
+
+
+def _parse_simple_args(argv: list[str]) -> SimpleNamespace | None:
+    """Parse the plain '--option value' forms without argparse.
+
+    Args:
+        argv: Command line arguments (without the program name)
+
+    Returns:
+        Parsed arguments, or None if argv needs the full parser (help,
+        errors, '--opt=value', abbreviations, ...)
+    """
+    values = {
+        'sample_rate': 44100,
+        'buffer': 512,
+        'voices': 8,
+        'presets_dir': _DEFAULT_PRESETS_DIR,
+        'no_audio': False,
+    }
+
+    i = 0
+    while i < len(argv):
+        arg = argv[i]
+        if arg == '--no-audio':
+            values['no_audio'] = True
+            i += 1
+            continue
+
+        option = _VALUE_OPTIONS.get(arg)
+        if option is None or i + 1 >= len(argv) or argv[i + 1].startswith('-'):
+            return None
+        dest, convert = option
+        try:
+            values[dest] = convert(argv[i + 1])
+        except ValueError:
+            return None
+        i += 2
+
+    return SimpleNamespace(**values)
+
+
+def parse_args(argv: list[str] | None = None):
+    """Parse command line arguments.
+
+    Common invocations are parsed directly; argparse is only imported for
+    help output, errors and less common option spellings.
+
+    Args:
+        argv: Arguments to parse (default: sys.argv[1:])
+
+    Returns:
+        Namespace with sample_rate, buffer, voices, presets_dir, no_audio
+    """
+    if argv is None:
+        argv = sys.argv[1:]
+
+    args = _parse_simple_args(argv)
+    if args is not None:
+        return args
+
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description='KarokeLite Mini Synthesizer',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=_EPILOG
     )
 
     parser.add_argument(
@@ -57,16 +193,11 @@ Examples:
         help='Maximum polyphony (default: 8)'
     )
 
-    # Calculate default presets path relative to project root (parent of src/)
-    src_dir = os.path.dirname(os.path.abspath(__file__))
-    project_root = os.path.dirname(src_dir)
-    default_presets_dir = os.path.join(project_root, 'presets')
-
     parser.add_argument(
         '--presets-dir', '-p',
         type=str,
-        default=default_presets_dir,
-        help=f'Directory for preset files (default: {default_presets_dir})'
+        default=_DEFAULT_PRESETS_DIR,
+        help=f'Directory for preset files (default: {_DEFAULT_PRESETS_DIR})'
     )
 
     parser.add_argument(
@@ -75,16 +206,15 @@ Examples:
         help='Run without audio (for testing GUI)'
     )
 
-    return parser.parse_args()
+    return parser.parse_args(argv)
 
 
 class Application:
     """Main application class coordinating all components."""
 
     # Update intervals (milliseconds)
-    VOICE_UPDATE_INTERVAL = 100      # Voice count update
-    VISUALIZATION_UPDATE_INTERVAL = 33  # ~30 FPS for visualization
-    RECORDING_UPDATE_INTERVAL = 100   # Recording time/level update
+    TICK_INTERVAL = 33               # ~30 FPS for visualization
+    STATUS_TICK_DIVISOR = 3          # Voice/recording status every ~100 ms
     SONG_PLAYER_UPDATE_INTERVAL = 100  # Song progress update
 
     def __init__(
@@ -107,21 +237,78 @@ class Application:
         """
         self._no_audio = no_audio
         self._sample_rate = sample_rate
+        self._buffer_size = buffer_size
+        self._max_voices = max_voices
+        self._presets_dir = presets_dir
+
+        # Controller and window are built by run()
+        self._controller = None
+        self._window = None
+        self._audio_error: Exception | None = None
+
+        # Latest status message not yet shown (see _set_status)
+        self._pending_status: str | None = None
+
+        # GUI calls posted from audio/song threads as (func, args); drained
+        # by _tick. deque append/popleft are thread-safe.
+        self._gui_queue = deque()
+
+        # Update tick counter and last values pushed to the status widgets
+        self._tick_count = 0
+        self._last_voice_count = None
+        self._last_rec_duration = None
+        self._last_rec_peak = None
+        self._last_rec_state = None
+        self._last_rec_has_data = None
+        self._last_rec_can_undo = None
 
         # Track filter values for visualization
         self._current_filter_cutoff = 2000.0
         self._current_filter_resonance = 0.3
 
+    def _build_controller(self):
+        """Create the app controller and register its callbacks."""
+        # Imported here so --help and argument errors exit before numpy,
+        # sounddevice and the effects chain are loaded
+        from app_controller import AppController
+
         # Create controller
         self._controller = AppController(
-            sample_rate=sample_rate,
-            buffer_size=buffer_size,
-            max_voices=max_voices,
-            presets_dir=presets_dir
+            sample_rate=self._sample_rate,
+            buffer_size=self._buffer_size,
+            max_voices=self._max_voices,
+            presets_dir=self._presets_dir
+        )
+
+        # Set up voice count callback
+        self._controller.set_voice_change_callback(self._on_voice_change)
+
+        # BOLT-007: Set up metronome beat callback
+        self._controller.set_metronome_beat_callback(self._on_metronome_beat)
+
+        # BOLT-008: Set up song player callbacks
+        self._controller.set_song_callbacks(
+            on_note_on=self._on_song_note_on,
+            on_note_off=self._on_song_note_off,
+            on_progress=self._on_song_progress,
+            on_complete=self._on_song_complete
         )
 
+    def _build_window(self):
+        """Create the main window and start periodic updates."""
+        from gui import MainWindow
+
+        # Pass-through callbacks, bound to the controller setters once
+        forwarding_callbacks = {
+            name: partial(
+                self._forward, getattr(self._controller, method), status_format
+            )
+            for name, (method, status_format) in _CONTROLLER_CALLBACKS.items()
+        }
+
         # Create main window with callbacks
         self._window = MainWindow(
+            **forwarding_callbacks,
             on_note_on=self._on_note_on,
             on_note_off=self._on_note_off,
             on_parameter_change=self._on_parameter_change,
@@ -131,9 +318,6 @@ class Application:
             # BOLT-007: Metronome callbacks
             on_metronome_start=self._on_metronome_start,
             on_metronome_stop=self._on_metronome_stop,
-            on_metronome_bpm_change=self._on_metronome_bpm_change,
-            on_metronome_time_sig_change=self._on_metronome_time_sig_change,
-            on_metronome_volume_change=self._on_metronome_volume_change,
             # BOLT-007: Recording callbacks
             on_record_start=self._on_record_start,
             on_record_stop=self._on_record_stop,
@@ -145,8 +329,6 @@ class Application:
             on_record_undo=self._on_record_undo,
             # BOLT-008: Reverb callbacks
             on_reverb_enable=self._on_reverb_enable,
-            on_reverb_wet_dry=self._on_reverb_wet_dry,
-            on_reverb_room_size=self._on_reverb_room_size,
             # BOLT-008: Song player callbacks
             on_song_play=self._on_song_play,
             on_song_stop=self._on_song_stop,
@@ -154,42 +336,13 @@ class Application:
             on_song_select=self._on_song_select,
             # BOLT-009: Delay callbacks
             on_delay_enable=self._on_delay_enable,
-            on_delay_time=self._on_delay_time,
-            on_delay_feedback=self._on_delay_feedback,
-            on_delay_wet_dry=self._on_delay_wet_dry,
             # BOLT-009: Chorus callbacks
             on_chorus_enable=self._on_chorus_enable,
-            on_chorus_rate=self._on_chorus_rate,
-            on_chorus_depth=self._on_chorus_depth,
-            on_chorus_voices=self._on_chorus_voices,
-            on_chorus_wet_dry=self._on_chorus_wet_dry,
             # BOLT-009: Distortion callbacks
             on_distortion_enable=self._on_distortion_enable,
-            on_distortion_drive=self._on_distortion_drive,
-            on_distortion_tone=self._on_distortion_tone,
-            on_distortion_mode=self._on_distortion_mode,
-            on_distortion_mix=self._on_distortion_mix,
             # BOLT-010: Flanger callbacks
             on_flanger_enable=self._on_flanger_enable,
-            on_flanger_rate=self._on_flanger_rate,
-            on_flanger_depth=self._on_flanger_depth,
-            on_flanger_feedback=self._on_flanger_feedback,
-            on_flanger_wet_dry=self._on_flanger_wet_dry,
-            sample_rate=sample_rate
-        )
-
-        # Set up voice count callback
-        self._controller.set_voice_change_callback(self._on_voice_change)
-
-        # BOLT-007: Set up metronome beat callback
-        self._controller.set_metronome_beat_callback(self._on_metronome_beat)
-
-        # BOLT-008: Set up song player callbacks
-        self._controller.set_song_callbacks(
-            on_note_on=self._on_song_note_on,
-            on_note_off=self._on_song_note_off,
-            on_progress=self._on_song_progress,
-            on_complete=self._on_song_complete
+            sample_rate=self._sample_rate
         )
 
         # BOLT-008: Initialize song list
@@ -198,10 +351,17 @@ class Application:
         # Schedule periodic updates
         self._schedule_updates()
 
+    def _start_audio(self):
+        """Start the audio engine, recording any failure for run()."""
+        try:
+            self._controller.start()
+        except Exception as e:
+            self._audio_error = e
+
     def _on_note_on(self, note: int, velocity: int):
         """Handle note on event from GUI."""
         self._controller.note_on(note, velocity)
-        self._window.set_status(f"Note on: {note} vel={velocity}")
+        self._set_status(f"Note on: {note} vel={velocity}")
 
     def _on_note_off(self, note: int):
         """Handle note off event from GUI."""
@@ -231,22 +391,42 @@ class Application:
         if params:
             # Update GUI controls to reflect preset values
             self._window.set_all_parameters(params)
-            self._window.set_status(f"Loaded preset: {name}")
+            self._set_status(f"Loaded preset: {name}")
         else:
-            self._window.set_status(f"Failed to load preset: {name}")
+            self._set_status(f"Failed to load preset: {name}")
 
     def _on_preset_save(self):
         """Handle preset save request."""
         # For now, just save with current name
         name = self._controller.current_preset_name
         if self._controller.save_preset(name):
-            self._window.set_status(f"Saved preset: {name}")
+            self._set_status(f"Saved preset: {name}")
         else:
-            self._window.set_status(f"Failed to save preset")
+            self._set_status(f"Failed to save preset")
+
+    def _forward(self, setter: Callable, status_format: str | None, *args):
+        """Forward a GUI callback to a controller setter.
+
+        Args:
+            setter: Bound AppController method
+            status_format: Status message format for the args, or None
+            *args: Callback arguments
+        """
+        setter(*args)
+        if status_format is not None:
+            self._set_status(status_format.format(*args))
+
+    def _set_status(self, message: str):
+        """Set the status message shown at the next tick.
+
+        Only the latest message per tick reaches the status bar. Safe to
+        call from any thread.
+        """
+        self._pending_status = message
 
     def _on_voice_change(self, active_voices: int):
         """Handle voice count change."""
-        self._window.update_voice_count(active_voices, self._controller.max_voices)
+        self._publish_voice_count(active_voices)
 
     def _on_quit(self):
         """Handle application quit."""
@@ -254,39 +434,9 @@ class Application:
 
     def _schedule_updates(self):
         """Schedule periodic GUI updates."""
-        # Voice count update loop
-        def update_voices():
-            count = self._controller.get_active_voice_count()
-            self._window.update_voice_count(count, self._controller.max_voices)
-            self._window.after(self.VOICE_UPDATE_INTERVAL, update_voices)
-
-        # BOLT-007: Visualization update loop (~30 FPS)
-        def update_visualization():
-            if not self._no_audio:
-                # Get display buffer and update waveform
-                buffer = self._controller.get_display_buffer()
-                self._window.update_waveform(buffer)
-            self._window.after(self.VISUALIZATION_UPDATE_INTERVAL, update_visualization)
-
-        # BOLT-007: Recording status update loop
-        def update_recording():
-            if self._controller.is_recording:
-                # Update duration
-                duration = self._controller.get_recording_duration()
-                self._window.update_recording_duration(duration)
-                # Update level
-                peak = self._controller.get_recording_peak_level()
-                self._window.update_recording_level(peak)
-            # Update state
-            self._window.update_recording_state(self._controller.recording_state)
-            self._window.set_recording_has_data(self._controller.recording_has_data)
-            self._window.set_recording_can_undo(self._controller.recording_can_undo)
-            self._window.after(self.RECORDING_UPDATE_INTERVAL, update_recording)
-
-        # Start all update loops
-        self._window.after(self.VOICE_UPDATE_INTERVAL, update_voices)
-        self._window.after(self.VISUALIZATION_UPDATE_INTERVAL, update_visualization)
-        self._window.after(self.RECORDING_UPDATE_INTERVAL, update_recording)
+        # One timer drives visualization every tick and the voice/recording
+        # status every STATUS_TICK_DIVISOR ticks
+        self._window.after(self.TICK_INTERVAL, self._tick)
 
         # Initialize filter display
         self._window.update_filter_display(
@@ -294,88 +444,143 @@ class Application:
             self._current_filter_resonance
         )
 
+    def _tick(self):
+        """Run one GUI update tick and re-arm the timer."""
+        # Dispatch GUI calls queued by other threads since the last tick
+        queue = self._gui_queue
+        while queue:
+            func, args = queue.popleft()
+            func(*args)
+
+        status = self._pending_status
+        if status is not None:
+            self._pending_status = None
+            self._window.set_status(status)
+
+        # BOLT-007: Visualization update (~30 FPS), skipped while the
+        # waveform is off screen
+        if not self._no_audio and self._window.is_waveform_visible():
+            buffer = self._controller.get_display_buffer()
+            self._window.update_waveform(buffer)
+
+        self._tick_count += 1
+        if self._tick_count >= self.STATUS_TICK_DIVISOR:
+            self._tick_count = 0
+            self._update_status()
+
+        self._window.after(self.TICK_INTERVAL, self._tick)
+
+    def _update_status(self):
+        """Push voice and recording status, touching only changed widgets."""
+        self._publish_voice_count(self._controller.get_active_voice_count())
+
+        # BOLT-007: Recording status
+        controller = self._controller
+        if controller.is_recording:
+            duration = controller.get_recording_duration()
+            if duration != self._last_rec_duration:
+                self._last_rec_duration = duration
+                self._window.update_recording_duration(duration)
+            peak = controller.get_recording_peak_level()
+            if peak != self._last_rec_peak:
+                self._last_rec_peak = peak
+                self._window.update_recording_level(peak)
+
+        state = controller.recording_state
+        if state != self._last_rec_state:
+            self._last_rec_state = state
+            self._window.update_recording_state(state)
+
+        has_data = controller.recording_has_data
+        if has_data != self._last_rec_has_data:
+            self._last_rec_has_data = has_data
+            self._window.set_recording_has_data(has_data)
+
+        can_undo = controller.recording_can_undo
+        if can_undo != self._last_rec_can_undo:
+            self._last_rec_can_undo = can_undo
+            self._window.set_recording_can_undo(can_undo)
+
+    def _publish_voice_count(self, active_voices: int):
+        """Show the active voice count if it changed."""
+        if active_voices != self._last_voice_count:
+            self._last_voice_count = active_voices
+            self._window.update_voice_count(active_voices, self._controller.max_voices)
+
     # BOLT-007: Metronome callback handlers
 
     def _on_metronome_start(self):
         """Handle metronome start."""
         self._controller.start_metronome()
-        self._window.set_status("Metronome started")
+        self._set_status("Metronome started")
 
     def _on_metronome_stop(self):
         """Handle metronome stop."""
         self._controller.stop_metronome()
-        self._window.set_status("Metronome stopped")
-
-    def _on_metronome_bpm_change(self, bpm: float):
-        """Handle BPM change."""
-        self._controller.set_metronome_bpm(bpm)
-
-    def _on_metronome_time_sig_change(self, numerator: int, denominator: int):
-        """Handle time signature change."""
-        self._controller.set_metronome_time_signature(numerator, denominator)
-
-    def _on_metronome_volume_change(self, volume: float):
-        """Handle metronome volume change."""
-        self._controller.set_metronome_volume(volume)
+        self._set_status("Metronome stopped")
 
     def _on_metronome_beat(self, beat: int, is_downbeat: bool):
         """Handle metronome beat event (called from audio thread)."""
-        # Schedule GUI update on main thread
-        self._window.after(0, lambda: self._window.update_metronome_beat(beat, is_downbeat))
+        # Queue GUI update for the main thread
+        self._gui_queue.append(
+            (self._window.update_metronome_beat, (beat, is_downbeat))
+        )
 
     # BOLT-007: Recording callback handlers
 
     def _on_record_start(self):
         """Handle record start."""
         self._controller.start_recording()
-        self._window.set_status("Recording started")
+        self._set_status("Recording started")
 
     def _on_record_stop(self):
         """Handle record stop."""
         self._controller.stop_recording()
         duration = self._controller.get_recording_duration()
-        self._window.set_status(f"Recording stopped ({duration:.1f}s)")
+        self._set_status(f"Recording stopped ({duration:.1f}s)")
 
     def _on_record_pause(self):
         """Handle record pause."""
         self._controller.pause_recording()
-        self._window.set_status("Recording paused")
+        self._set_status("Recording paused")
 
     def _on_record_resume(self):
         """Handle record resume."""
         self._controller.resume_recording()
-        self._window.set_status("Recording resumed")
+        self._set_status("Recording resumed")
 
     def _on_record_arm(self):
         """Handle record arm."""
         self._controller.arm_recording()
-        self._window.set_status("Recording armed - waiting for input")
+        self._set_status("Recording armed - waiting for input")
 
     def _on_record_export(self, filepath: str):
-        """Handle export request."""
-        self._window.set_status(f"Exporting to {filepath}...")
+        """Handle export request (called from the recording panel's I/O worker)."""
+        # Status is published by the tick loop; other GUI calls are queued
+        self._set_status(f"Exporting to {filepath}...")
         if self._controller.export_wav(filepath):
             info = self._controller.get_export_info()
-            self._window.set_status(
-                f"Exported: {info.get('duration_formatted', '')} ({info.get('estimated_size_formatted', '')})"
-            )
-            self._window.set_recording_info(
-                f"{info.get('duration_formatted', '')} - {info.get('estimated_size_formatted', '')}"
-            )
+            duration = info.get('duration_formatted', '')
+            size = info.get('estimated_size_formatted', '')
+            self._set_status(f"Exported: {duration} ({size})")
+            self._gui_queue.append((
+                self._window.set_recording_info,
+                (f"{duration} - {size}",)
+            ))
         else:
-            self._window.set_status("Export failed - no recording data")
+            self._set_status("Export failed - no recording data")
 
     def _on_record_clear(self):
         """Handle clear recording."""
         self._controller.clear_recording()
-        self._window.set_status("Recording cleared")
+        self._set_status("Recording cleared")
 
     def _on_record_undo(self):
         """Handle undo recording."""
         if self._controller.undo_recording():
-            self._window.set_status("Recording restored")
+            self._set_status("Recording restored")
         else:
-            self._window.set_status("Nothing to undo")
+            self._set_status("Nothing to undo")
 
     # BOLT-008: Reverb callback handlers
 
@@ -383,15 +588,7 @@ class Application:
         """Handle reverb enable/disable."""
         self._controller.set_reverb_enabled(enabled)
         status = "enabled" if enabled else "disabled"
-        self._window.set_status(f"Reverb {status}")
-
-    def _on_reverb_wet_dry(self, mix: float):
-        """Handle reverb wet/dry change."""
-        self._controller.set_reverb_wet_dry(mix)
-
-    def _on_reverb_room_size(self, size: float):
-        """Handle reverb room size change."""
-        self._controller.set_reverb_room_size(size)
+        self._set_status(f"Reverb {status}")
 
     # BOLT-009: Delay callback handlers
 
@@ -399,19 +596,7 @@ class Application:
         """Handle delay enable/disable."""
         self._controller.set_delay_enabled(enabled)
         status = "enabled" if enabled else "disabled"
-        self._window.set_status(f"Delay {status}")
-
-    def _on_delay_time(self, time_ms: float):
-        """Handle delay time change."""
-        self._controller.set_delay_time(time_ms)
-
-    def _on_delay_feedback(self, feedback: float):
-        """Handle delay feedback change."""
-        self._controller.set_delay_feedback(feedback)
-
-    def _on_delay_wet_dry(self, mix: float):
-        """Handle delay wet/dry change."""
-        self._controller.set_delay_wet_dry(mix)
+        self._set_status(f"Delay {status}")
 
     # BOLT-009: Chorus callback handlers
 
@@ -419,23 +604,7 @@ class Application:
         """Handle chorus enable/disable."""
         self._controller.set_chorus_enabled(enabled)
         status = "enabled" if enabled else "disabled"
-        self._window.set_status(f"Chorus {status}")
-
-    def _on_chorus_rate(self, rate: float):
-        """Handle chorus rate change."""
-        self._controller.set_chorus_rate(rate)
-
-    def _on_chorus_depth(self, depth: float):
-        """Handle chorus depth change."""
-        self._controller.set_chorus_depth(depth)
-
-    def _on_chorus_voices(self, voices: int):
-        """Handle chorus voices change."""
-        self._controller.set_chorus_voices(voices)
-
-    def _on_chorus_wet_dry(self, mix: float):
-        """Handle chorus wet/dry change."""
-        self._controller.set_chorus_wet_dry(mix)
+        self._set_status(f"Chorus {status}")
 
     # BOLT-009: Distortion callback handlers
 
@@ -443,24 +612,7 @@ class Application:
         """Handle distortion enable/disable."""
         self._controller.set_distortion_enabled(enabled)
         status = "enabled" if enabled else "disabled"
-        self._window.set_status(f"Distortion {status}")
-
-    def _on_distortion_drive(self, drive: float):
-        """Handle distortion drive change."""
-        self._controller.set_distortion_drive(drive)
-
-    def _on_distortion_tone(self, tone: float):
-        """Handle distortion tone change."""
-        self._controller.set_distortion_tone(tone)
-
-    def _on_distortion_mode(self, mode: str):
-        """Handle distortion mode change."""
-        self._controller.set_distortion_mode(mode)
-        self._window.set_status(f"Distortion mode: {mode}")
-
-    def _on_distortion_mix(self, mix: float):
-        """Handle distortion mix change."""
-        self._controller.set_distortion_mix(mix)
+        self._set_status(f"Distortion {status}")
 
 
     # BOLT-010: Flanger callback handlers
@@ -469,89 +621,93 @@ class Application:
         """Handle flanger enable/disable."""
         self._controller.set_flanger_enabled(enabled)
         status = "enabled" if enabled else "disabled"
-        self._window.set_status(f"Flanger {status}")
-
-    def _on_flanger_rate(self, rate: float):
-        """Handle flanger rate change."""
-        self._controller.set_flanger_rate(rate)
-
-    def _on_flanger_depth(self, depth: float):
-        """Handle flanger depth change."""
-        self._controller.set_flanger_depth(depth)
-
-    def _on_flanger_feedback(self, feedback: float):
-        """Handle flanger feedback change."""
-        self._controller.set_flanger_feedback(feedback)
-
-    def _on_flanger_wet_dry(self, mix: float):
-        """Handle flanger mix change."""
-        self._controller.set_flanger_wet_dry(mix)
+        self._set_status(f"Flanger {status}")
 
     # BOLT-008: Song player callback handlers
 
     def _on_song_play(self):
         """Handle song play."""
         self._controller.play_song()
-        self._window.set_status(f"Playing: {self._controller.current_song_name or 'Song'}")
+        self._set_status(f"Playing: {self._controller.current_song_name or 'Song'}")
 
     def _on_song_stop(self):
         """Handle song stop."""
         self._controller.stop_song()
         self._window.clear_external_notes()
         self._window.set_song_stopped()
-        self._window.set_status("Song stopped")
+        self._set_status("Song stopped")
 
     def _on_song_pause(self):
         """Handle song pause."""
         self._controller.pause_song()
         self._window.clear_external_notes()
-        self._window.set_status("Song paused")
+        self._set_status("Song paused")
 
     def _on_song_select(self, song_name: str):
-        """Handle song selection."""
+        """Handle song selection (called from the song player's I/O worker)."""
         if self._controller.load_song(song_name):
-            self._window.set_status(f"Loaded: {song_name}")
+            status = f"Loaded: {song_name}"
         else:
-            self._window.set_status(f"Failed to load: {song_name}")
+            status = f"Failed to load: {song_name}"
+        # Status is published by the tick loop on the main thread
+        self._set_status(status)
 
     def _on_song_note_on(self, note: int, velocity: int):
         """Handle song note on (for keyboard visualization)."""
-        # Schedule GUI update on main thread
-        self._window.after(0, lambda: self._window.external_note_on(note))
+        # Queue GUI update for the main thread
+        self._gui_queue.append((self._window.external_note_on, (note,)))
 
     def _on_song_note_off(self, note: int):
         """Handle song note off (for keyboard visualization)."""
-        # Schedule GUI update on main thread
-        self._window.after(0, lambda: self._window.external_note_off(note))
+        # Queue GUI update for the main thread
+        self._gui_queue.append((self._window.external_note_off, (note,)))
 
     def _on_song_progress(self, current: float, total: float):
         """Handle song progress update."""
-        # Schedule GUI update on main thread
-        self._window.after(0, lambda: self._window.update_song_progress(current, total))
+        # Queue GUI update for the main thread
+        self._gui_queue.append(
+            (self._window.update_song_progress, (current, total))
+        )
 
     def _on_song_complete(self):
         """Handle song completion."""
-        def on_complete():
-            self._window.clear_external_notes()
-            self._window.set_song_stopped()
-            self._window.set_status("Song finished")
-        self._window.after(0, on_complete)
+        # Queue GUI update for the main thread
+        self._gui_queue.append((self._show_song_finished, ()))
+
+    def _show_song_finished(self):
+        """Reset song display after completion (main thread)."""
+        self._window.clear_external_notes()
+        self._window.set_song_stopped()
+        self._set_status("Song finished")
 
     def run(self):
         """Run the application."""
-        # Start audio engine
+        self._build_controller()
+
+        # Start the audio engine while the GUI is built on the main thread
+        audio_thread = None
         if not self._no_audio:
-            try:
-                self._controller.start()
-                self._window.set_status("Audio engine started")
-            except Exception as e:
-                self._window.set_status(f"Audio error: {e}")
-                print(f"Warning: Could not start audio engine: {e}")
-        else:
-            self._window.set_status("Running without audio (--no-audio)")
+            audio_thread = threading.Thread(
+                target=self._start_audio, name="audio-start", daemon=True
+            )
+            audio_thread.start()
 
-        # Start GUI main loop
         try:
+            try:
+                self._build_window()
+            finally:
+                if audio_thread is not None:
+                    audio_thread.join()
+
+            if self._no_audio:
+                self._set_status("Running without audio (--no-audio)")
+            elif self._audio_error is not None:
+                self._set_status(f"Audio error: {self._audio_error}")
+                print(f"Warning: Could not start audio engine: {self._audio_error}")
+            else:
+                self._set_status("Audio engine started")
+
+            # Start GUI main loop
             self._window.mainloop()
         finally:
             # Ensure cleanup on exit
@@ -560,6 +716,14 @@ class Application:
 
 def main():
     """Application entry point."""
+    # Plain --help needs no parser; print the static text and exit
+    if sys.argv[1:] in (['-h'], ['--help']):
+        print(_HELP_TEXT.format(
+            prog=os.path.basename(sys.argv[0]),
+            presets_dir=_DEFAULT_PRESETS_DIR
+        ))
+        sys.exit(0)
+
     args = parse_args()
 
     print("KarokeLite Mini Synthesizer")
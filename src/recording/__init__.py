@@ -31,11 +31,23 @@ Usage:
     params = storage.load_preset('my_preset')
 """
 
+import importlib
+
 # BOLT-005: Metronome & Recording
-from .metronome import Metronome, TimeSignature, ClickSound
-from .recorder import AudioRecorder, RecordingState
-from .file_export import FileExporter, ExportFormat, ExportConfig
-from .preset_storage import PresetStorage, Preset
+# Public names are imported on first access (PEP 562), so e.g. importing
+# PresetStorage does not also load the metronome, recorder and exporter.
+_LAZY = {
+    'Metronome': '.metronome',
+    'TimeSignature': '.metronome',
+    'ClickSound': '.metronome',
+    'AudioRecorder': '.recorder',
+    'RecordingState': '.recorder',
+    'FileExporter': '.file_export',
+    'ExportFormat': '.file_export',
+    'ExportConfig': '.file_export',
+    'PresetStorage': '.preset_storage',
+    'Preset': '.preset_storage',
+}
 
 __all__ = [
     # Metronome
@@ -53,3 +65,17 @@ __all__ = [
     'PresetStorage',
     'Preset',
 ]
+
+
+def __getattr__(name):
+    """Import a public name from its submodule on first access."""
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
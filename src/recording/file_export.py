@@ -21,6 +21,7 @@ Usage:
 
 from dataclasses import dataclass, field
 from enum import Enum, auto
+from functools import partial
 from typing import Optional, Callable, Dict, Any
 from pathlib import Path
 import numpy as np
@@ -28,6 +29,76 @@ import wave
 import struct
 import datetime
 
+try:
+    import soundfile
+    SOUNDFILE_AVAILABLE = True
+except (ImportError, OSError):
+    # OSError: package present but libsndfile missing
+    soundfile = None
+    SOUNDFILE_AVAILABLE = False
+
+try:
+    from numba import jit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    # Fallback: no-op decorator if numba not installed
+    def jit(*args, **kwargs):
+        def decorator(func):
+            return func
+        return decorator
+
+
+# libsndfile WAV subtypes by bit depth
+_SOUNDFILE_SUBTYPES = {16: 'PCM_16', 24: 'PCM_24', 32: 'FLOAT'}
+
+# File size units for display, largest first
+_SIZE_UNITS = (('MB', 1 << 20), ('KB', 1 << 10))
+
+
+def _clip_unit(audio: np.ndarray) -> np.ndarray:
+    """Clip audio to -1.0 to 1.0, copying only if a sample is out of range.
+
+    Args:
+        audio: Float audio
+
+    Returns:
+        The input array if already in range, otherwise a clipped copy
+    """
+    if audio.max(initial=0.0) > 1.0 or audio.min(initial=0.0) < -1.0:
+        return np.clip(audio, -1.0, 1.0)
+    return audio
+
+
+@jit(nopython=True, cache=True)
+def _add_tpdf_xorshift(work, lsb, state):
+    """JIT-compiled triangular dither using two xorshift32 generators.
+
+    The difference of the two generator outputs gives the triangular PDF;
+    the noise is added to the working buffer in the same pass.
+
+    Args:
+        work: Float buffer to dither in place
+        lsb: Size of one quantization step
+        state: int64 array holding the two non-zero 32-bit generator states
+    """
+    a = state[0]
+    b = state[1]
+    scale = lsb / 4294967296.0
+
+    for i in range(len(work)):
+        a ^= (a << 13) & 0xFFFFFFFF
+        a ^= a >> 17
+        a ^= (a << 5) & 0xFFFFFFFF
+        b ^= (b << 13) & 0xFFFFFFFF
+        b ^= b >> 17
+        b ^= (b << 5) & 0xFFFFFFFF
+        work[i] += (a - b) * scale
+
+    state[0] = a
+    state[1] = b
+
 
 class ExportFormat(Enum):
     """Supported export formats."""
@@ -80,6 +151,9 @@ class FileExporter:
     Currently supports WAV files with multiple bit depths.
     """
 
+    # Samples converted and written per chunk (256 KB of float32)
+    EXPORT_CHUNK_SIZE = 65536
+
     def __init__(self, default_config: Optional[ExportConfig] = None):
         """Initialize exporter.
 
@@ -88,6 +162,17 @@ class FileExporter:
         """
         self._default_config = default_config or ExportConfig()
 
+        # Dither noise source and reusable noise buffers (sized on demand)
+        self._rng = np.random.default_rng()
+        self._dither_buf_a: Optional[np.ndarray] = None
+        self._dither_buf_b: Optional[np.ndarray] = None
+
+        # xorshift32 states for the JIT dither kernel
+        self._xorshift_state = self._rng.integers(1, 2 ** 32, size=2, dtype=np.int64)
+
+        # Output directories already created or confirmed to exist
+        self._ensured_dirs: set = set()
+
     def export_wav(
         self,
         audio: np.ndarray,
@@ -117,51 +202,57 @@ class FileExporter:
             raise ValueError("Audio data is empty")
 
         # Ensure audio is float32
+        source = audio
         audio = np.asarray(audio, dtype=np.float32)
 
-        # Apply normalization if requested
+        # Apply normalization if requested (in place when audio is our own copy)
         if config.normalize:
-            audio = self._normalize(audio, config.normalize_headroom_db)
+            audio = self._normalize(
+                audio, config.normalize_headroom_db, in_place=audio is not source
+            )
 
         if progress_callback:
             progress_callback(0.1)
 
-        # Convert to target bit depth
+        # libsndfile handles conversion and writing natively, but does not
+        # dither; dithered integer exports stay on the NumPy path
+        if SOUNDFILE_AVAILABLE and (config.bit_depth == 32 or not config.dither):
+            self._write_with_soundfile(filepath, audio, config)
+            if progress_callback:
+                progress_callback(1.0)
+            return True
+
+        # Pick the per-chunk sample converter for the target bit depth
         if config.bit_depth == 32:
             # 32-bit float WAV
-            audio_bytes = self._convert_to_float32(audio)
+            # Normalizing with headroom already keeps samples in range
+            convert = partial(
+                self._convert_to_float32,
+                skip_clip=config.normalize and config.normalize_headroom_db >= 0
+            )
             sample_width = 4
             fmt_tag = 3  # IEEE float
         elif config.bit_depth == 24:
             # 24-bit integer WAV
-            audio_bytes = self._convert_to_int24(audio, config.dither)
+            convert = partial(self._convert_to_int24, dither=config.dither)
             sample_width = 3
             fmt_tag = 1  # PCM
         else:
             # 16-bit integer WAV
-            audio_bytes = self._convert_to_int16(audio, config.dither)
+            convert = partial(self._convert_to_int16, dither=config.dither)
             sample_width = 2
             fmt_tag = 1  # PCM
 
-        if progress_callback:
-            progress_callback(0.5)
-
-        # Handle stereo conversion
-        if config.channels == 2:
-            # Duplicate mono to stereo
-            audio_bytes = self._mono_to_stereo(audio_bytes, sample_width)
-
-        if progress_callback:
-            progress_callback(0.7)
-
-        # Write WAV file
+        # Convert and write chunk by chunk to bound peak memory
         self._write_wav_file(
             filepath,
-            audio_bytes,
+            audio,
+            convert,
             config.sample_rate,
             config.channels,
             sample_width,
-            fmt_tag
+            fmt_tag,
+            progress_callback
         )
 
         if progress_callback:
@@ -169,93 +260,144 @@ class FileExporter:
 
         return True
 
-    def _normalize(self, audio: np.ndarray, headroom_db: float) -> np.ndarray:
+    def _normalize(
+        self,
+        audio: np.ndarray,
+        headroom_db: float,
+        in_place: bool = False
+    ) -> np.ndarray:
         """Normalize audio to 0dB minus headroom.
 
         Args:
             audio: Audio data
             headroom_db: Headroom below 0dB
+            in_place: Scale audio in place instead of into a new array
 
         Returns:
             Normalized audio
         """
-        peak = np.abs(audio).max()
+        # Peak from max/min reductions, avoiding an abs() temporary
+        peak = max(float(audio.max()), -float(audio.min()))
         if peak > 0:
             # Calculate target level
             target = 10 ** (-headroom_db / 20)
-            return audio * (target / peak)
+            return np.multiply(
+                audio, target / peak, out=audio if in_place else None
+            )
         return audio
 
-    def _convert_to_int16(self, audio: np.ndarray, dither: bool) -> bytes:
-        """Convert float audio to 16-bit integer bytes.
+    def _quantize(
+        self,
+        audio: np.ndarray,
+        dither: bool,
+        full_scale: float,
+        dtype,
+        work_dtype=np.float32
+    ) -> np.ndarray:
+        """Clip, dither, scale, round and cast float audio to integer samples.
+
+        All steps run in place on a single working buffer.
 
         Args:
             audio: Float audio (-1.0 to 1.0)
-            dither: Apply dither
+            dither: Apply triangular dither of +/-1 LSB
+            full_scale: Largest positive integer sample (e.g. 32767.0)
+            dtype: Integer output dtype
+            work_dtype: Float dtype of the working buffer
 
         Returns:
-            Byte array of 16-bit samples
+            Integer sample array
         """
         # Clip to valid range
-        audio = np.clip(audio, -1.0, 1.0)
+        work = np.empty(len(audio), dtype=work_dtype)
+        np.clip(audio, -1.0, 1.0, out=work)
 
         # Apply triangular dither
         if dither:
-            dither_noise = (np.random.random(len(audio)) +
-                           np.random.random(len(audio)) - 1.0)
-            audio = audio + dither_noise / 32768.0
+            lsb = 1.0 / (full_scale + 1.0)
+            if NUMBA_AVAILABLE:
+                _add_tpdf_xorshift(work, lsb, self._xorshift_state)
+            else:
+                work += self._tpdf_noise(len(audio), lsb, work_dtype)
 
-        # Scale to 16-bit range
-        scaled = audio * 32767.0
-        scaled = np.clip(scaled, -32768, 32767)
-        int_data = scaled.astype(np.int16)
+        # Scale to integer range and round to nearest rather than truncate
+        work *= full_scale
+        np.clip(work, -(full_scale + 1.0), full_scale, out=work)
+        np.rint(work, out=work)
+        return work.astype(dtype)
 
-        return int_data.tobytes()
+    def _tpdf_noise(self, n: int, lsb: float, dtype) -> np.ndarray:
+        """Generate triangular dither noise in the range +/-lsb.
 
-    def _convert_to_int24(self, audio: np.ndarray, dither: bool) -> bytes:
-        """Convert float audio to 24-bit integer bytes.
+        The difference of two uniform draws gives the triangular PDF. The
+        returned array is a view into a buffer reused by later calls.
+
+        Args:
+            n: Number of samples
+            lsb: Size of one quantization step
+            dtype: Float dtype of the noise
+
+        Returns:
+            Noise array of length n
+        """
+        buf_a = self._dither_buf_a
+        if buf_a is None or buf_a.dtype != dtype or len(buf_a) < n:
+            self._dither_buf_a = buf_a = np.empty(n, dtype=dtype)
+            self._dither_buf_b = np.empty(n, dtype=dtype)
+        a = buf_a[:n]
+        b = self._dither_buf_b[:n]
+
+        self._rng.random(n, dtype=dtype, out=a)
+        self._rng.random(n, dtype=dtype, out=b)
+        a -= b
+        a *= lsb
+        return a
+
+    def _convert_to_int16(self, audio: np.ndarray, dither: bool) -> bytes:
+        """Convert float audio to 16-bit integer bytes.
 
         Args:
             audio: Float audio (-1.0 to 1.0)
             dither: Apply dither
 
         Returns:
-            Byte array of 24-bit samples (3 bytes per sample)
+            Byte array of 16-bit samples
         """
-        # Clip to valid range
-        audio = np.clip(audio, -1.0, 1.0)
+        return self._quantize(audio, dither, 32767.0, np.int16).tobytes()
 
-        # Apply triangular dither
-        if dither:
-            dither_noise = (np.random.random(len(audio)) +
-                           np.random.random(len(audio)) - 1.0)
-            audio = audio + dither_noise / 8388608.0
+    def _convert_to_int24(self, audio: np.ndarray, dither: bool) -> bytes:
+        """Convert float audio to 24-bit integer bytes.
 
-        # Scale to 24-bit range
-        scaled = audio * 8388607.0
-        scaled = np.clip(scaled, -8388608, 8388607)
-        int_data = scaled.astype(np.int32)
+        Args:
+            audio: Float audio (-1.0 to 1.0)
+            dither: Apply dither
 
-        # Pack as 24-bit (3 bytes per sample, little-endian)
-        result = bytearray()
-        for sample in int_data:
-            # Extract 3 bytes from 32-bit integer
-            result.extend(struct.pack('<i', sample)[:3])
+        Returns:
+            Byte array of 24-bit samples (3 bytes per sample)
+        """
+        # float32 cannot resolve 24-bit dither near full scale, so work in
+        # float64 here
+        int_data = self._quantize(audio, dither, 8388607.0, '<i4', np.float64)
 
-        return bytes(result)
+        # Pack as 24-bit (3 bytes per sample, little-endian): drop the
+        # high byte of each little-endian 32-bit sample in one copy
+        packed = int_data.view(np.uint8).reshape(-1, 4)[:, :3]
+        return np.ascontiguousarray(packed).tobytes()
 
-    def _convert_to_float32(self, audio: np.ndarray) -> bytes:
+    def _convert_to_float32(self, audio: np.ndarray, skip_clip: bool = False) -> bytes:
         """Convert float audio to 32-bit float bytes.
 
         Args:
             audio: Float audio
+            skip_clip: Caller guarantees samples are already within -1.0 to 1.0
 
         Returns:
             Byte array of 32-bit float samples
         """
-        # Clip to valid range
-        audio = np.clip(audio, -1.0, 1.0)
-        return audio.astype(np.float32).tobytes()
+        audio = np.asarray(audio, dtype=np.float32)
+        if not skip_clip:
+            audio = _clip_unit(audio)
+        return audio.tobytes()
 
     def _mono_to_stereo(self, audio_bytes: bytes, sample_width: int) -> bytes:
         """Convert mono audio bytes to stereo.
@@ -267,69 +409,155 @@ class FileExporter:
         Returns:
             Stereo audio bytes
         """
-        result = bytearray()
-        for i in range(0, len(audio_bytes), sample_width):
-            sample = audio_bytes[i:i + sample_width]
-            result.extend(sample)  # Left
-            result.extend(sample)  # Right
-        return bytes(result)
+        # View as one row per sample and repeat each row (left, right)
+        frames = np.frombuffer(audio_bytes, dtype=np.uint8).reshape(-1, sample_width)
+        return np.repeat(frames, 2, axis=0).tobytes()
 
-    def _write_wav_file(
+    def _write_with_soundfile(
         self,
         filepath: str,
-        audio_bytes: bytes,
+        audio: np.ndarray,
+        config: ExportConfig
+    ):
+        """Write WAV file through libsndfile.
+
+        Args:
+            filepath: Output file path
+            audio: Mono float32 audio
+            config: Export configuration
+        """
+        if config.bit_depth == 16:
+            # Quantize here so the samples match the NumPy path exactly;
+            # libsndfile scales -1.0 to -32768 rather than -32767
+            data = self._quantize(audio, False, 32767.0, np.int16)
+        elif config.bit_depth == 24:
+            # libsndfile keeps the top 24 bits of int32 input
+            data = self._quantize(audio, False, 8388607.0, np.int32, np.float64)
+            data <<= 8
+        else:
+            # libsndfile does not clip out-of-range floats by default
+            data = _clip_unit(audio)
+        if config.channels == 2:
+            data = np.column_stack((data, data))
+
+        self._ensure_parent_dir(filepath)
+        soundfile.write(
+            filepath,
+            data,
+            config.sample_rate,
+            subtype=_SOUNDFILE_SUBTYPES[config.bit_depth],
+            format='WAV'
+        )
+
+    def _ensure_parent_dir(self, filepath: str):
+        """Create the output file's directory once per exporter.
+
+        Args:
+            filepath: Output file path
+        """
+        parent = Path(filepath).parent
+        if parent not in self._ensured_dirs:
+            parent.mkdir(parents=True, exist_ok=True)
+            self._ensured_dirs.add(parent)
+
+    def _wav_header(
+        self,
+        data_size: int,
         sample_rate: int,
         channels: int,
         sample_width: int,
         fmt_tag: int
-    ):
-        """Write WAV file with audio data.
+    ) -> bytes:
+        """Build the RIFF, fmt and data chunk headers.
 
         Args:
-            filepath: Output file path
-            audio_bytes: Audio data as bytes
+            data_size: Size of the sample data in bytes
             sample_rate: Sample rate in Hz
             channels: Number of channels
             sample_width: Bytes per sample
             fmt_tag: Format tag (1=PCM, 3=IEEE float)
-        """
-        # Ensure directory exists
-        path = Path(filepath)
-        path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Calculate header values
+        Returns:
+            Header bytes preceding the sample data
+        """
         byte_rate = sample_rate * channels * sample_width
         block_align = channels * sample_width
-        data_size = len(audio_bytes)
-        file_size = 36 + data_size
 
-        with open(filepath, 'wb') as f:
-            # RIFF header
-            f.write(b'RIFF')
-            f.write(struct.pack('<I', file_size))
-            f.write(b'WAVE')
-
-            # fmt chunk
-            f.write(b'fmt ')
-            if fmt_tag == 3:  # IEEE float needs extended format
-                f.write(struct.pack('<I', 18))  # chunk size
-            else:
-                f.write(struct.pack('<I', 16))  # chunk size
+        # IEEE float needs the extended fmt chunk (2-byte extension size)
+        if fmt_tag == 3:
+            fmt_chunk_size = 18
+            fmt_extension = struct.pack('<H', 0)
+        else:
+            fmt_chunk_size = 16
+            fmt_extension = b''
+
+        # RIFF size covers 'WAVE', the fmt chunk and the data chunk
+        file_size = 4 + (8 + fmt_chunk_size) + (8 + data_size)
+
+        return b''.join((
+            struct.pack(
+                '<4sI4s4sIHHIIHH',
+                b'RIFF', file_size, b'WAVE',
+                b'fmt ', fmt_chunk_size,
+                fmt_tag,            # format tag
+                channels,           # channels
+                sample_rate,        # sample rate
+                byte_rate,          # byte rate
+                block_align,        # block align
+                sample_width * 8    # bits per sample
+            ),
+            fmt_extension,
+            struct.pack('<4sI', b'data', data_size),
+        ))
 
-            f.write(struct.pack('<H', fmt_tag))          # format tag
-            f.write(struct.pack('<H', channels))         # channels
-            f.write(struct.pack('<I', sample_rate))      # sample rate
-            f.write(struct.pack('<I', byte_rate))        # byte rate
-            f.write(struct.pack('<H', block_align))      # block align
-            f.write(struct.pack('<H', sample_width * 8)) # bits per sample
+    def _write_wav_file(
+        self,
+        filepath: str,
+        audio: np.ndarray,
+        convert: Callable[[np.ndarray], bytes],
+        sample_rate: int,
+        channels: int,
+        sample_width: int,
+        fmt_tag: int,
+        progress_callback: Optional[Callable[[float], None]] = None
+    ):
+        """Convert and write mono audio to a WAV file in chunks.
+
+        The data size is known up front, so the header is written first
+        and each chunk is converted and written in turn.
+
+        Args:
+            filepath: Output file path
+            audio: Mono float32 audio
+            convert: Converts a float chunk to sample bytes
+            sample_rate: Sample rate in Hz
+            channels: Number of channels (mono is duplicated for stereo)
+            sample_width: Bytes per sample
+            fmt_tag: Format tag (1=PCM, 3=IEEE float)
+            progress_callback: Optional callback(progress: 0.1-1.0)
+        """
+        self._ensure_parent_dir(filepath)
 
-            if fmt_tag == 3:
-                f.write(struct.pack('<H', 0))  # extension size
+        num_samples = len(audio)
+        chunk_size = self.EXPORT_CHUNK_SIZE
+        header = self._wav_header(
+            num_samples * channels * sample_width,
+            sample_rate, channels, sample_width, fmt_tag
+        )
 
-            # data chunk
-            f.write(b'data')
-            f.write(struct.pack('<I', data_size))
-            f.write(audio_bytes)
+        with open(filepath, 'wb') as f:
+            f.write(header)
+
+            for start in range(0, num_samples, chunk_size):
+                end = min(start + chunk_size, num_samples)
+                chunk_bytes = convert(audio[start:end])
+                if channels == 2:
+                    # Duplicate mono to stereo
+                    chunk_bytes = self._mono_to_stereo(chunk_bytes, sample_width)
+                f.write(chunk_bytes)
+
+                if progress_callback and end < num_samples:
+                    progress_callback(0.1 + 0.9 * end / num_samples)
 
     def get_export_info(
         self,
@@ -347,14 +575,15 @@ class FileExporter:
         """
         config = config or self._default_config
 
-        duration_seconds = len(audio) / config.sample_rate
+        num_samples = len(audio)
+        duration_seconds = num_samples / config.sample_rate
         bytes_per_sample = config.bit_depth // 8
-        estimated_size = len(audio) * bytes_per_sample * config.channels + 44  # header
+        estimated_size = num_samples * bytes_per_sample * config.channels + 44  # header
 
         return {
             'duration_seconds': duration_seconds,
             'duration_formatted': self._format_duration(duration_seconds),
-            'sample_count': len(audio),
+            'sample_count': num_samples,
             'sample_rate': config.sample_rate,
             'bit_depth': config.bit_depth,
             'channels': config.channels,
@@ -370,12 +599,10 @@ class FileExporter:
 
     def _format_size(self, bytes_: int) -> str:
         """Format file size."""
-        if bytes_ < 1024:
-            return f"{bytes_} B"
-        elif bytes_ < 1024 * 1024:
-            return f"{bytes_ / 1024:.1f} KB"
-        else:
-            return f"{bytes_ / (1024 * 1024):.1f} MB"
+        for unit, scale in _SIZE_UNITS:
+            if bytes_ >= scale:
+                return f"{bytes_ / scale:.1f} {unit}"
+        return f"{bytes_} B"
 
     def __repr__(self) -> str:
         return f"FileExporter(bit_depth={self._default_config.bit_depth})"
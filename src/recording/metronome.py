@@ -18,12 +18,89 @@ Usage:
     output = synth_samples + click_samples * metro.volume
 """
 
+from collections import deque
 from dataclasses import dataclass
 from enum import Enum, auto
 from typing import Tuple, Optional
 import numpy as np
 import math
 
+try:
+    from numba import jit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    # Fallback: no-op decorator if numba not installed
+    def jit(*args, **kwargs):
+        def decorator(func):
+            return func
+        return decorator
+
+
+# Click used in place of the real clicks at zero volume
+_SILENT_CLICK = np.zeros(0, dtype=np.float32)
+
+# Unit-length click decay curve, resampled to each click's decay length
+_ENVELOPE_GRID = np.linspace(0, 1, 4096)
+_ENVELOPE_UNIT = np.exp(-5 * _ENVELOPE_GRID)
+
+# Generated clicks shared by all instances, keyed by (sample_rate, frequency)
+_CLICK_CACHE = {}
+
+
+@jit(nopython=True, cache=True)
+def _metronome_generate(output, click_high, click_low, samples_per_beat,
+                        sample_position, current_beat, beats_per_measure,
+                        accent_enabled, beat_events):
+    """JIT-compiled click track generation loop.
+
+    Args:
+        output: Zeroed float32 output buffer to write clicks into
+        click_high: Scaled accent click samples
+        click_low: Scaled normal click samples
+        samples_per_beat: Samples per beat at current BPM
+        sample_position: Position within current beat
+        current_beat: Current beat in measure (0-indexed)
+        beats_per_measure: Beats per measure
+        accent_enabled: Whether to accent first beat
+        beat_events: Buffer receiving the beat number of each beat started
+
+    Returns:
+        Tuple of (final sample position, final beat, number of beat events)
+    """
+    num_samples = len(output)
+    num_events = 0
+    write_pos = 0
+
+    while write_pos < num_samples:
+        # Start of a beat: write click and record the event
+        if sample_position == 0:
+            if current_beat == 0 and accent_enabled:
+                click = click_high
+            else:
+                click = click_low
+
+            # Silent (empty) clicks leave the zeroed output as is
+            copy_len = min(len(click), num_samples - write_pos)
+            if copy_len > 0:
+                output[write_pos:write_pos + copy_len] = click[:copy_len]
+
+            beat_events[num_events] = current_beat
+            num_events += 1
+
+        # Advance position
+        advance = min(samples_per_beat - sample_position, num_samples - write_pos)
+        write_pos += advance
+        sample_position += advance
+
+        # Check if we've reached end of beat
+        if sample_position >= samples_per_beat:
+            sample_position = 0
+            current_beat = (current_beat + 1) % beats_per_measure
+
+    return sample_position, current_beat, num_events
+
 
 class ClickSound(Enum):
     """Click sound type."""
@@ -121,27 +198,61 @@ class Metronome:
         # Pre-generate click sounds
         self._click_high = self._generate_click(self.CLICK_FREQUENCY_HIGH)
         self._click_low = self._generate_click(self.CLICK_FREQUENCY_LOW)
+        self._update_scaled_clicks()
+
+        # Beat numbers reported by the generation loop (grown on demand)
+        self._beat_events = np.empty(4, dtype=np.int64)
+
+        # Recent tap times for tap tempo (last 8 taps)
+        self._tap_times = deque(maxlen=8)
 
         # Callbacks
         self._on_beat_callback = None
 
+        # Compile the generation loop now rather than in the audio callback
+        if NUMBA_AVAILABLE:
+            _metronome_generate(
+                np.zeros(1, dtype=np.float32),
+                self._click_high_scaled, self._click_low_scaled,
+                self._samples_per_beat, 0, 0, 1, True, self._beat_events
+            )
+
     def _generate_click(self, frequency: float) -> np.ndarray:
-        """Generate a click sound (short sine burst with envelope).
+        """Get a click sound, generating it if not already cached.
 
         Args:
             frequency: Click frequency in Hz
 
+        Returns:
+            Click audio samples (shared, must not be modified)
+        """
+        key = (self._sample_rate, frequency)
+        click = _CLICK_CACHE.get(key)
+        if click is None:
+            click = _CLICK_CACHE[key] = self._synthesize_click(
+                self._sample_rate, frequency
+            )
+        return click
+
+    @classmethod
+    def _synthesize_click(cls, sample_rate: int, frequency: float) -> np.ndarray:
+        """Synthesize a click sound (short sine burst with envelope).
+
+        Args:
+            sample_rate: Audio sample rate
+            frequency: Click frequency in Hz
+
         Returns:
             Click audio samples
         """
-        num_samples = int(self.CLICK_DURATION * self._sample_rate)
-        t = np.arange(num_samples) / self._sample_rate
+        num_samples = int(cls.CLICK_DURATION * sample_rate)
+        t = np.arange(num_samples) / sample_rate
 
         # Generate sine wave
         sine = np.sin(2 * np.pi * frequency * t)
 
         # Generate envelope (attack-decay)
-        attack_samples = int(self.CLICK_ATTACK * self._sample_rate)
+        attack_samples = int(cls.CLICK_ATTACK * sample_rate)
         decay_samples = num_samples - attack_samples
 
         envelope = np.zeros(num_samples)
@@ -152,11 +263,17 @@ class Metronome:
 
         # Decay (exponential decay)
         if decay_samples > 0:
-            decay_curve = np.exp(-5 * np.linspace(0, 1, decay_samples))
-            envelope[attack_samples:] = decay_curve
+            envelope[attack_samples:] = np.interp(
+                np.linspace(0, 1, decay_samples), _ENVELOPE_GRID, _ENVELOPE_UNIT
+            )
 
         return (sine * envelope).astype(np.float32)
 
+    def _update_scaled_clicks(self):
+        """Rebuild the volume-scaled click buffers used by generate()."""
+        self._click_high_scaled = self._click_high * np.float32(self._volume)
+        self._click_low_scaled = self._click_low * np.float32(self._volume)
+
     @property
     def bpm(self) -> float:
         """Get current tempo in BPM."""
@@ -193,7 +310,10 @@ class Metronome:
     @volume.setter
     def volume(self, value: float):
         """Set click volume (0.0-1.0)."""
-        self._volume = max(0.0, min(1.0, value))
+        volume = max(0.0, min(1.0, value))
+        if volume != self._volume:
+            self._volume = volume
+            self._update_scaled_clicks()
 
     @property
     def accent_enabled(self) -> bool:
@@ -267,45 +387,38 @@ class Metronome:
         if not self._running:
             return output
 
-        write_pos = 0
-
-        while write_pos < num_samples:
-            # Check if we're at the start of a beat
-            if self._sample_position == 0:
-                # Determine click type
-                is_downbeat = (self._current_beat == 0)
-
-                if is_downbeat and self._accent_enabled:
-                    click = self._click_high
-                else:
-                    click = self._click_low
-
-                # Copy click samples to output
-                click_len = len(click)
-                samples_remaining = num_samples - write_pos
-                copy_len = min(click_len, samples_remaining)
-
-                output[write_pos:write_pos + copy_len] = click[:copy_len] * self._volume
-
-                # Fire callback
-                if self._on_beat_callback:
-                    try:
-                        self._on_beat_callback(self._current_beat, is_downbeat)
-                    except Exception:
-                        pass  # Don't crash audio thread
-
-            # Advance position
-            samples_to_end_of_beat = self._samples_per_beat - self._sample_position
-            samples_remaining = num_samples - write_pos
-            advance = min(samples_to_end_of_beat, samples_remaining)
-
-            write_pos += advance
-            self._sample_position += advance
-
-            # Check if we've reached end of beat
-            if self._sample_position >= self._samples_per_beat:
-                self._sample_position = 0
-                self._current_beat = (self._current_beat + 1) % self._time_signature.beats_per_measure
+        max_events = num_samples // self._samples_per_beat + 1
+        if len(self._beat_events) < max_events:
+            self._beat_events = np.empty(max_events, dtype=np.int64)
+
+        # Output is already silent at zero volume
+        if self._volume > 0.0:
+            click_high = self._click_high_scaled
+            click_low = self._click_low_scaled
+        else:
+            click_high = click_low = _SILENT_CLICK
+
+        self._sample_position, self._current_beat, num_events = _metronome_generate(
+            output,
+            click_high,
+            click_low,
+            self._samples_per_beat,
+            self._sample_position,
+            self._current_beat,
+            self._time_signature.beats_per_measure,
+            self._accent_enabled,
+            self._beat_events
+        )
+
+        # Fire callbacks outside the generation loop
+        callback = self._on_beat_callback
+        if callback:
+            for i in range(num_events):
+                beat = int(self._beat_events[i])
+                try:
+                    callback(beat, beat == 0)
+                except Exception:
+                    pass  # Don't crash audio thread
 
         return output
 
@@ -321,29 +434,22 @@ class Metronome:
         Returns:
             Calculated BPM after 2+ taps, or None
         """
-        if not hasattr(self, '_tap_times'):
-            self._tap_times = []
-
         # Keep last 8 taps
-        self._tap_times.append(tap_time)
-        if len(self._tap_times) > 8:
-            self._tap_times = self._tap_times[-8:]
+        taps = self._tap_times
+        taps.append(tap_time)
 
         # Need at least 2 taps
-        if len(self._tap_times) < 2:
+        if len(taps) < 2:
             return None
 
         # Reset if too long between taps (> 2 seconds)
-        if tap_time - self._tap_times[-2] > 2.0:
-            self._tap_times = [tap_time]
+        if tap_time - taps[-2] > 2.0:
+            taps.clear()
+            taps.append(tap_time)
             return None
 
-        # Calculate average interval
-        intervals = []
-        for i in range(1, len(self._tap_times)):
-            intervals.append(self._tap_times[i] - self._tap_times[i-1])
-
-        avg_interval = sum(intervals) / len(intervals)
+        # Average interval: the intermediate differences telescope
+        avg_interval = (taps[-1] - taps[0]) / (len(taps) - 1)
         calculated_bpm = 60.0 / avg_interval
 
         # Clamp to valid range
@@ -352,3 +458,11 @@ class Metronome:
     def __repr__(self) -> str:
         status = "running" if self._running else "stopped"
         return f"Metronome({self._bpm:.1f} BPM, {self._time_signature}, {status})"
+
+
+# Clicks for the common sample rates, built once at import
+_CLICK_CACHE.update(
+    ((rate, frequency), Metronome._synthesize_click(rate, frequency))
+    for rate in (44100, 48000)
+    for frequency in (Metronome.CLICK_FREQUENCY_HIGH, Metronome.CLICK_FREQUENCY_LOW)
+)
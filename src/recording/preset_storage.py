@@ -23,14 +23,243 @@ Usage:
     presets = storage.list_presets()
 """
 
-from dataclasses import dataclass, field, asdict
-from typing import Dict, Any, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Dict, Any, List, Mapping, Optional, Tuple
 from pathlib import Path
+from types import MappingProxyType
 import json
 import datetime
+import mmap
+import os
+import re
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
 
-@dataclass
+try:
+    import fastjsonschema
+    FASTJSONSCHEMA_AVAILABLE = True
+except ImportError:
+    fastjsonschema = None
+    FASTJSONSCHEMA_AVAILABLE = False
+
+
+def _loads(data: bytes) -> Any:
+    """Parse JSON bytes (orjson when available)."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# Files at least this large are memory-mapped instead of read into bytes
+_MMAP_THRESHOLD = 8192
+
+
+def _read_json(path: str, size: int) -> Any:
+    """Read and parse a JSON file.
+
+    Large files are memory-mapped and handed to orjson as a memoryview,
+    avoiding a copy; small files are cheaper to read directly.
+
+    Args:
+        path: File path
+        size: File size in bytes
+    """
+    with open(path, 'rb') as f:
+        if ORJSON_AVAILABLE and size >= _MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, \
+                    memoryview(mm) as view:
+                return orjson.loads(view)
+        return _loads(f.read())
+
+
+def _read_metadata(path: str, size: int) -> Optional[Tuple[str, str]]:
+    """Read (name, category) from a preset file.
+
+    Args:
+        path: File path
+        size: File size in bytes
+
+    Returns:
+        (name, category) tuple, or None if the file cannot be parsed
+    """
+    try:
+        data = _read_json(path, size)
+        return (
+            data.get('name', os.path.basename(path)[:-5]),
+            data.get('category', 'uncategorized')
+        )
+    except Exception:
+        return None
+
+
+def _dumps(obj: Any, pretty: bool = True) -> bytes:
+    """Serialize to UTF-8 JSON bytes (orjson when available).
+
+    Args:
+        obj: Object to serialize
+        pretty: Indent with two spaces, else use compact separators
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0)
+    if pretty:
+        return json.dumps(obj, indent=2).encode('utf-8')
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+
+def _write_atomic(path: Path, data: bytes):
+    """Write bytes to a file via a temporary file and os.replace.
+
+    A crash mid-write leaves the previous file intact.
+
+    Args:
+        path: Destination path
+        data: File contents
+    """
+    tmp_path = path.with_name(path.name + '.tmp')
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+# Characters not allowed in preset filenames, mapped to underscores
+_UNSAFE_CHARS = str.maketrans({c: '_' for c in '/\\:*?"<>| '})
+
+# Runs of underscores, collapsed to one
+_UNDERSCORE_RUNS = re.compile(r'_+')
+
+
+# Types of the optional top-level preset fields
+_PRESET_FIELD_TYPES = {
+    'name': str,
+    'parameters': dict,
+    'author': str,
+    'description': str,
+    'category': str,
+    'tags': list,
+    'created_at': str,
+    'modified_at': str,
+    'version': str,
+}
+
+# Allowed types of individual parameter values
+_PARAMETER_VALUE_TYPES = (int, float, str, bool)
+
+_JSON_TYPES = {str: 'string', dict: 'object', list: 'array'}
+
+# JSON schema equivalent of the two tables above
+_PRESET_SCHEMA = {
+    'type': 'object',
+    'properties': {
+        **{key: {'type': _JSON_TYPES[t]} for key, t in _PRESET_FIELD_TYPES.items()},
+        'parameters': {
+            'type': 'object',
+            'additionalProperties': {'type': ['number', 'string', 'boolean']},
+        },
+        'tags': {'type': 'array', 'items': {'type': 'string'}},
+    },
+}
+
+
+def _check_preset_data(data: Any):
+    """Validate preset data without fastjsonschema.
+
+    Args:
+        data: Parsed preset JSON
+
+    Raises:
+        ValueError: If data does not match the preset schema
+    """
+    if not isinstance(data, dict):
+        raise ValueError("Preset data must be an object")
+    for key, expected in _PRESET_FIELD_TYPES.items():
+        if key in data and not isinstance(data[key], expected):
+            raise ValueError(f"Preset field '{key}' must be {_JSON_TYPES[expected]}")
+    for value in data.get('parameters', {}).values():
+        if not isinstance(value, _PARAMETER_VALUE_TYPES):
+            raise ValueError(f"Invalid parameter value: {value!r}")
+    if not all(isinstance(tag, str) for tag in data.get('tags', [])):
+        raise ValueError("Preset tags must be strings")
+
+
+# Compiled once; raises JsonSchemaException (a ValueError) on invalid data
+if FASTJSONSCHEMA_AVAILABLE:
+    _validate_preset_data = fastjsonschema.compile(_PRESET_SCHEMA)
+else:
+    _validate_preset_data = _check_preset_data
+
+
+# Factory preset data shipped alongside this module
+_FACTORY_PRESETS_PATH = Path(__file__).with_name('factory_presets.json')
+
+
+@lru_cache(maxsize=None)
+def _load_factory_presets() -> Mapping[str, Mapping[str, Any]]:
+    """Load the factory presets once per process.
+
+    Returns:
+        Read-only mapping of preset name to read-only parameters
+    """
+    with open(_FACTORY_PRESETS_PATH, 'rb') as f:
+        data = _loads(f.read())
+    # Read-only, so lookups can be shared without defensive copies
+    return MappingProxyType({
+        name: MappingProxyType(params) for name, params in data.items()
+    })
+
+
+@lru_cache(maxsize=None)
+def _factory_preset_names() -> Tuple[str, ...]:
+    """Get the factory preset names, in file order, computed once."""
+    return tuple(_load_factory_presets())
+
+
+class _LazyClassAttribute:
+    """Class attribute descriptor whose value comes from a cached loader."""
+
+    def __init__(self, loader):
+        self._loader = loader
+
+    def __get__(self, instance, owner):
+        return self._loader()
+
+
+@lru_cache(maxsize=512)
+def _sanitize_filename(name: str) -> str:
+    """Sanitize preset name for use as filename.
+
+    Args:
+        name: Preset name
+
+    Returns:
+        Safe filename (without extension)
+    """
+    # Replace unsafe characters in one pass
+    safe = name.lower().translate(_UNSAFE_CHARS)
+
+    # Remove consecutive and leading/trailing underscores
+    if '__' in safe:
+        safe = _UNDERSCORE_RUNS.sub('_', safe)
+    safe = safe.strip('_')
+
+    # Ensure not empty
+    return safe or 'preset'
+
+
+@dataclass(slots=True)
 class Preset:
     """Synthesizer preset data.
 
@@ -57,19 +286,36 @@ class Preset:
 
     def __post_init__(self):
         """Set timestamps if not provided."""
-        now = datetime.datetime.now().isoformat()
-        if not self.created_at:
-            self.created_at = now
-        if not self.modified_at:
-            self.modified_at = now
+        if not self.created_at or not self.modified_at:
+            now = datetime.datetime.now().isoformat()
+            self.created_at = self.created_at or now
+            self.modified_at = self.modified_at or now
 
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary."""
-        return asdict(self)
+        """Convert to dictionary.
+
+        Shallow: parameters and tags are the preset's own objects, not copies.
+        """
+        return {
+            'name': self.name,
+            'parameters': self.parameters,
+            'author': self.author,
+            'description': self.description,
+            'category': self.category,
+            'tags': self.tags,
+            'created_at': self.created_at,
+            'modified_at': self.modified_at,
+            'version': self.version,
+        }
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Preset':
-        """Create preset from dictionary."""
+        """Create preset from dictionary.
+
+        Raises:
+            ValueError: If data does not match the preset schema
+        """
+        _validate_preset_data(data)
         return cls(
             name=data.get('name', 'Unnamed'),
             parameters=data.get('parameters', {}),
@@ -97,296 +343,24 @@ class PresetStorage:
     # Default preset directory
     DEFAULT_PRESET_DIR = "presets"
 
+    # Fixed timestamp for factory presets (avoids a clock read per load)
+    _FACTORY_TS = '1970-01-01T00:00:00'
+
+    # Metadata index file kept in the preset directory (not matched by *.json)
+    INDEX_FILENAME = ".preset_index"
+
+    # Unindexed files read on a thread pool above this count
+    PARALLEL_READ_THRESHOLD = 16
+
     # Preset categories
     CATEGORIES = [
         'bass', 'lead', 'pad', 'keys', 'pluck',
         'fx', 'drums', 'ambient', 'uncategorized'
     ]
 
-    # Factory presets (built-in)
-    FACTORY_PRESETS = {
-        'Init': {
-            'osc1_waveform': 'sawtooth',
-            'osc1_level': 0.7,
-            'osc1_detune': 0.0,
-            'osc1_octave': 0,
-            'osc2_waveform': 'sawtooth',
-            'osc2_level': 0.5,
-            'osc2_detune': 5.0,
-            'osc2_octave': 0,
-            'filter_cutoff': 2000.0,
-            'filter_resonance': 0.3,
-            'filter_env_amount': 0.0,
-            'amp_attack': 0.01,
-            'amp_decay': 0.1,
-            'amp_sustain': 0.7,
-            'amp_release': 0.3,
-            'filter_attack': 0.01,
-            'filter_decay': 0.2,
-            'filter_sustain': 0.5,
-            'filter_release': 0.2,
-            'lfo_waveform': 'sine',
-            'lfo_rate': 5.0,
-            'lfo_depth': 0.5,
-            'lfo_to_pitch': 0.0,
-            'lfo_to_filter': 0.0,
-            'lfo_to_pw': 0.0,
-            'master_volume': 0.7,
-        },
-        'Fat Bass': {
-            'osc1_waveform': 'sawtooth',
-            'osc1_level': 0.8,
-            'osc1_detune': 0.0,
-            'osc1_octave': -1,
-            'osc2_waveform': 'square',
-            'osc2_level': 0.6,
-            'osc2_detune': 10.0,
-            'osc2_octave': -1,
-            'filter_cutoff': 800.0,
-            'filter_resonance': 0.5,
-            'filter_env_amount': 0.7,
-            'amp_attack': 0.005,
-            'amp_decay': 0.2,
-            'amp_sustain': 0.6,
-            'amp_release': 0.2,
-            'filter_attack': 0.01,
-            'filter_decay': 0.3,
-            'filter_sustain': 0.3,
-            'filter_release': 0.2,
-            'lfo_waveform': 'sine',
-            'lfo_rate': 0.5,
-            'lfo_depth': 0.0,
-            'lfo_to_pitch': 0.0,
-            'lfo_to_filter': 0.0,
-            'lfo_to_pw': 0.0,
-            'master_volume': 0.75,
-        },
-        'Bright Lead': {
-            'osc1_waveform': 'sawtooth',
-            'osc1_level': 0.7,
-            'osc1_detune': -5.0,
-            'osc1_octave': 0,
-            'osc2_waveform': 'sawtooth',
-            'osc2_level': 0.7,
-            'osc2_detune': 5.0,
-            'osc2_octave': 0,
-            'filter_cutoff': 5000.0,
-            'filter_resonance': 0.4,
-            'filter_env_amount': 0.3,
-            'amp_attack': 0.01,
-            'amp_decay': 0.1,
-            'amp_sustain': 0.8,
-            'amp_release': 0.3,
-            'filter_attack': 0.01,
-            'filter_decay': 0.15,
-            'filter_sustain': 0.6,
-            'filter_release': 0.25,
-            'lfo_waveform': 'triangle',
-            'lfo_rate': 6.0,
-            'lfo_depth': 0.3,
-            'lfo_to_pitch': 0.1,
-            'lfo_to_filter': 0.0,
-            'lfo_to_pw': 0.0,
-            'master_volume': 0.7,
-        },
-        'Soft Pad': {
-            'osc1_waveform': 'triangle',
-            'osc1_level': 0.6,
-            'osc1_detune': -3.0,
-            'osc1_octave': 0,
-            'osc2_waveform': 'sine',
-            'osc2_level': 0.5,
-            'osc2_detune': 3.0,
-            'osc2_octave': 1,
-            'filter_cutoff': 1500.0,
-            'filter_resonance': 0.2,
-            'filter_env_amount': 0.2,
-            'amp_attack': 0.5,
-            'amp_decay': 0.3,
-            'amp_sustain': 0.8,
-            'amp_release': 1.0,
-            'filter_attack': 0.4,
-            'filter_decay': 0.5,
-            'filter_sustain': 0.5,
-            'filter_release': 0.8,
-            'lfo_waveform': 'sine',
-            'lfo_rate': 0.5,
-            'lfo_depth': 0.4,
-            'lfo_to_pitch': 0.0,
-            'lfo_to_filter': 0.3,
-            'lfo_to_pw': 0.0,
-            'master_volume': 0.65,
-        },
-        'Retro Square': {
-            'osc1_waveform': 'square',
-            'osc1_level': 0.7,
-            'osc1_detune': 0.0,
-            'osc1_octave': 0,
-            'osc2_waveform': 'square',
-            'osc2_level': 0.4,
-            'osc2_detune': 0.0,
-            'osc2_octave': 1,
-            'filter_cutoff': 3000.0,
-            'filter_resonance': 0.3,
-            'filter_env_amount': 0.4,
-            'amp_attack': 0.01,
-            'amp_decay': 0.15,
-            'amp_sustain': 0.7,
-            'amp_release': 0.2,
-            'filter_attack': 0.01,
-            'filter_decay': 0.2,
-            'filter_sustain': 0.4,
-            'filter_release': 0.15,
-            'lfo_waveform': 'square',
-            'lfo_rate': 4.0,
-            'lfo_depth': 0.0,
-            'lfo_to_pitch': 0.0,
-            'lfo_to_filter': 0.0,
-            'lfo_to_pw': 0.0,
-            'master_volume': 0.7,
-        },
-        # New presets (BOLT-009)
-        'Ethereal Strings': {
-            'osc1_waveform': 'sawtooth',
-            'osc1_level': 0.5,
-            'osc1_detune': -7.0,
-            'osc1_octave': 0,
-            'osc2_waveform': 'sawtooth',
-            'osc2_level': 0.5,
-            'osc2_detune': 7.0,
-            'osc2_octave': 0,
-            'filter_cutoff': 2500.0,
-            'filter_resonance': 0.15,
-            'filter_env_amount': 0.25,
-            'amp_attack': 0.8,
-            'amp_decay': 0.4,
-            'amp_sustain': 0.85,
-            'amp_release': 1.5,
-            'filter_attack': 0.6,
-            'filter_decay': 0.5,
-            'filter_sustain': 0.6,
-            'filter_release': 1.2,
-            'lfo_waveform': 'sine',
-            'lfo_rate': 0.3,
-            'lfo_depth': 0.35,
-            'lfo_to_pitch': 0.05,
-            'lfo_to_filter': 0.2,
-            'lfo_to_pw': 0.0,
-            'master_volume': 0.65,
-        },
-        'Plucky Keys': {
-            'osc1_waveform': 'triangle',
-            'osc1_level': 0.8,
-            'osc1_detune': 0.0,
-            'osc1_octave': 0,
-            'osc2_waveform': 'sine',
-            'osc2_level': 0.4,
-            'osc2_detune': 0.0,
-            'osc2_octave': 1,
-            'filter_cutoff': 4000.0,
-            'filter_resonance': 0.25,
-            'filter_env_amount': 0.6,
-            'amp_attack': 0.002,
-            'amp_decay': 0.35,
-            'amp_sustain': 0.3,
-            'amp_release': 0.4,
-            'filter_attack': 0.001,
-            'filter_decay': 0.25,
-            'filter_sustain': 0.2,
-            'filter_release': 0.3,
-            'lfo_waveform': 'sine',
-            'lfo_rate': 3.0,
-            'lfo_depth': 0.0,
-            'lfo_to_pitch': 0.0,
-            'lfo_to_filter': 0.0,
-            'lfo_to_pw': 0.0,
-            'master_volume': 0.7,
-        },
-        'Warm Organ': {
-            'osc1_waveform': 'sine',
-            'osc1_level': 0.7,
-            'osc1_detune': 0.0,
-            'osc1_octave': 0,
-            'osc2_waveform': 'sine',
-            'osc2_level': 0.5,
-            'osc2_detune': 0.0,
-            'osc2_octave': 1,
-            'filter_cutoff': 2000.0,
-            'filter_resonance': 0.1,
-            'filter_env_amount': 0.1,
-            'amp_attack': 0.02,
-            'amp_decay': 0.05,
-            'amp_sustain': 0.9,
-            'amp_release': 0.15,
-            'filter_attack': 0.01,
-            'filter_decay': 0.1,
-            'filter_sustain': 0.8,
-            'filter_release': 0.1,
-            'lfo_waveform': 'sine',
-            'lfo_rate': 6.5,
-            'lfo_depth': 0.2,
-            'lfo_to_pitch': 0.08,
-            'lfo_to_filter': 0.0,
-            'lfo_to_pw': 0.0,
-            'master_volume': 0.7,
-        },
-        'Acid Squelch': {
-            'osc1_waveform': 'sawtooth',
-            'osc1_level': 0.9,
-            'osc1_detune': 0.0,
-            'osc1_octave': -1,
-            'osc2_waveform': 'square',
-            'osc2_level': 0.3,
-            'osc2_detune': 0.0,
-            'osc2_octave': -1,
-            'filter_cutoff': 500.0,
-            'filter_resonance': 0.85,
-            'filter_env_amount': 0.9,
-            'amp_attack': 0.001,
-            'amp_decay': 0.25,
-            'amp_sustain': 0.0,
-            'amp_release': 0.1,
-            'filter_attack': 0.001,
-            'filter_decay': 0.2,
-            'filter_sustain': 0.1,
-            'filter_release': 0.1,
-            'lfo_waveform': 'sine',
-            'lfo_rate': 0.0,
-            'lfo_depth': 0.0,
-            'lfo_to_pitch': 0.0,
-            'lfo_to_filter': 0.0,
-            'lfo_to_pw': 0.0,
-            'master_volume': 0.75,
-        },
-        'Cosmic Bell': {
-            'osc1_waveform': 'triangle',
-            'osc1_level': 0.6,
-            'osc1_detune': 0.0,
-            'osc1_octave': 1,
-            'osc2_waveform': 'sine',
-            'osc2_level': 0.7,
-            'osc2_detune': 12.0,
-            'osc2_octave': 2,
-            'filter_cutoff': 6000.0,
-            'filter_resonance': 0.35,
-            'filter_env_amount': 0.4,
-            'amp_attack': 0.001,
-            'amp_decay': 1.5,
-            'amp_sustain': 0.0,
-            'amp_release': 2.0,
-            'filter_attack': 0.001,
-            'filter_decay': 1.2,
-            'filter_sustain': 0.2,
-            'filter_release': 1.5,
-            'lfo_waveform': 'sine',
-            'lfo_rate': 0.2,
-            'lfo_depth': 0.25,
-            'lfo_to_pitch': 0.02,
-            'lfo_to_filter': 0.15,
-            'lfo_to_pw': 0.0,
-            'master_volume': 0.6,
-        },
-    }
+    # Factory presets (built-in), read-only and loaded on first access
+    FACTORY_PRESETS = _LazyClassAttribute(_load_factory_presets)
+    FACTORY_PRESET_NAMES = _LazyClassAttribute(_factory_preset_names)
 
     def __init__(self, preset_dir: Optional[str] = None):
         """Initialize preset storage.
@@ -397,10 +371,152 @@ class PresetStorage:
         self._preset_dir = Path(preset_dir or self.DEFAULT_PRESET_DIR)
         self._ensure_preset_dir()
 
+        # Metadata index: filename -> (mtime_ns, name, category)
+        self._index_path = self._preset_dir / self.INDEX_FILENAME
+        self._index: Dict[str, Tuple[int, str, str]] = self._read_index()
+
+        # Sanitized name (file stem) -> path of user presets on disk
+        self._name_to_path: Dict[str, Path] = {
+            entry.name[:-5]: Path(entry.path) for entry in self._preset_entries()
+        }
+
     def _ensure_preset_dir(self):
         """Create preset directory if it doesn't exist."""
         self._preset_dir.mkdir(parents=True, exist_ok=True)
 
+    def _read_index(self) -> Dict[str, Tuple[int, str, str]]:
+        """Load the persisted metadata index.
+
+        Returns:
+            Index dict (empty if missing or unreadable)
+        """
+        try:
+            with open(self._index_path, 'rb') as f:
+                data = _loads(f.read())
+            return {
+                filename: (int(mtime_ns), name, category)
+                for filename, (mtime_ns, name, category) in data.items()
+            }
+        except Exception:
+            return {}
+
+    def _write_index(self):
+        """Persist the metadata index atomically."""
+        try:
+            _write_atomic(self._index_path, _dumps(self._index, pretty=False))
+        except Exception:
+            pass
+
+    def _index_preset(self, filepath: Path, name: str, category: str):
+        """Record a just-written preset file in the index.
+
+        Args:
+            filepath: Preset file path
+            name: Preset name
+            category: Preset category
+        """
+        self._name_to_path[filepath.stem] = filepath
+        try:
+            mtime_ns = filepath.stat().st_mtime_ns
+        except OSError:
+            return
+        self._index[filepath.name] = (mtime_ns, name, category)
+        self._write_index()
+
+    def _user_preset_path(self, name: str) -> Optional[Path]:
+        """Resolve a user preset name to its file path.
+
+        Known presets come from the name-to-path map; on a miss the disk
+        is checked, so files written by other instances or processes are
+        found (and added to the map).
+
+        Args:
+            name: Preset name
+
+        Returns:
+            Preset file path, or None if no such file
+        """
+        stem = self._sanitize_filename(name)
+        filepath = self._name_to_path.get(stem)
+        if filepath is None:
+            filepath = self._preset_dir / (stem + '.json')
+            if not filepath.is_file():
+                return None
+            self._name_to_path[stem] = filepath
+        return filepath
+
+    def _preset_entries(self) -> List[os.DirEntry]:
+        """List the *.json files in the preset directory.
+
+        Returns:
+            Directory entries of preset files
+        """
+        try:
+            with os.scandir(self._preset_dir) as it:
+                return [
+                    entry for entry in it
+                    if entry.name.endswith('.json') and entry.is_file()
+                ]
+        except OSError:
+            return []
+
+    def _scan_presets(self) -> List[Tuple[str, str]]:
+        """Get (name, category) of every user preset file.
+
+        Only files that are new or changed since they were indexed are
+        parsed; the index is refreshed and persisted if anything changed.
+
+        Returns:
+            List of (name, category) tuples
+        """
+        changed = False
+        files = self._preset_entries()
+        self._name_to_path = {entry.name[:-5]: Path(entry.path) for entry in files}
+
+        stats = []
+        paths = []
+        sizes = []
+        for entry in files:
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            stats.append((entry, stat.st_mtime_ns))
+            cached = self._index.get(entry.name)
+            if cached is None or cached[0] != stat.st_mtime_ns:
+                paths.append(entry.path)
+                sizes.append(stat.st_size)
+
+        # Parse new/changed files, concurrently when there are many
+        if len(paths) > self.PARALLEL_READ_THRESHOLD:
+            with ThreadPoolExecutor(max_workers=min(32, len(paths))) as pool:
+                parsed = dict(zip(paths, pool.map(_read_metadata, paths, sizes)))
+        else:
+            parsed = dict(zip(paths, map(_read_metadata, paths, sizes)))
+
+        entries = []
+        seen = set()
+        for entry, mtime_ns in stats:
+            if entry.path in parsed:
+                metadata = parsed[entry.path]
+                if metadata is None:
+                    continue
+                self._index[entry.name] = (mtime_ns,) + metadata
+                changed = True
+
+            seen.add(entry.name)
+            entries.append(self._index[entry.name][1:])
+
+        # Drop entries for files removed outside this class
+        for filename in self._index.keys() - seen:
+            del self._index[filename]
+            changed = True
+
+        if changed:
+            self._write_index()
+
+        return entries
+
     @property
     def preset_dir(self) -> Path:
         """Get preset directory path."""
@@ -426,12 +542,13 @@ class PresetStorage:
             tags: List of tags
 
         Returns:
-            True if saved successfully
+            True if saved successfully, False if the write failed or the
+            preset would not pass validation on load
         """
-        # Create preset object
+        # Create preset object (parameters may be a read-only factory mapping)
         preset = Preset(
             name=name,
-            parameters=parameters,
+            parameters=dict(parameters),
             author=author,
             description=description,
             category=category,
@@ -442,40 +559,46 @@ class PresetStorage:
         filename = self._sanitize_filename(name) + '.json'
         filepath = self._preset_dir / filename
 
-        # Write JSON file
+        # Reject what loading would reject, then write compact JSON
+        # (export_preset writes the readable form)
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(preset.to_dict(), f, indent=2)
-            return True
+            data = preset.to_dict()
+            _validate_preset_data(data)
+            _write_atomic(filepath, _dumps(data, pretty=False))
         except Exception:
             return False
 
-    def load_preset(self, name: str) -> Optional[Dict[str, Any]]:
+        self._index_preset(filepath, preset.name, preset.category)
+        return True
+
+    def load_preset(self, name: str) -> Optional[Mapping[str, Any]]:
         """Load preset parameters.
 
         Args:
             name: Preset name
 
         Returns:
-            Parameters dict or None if not found
+            Parameters dict or None if not found. Factory presets are
+            returned as a read-only mapping; copy with dict() to modify.
         """
         # Check factory presets first
         if name in self.FACTORY_PRESETS:
-            return self.FACTORY_PRESETS[name].copy()
+            return self.FACTORY_PRESETS[name]
 
         # Try to load from file
-        filename = self._sanitize_filename(name) + '.json'
-        filepath = self._preset_dir / filename
-
-        if filepath.exists():
-            try:
-                with open(filepath, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    return data.get('parameters', {})
-            except Exception:
-                pass
+        filepath = self._user_preset_path(name)
+        if filepath is None:
+            return None
 
-        return None
+        try:
+            with open(filepath, 'rb') as f:
+                data = _loads(f.read())
+                return data.get('parameters', {})
+        except FileNotFoundError:
+            self._name_to_path.pop(filepath.stem, None)
+            return None
+        except Exception:
+            return None
 
     def load_preset_full(self, name: str) -> Optional[Preset]:
         """Load full preset with metadata.
@@ -490,24 +613,27 @@ class PresetStorage:
         if name in self.FACTORY_PRESETS:
             return Preset(
                 name=name,
-                parameters=self.FACTORY_PRESETS[name].copy(),
+                parameters=dict(self.FACTORY_PRESETS[name]),
                 author="Factory",
-                category="factory"
+                category="factory",
+                created_at=self._FACTORY_TS,
+                modified_at=self._FACTORY_TS
             )
 
         # Try to load from file
-        filename = self._sanitize_filename(name) + '.json'
-        filepath = self._preset_dir / filename
-
-        if filepath.exists():
-            try:
-                with open(filepath, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    return Preset.from_dict(data)
-            except Exception:
-                pass
+        filepath = self._user_preset_path(name)
+        if filepath is None:
+            return None
 
-        return None
+        try:
+            with open(filepath, 'rb') as f:
+                data = _loads(f.read())
+                return Preset.from_dict(data)
+        except FileNotFoundError:
+            self._name_to_path.pop(filepath.stem, None)
+            return None
+        except Exception:
+            return None
 
     def delete_preset(self, name: str) -> bool:
         """Delete a user preset.
@@ -522,17 +648,23 @@ class PresetStorage:
         if name in self.FACTORY_PRESETS:
             return False
 
-        filename = self._sanitize_filename(name) + '.json'
-        filepath = self._preset_dir / filename
-
-        if filepath.exists():
-            try:
-                filepath.unlink()
-                return True
-            except Exception:
-                pass
+        filepath = self._user_preset_path(name)
+        if filepath is None:
+            return False
+        del self._name_to_path[filepath.stem]
 
-        return False
+        try:
+            filepath.unlink()
+            found = True
+        except FileNotFoundError:
+            # Removed outside this class; the mapping entry was stale
+            found = False
+        except Exception:
+            self._name_to_path[filepath.stem] = filepath
+            return False
+        if self._index.pop(filepath.name, None) is not None:
+            self._write_index()
+        return found
 
     def list_presets(self, include_factory: bool = True) -> List[str]:
         """List all available preset names.
@@ -550,15 +682,9 @@ class PresetStorage:
             presets.extend(sorted(self.FACTORY_PRESETS.keys()))
 
         # Add user presets
-        for filepath in self._preset_dir.glob('*.json'):
-            try:
-                with open(filepath, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    name = data.get('name', filepath.stem)
-                    if name not in presets:
-                        presets.append(name)
-            except Exception:
-                continue
+        for name, _category in self._scan_presets():
+            if name not in presets:
+                presets.append(name)
 
         return presets
 
@@ -574,28 +700,20 @@ class PresetStorage:
         Returns:
             Dict mapping category to list of preset names
         """
-        result = {cat: [] for cat in self.CATEGORIES}
+        result: Dict[str, List[str]] = {}
 
         # Add factory presets
         if include_factory:
-            for name in self.FACTORY_PRESETS:
-                result['uncategorized'].append(name)
+            result['uncategorized'] = list(self.FACTORY_PRESET_NAMES)
 
-        # Add user presets
-        for filepath in self._preset_dir.glob('*.json'):
-            try:
-                with open(filepath, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    name = data.get('name', filepath.stem)
-                    category = data.get('category', 'uncategorized')
-                    if category not in result:
-                        category = 'uncategorized'
-                    result[category].append(name)
-            except Exception:
-                continue
+        # Add user presets, creating category lists only when used
+        for name, category in self._scan_presets():
+            if category not in self.CATEGORIES:
+                category = 'uncategorized'
+            result.setdefault(category, []).append(name)
 
-        # Remove empty categories
-        return {k: v for k, v in result.items() if v}
+        # Keep the CATEGORIES order for populated categories
+        return {cat: result[cat] for cat in self.CATEGORIES if cat in result}
 
     def preset_exists(self, name: str) -> bool:
         """Check if preset exists.
@@ -609,9 +727,9 @@ class PresetStorage:
         if name in self.FACTORY_PRESETS:
             return True
 
-        filename = self._sanitize_filename(name) + '.json'
-        filepath = self._preset_dir / filename
-        return filepath.exists()
+        # A map hit is trusted without a stat; files removed by another
+        # instance are dropped from the map when a load or delete misses
+        return self._user_preset_path(name) is not None
 
     def is_factory_preset(self, name: str) -> bool:
         """Check if preset is a factory preset.
@@ -630,10 +748,10 @@ class PresetStorage:
         Returns:
             List of factory preset names
         """
-        return list(self.FACTORY_PRESETS.keys())
+        return list(self.FACTORY_PRESET_NAMES)
 
     def _sanitize_filename(self, name: str) -> str:
-        """Sanitize preset name for use as filename.
+        """Sanitize preset name for use as filename (memoized).
 
         Args:
             name: Preset name
@@ -641,23 +759,7 @@ class PresetStorage:
         Returns:
             Safe filename (without extension)
         """
-        # Replace unsafe characters
-        safe = name.lower()
-        for char in ['/', '\\', ':', '*', '?', '"', '<', '>', '|', ' ']:
-            safe = safe.replace(char, '_')
-
-        # Remove consecutive underscores
-        while '__' in safe:
-            safe = safe.replace('__', '_')
-
-        # Remove leading/trailing underscores
-        safe = safe.strip('_')
-
-        # Ensure not empty
-        if not safe:
-            safe = 'preset'
-
-        return safe
+        return _sanitize_filename(name)
 
     def import_preset(self, filepath: str) -> Optional[str]:
         """Import preset from external file.
@@ -669,12 +771,23 @@ class PresetStorage:
             Imported preset name or None if failed
         """
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-
+            with open(filepath, 'rb') as f:
+                raw = f.read()
+            data = _loads(raw)
             preset = Preset.from_dict(data)
+        except Exception:
+            return None
 
-            # Save to preset directory
+        if isinstance(data.get('name'), str) and 'parameters' in data:
+            # Complete preset file: copy the bytes as is, no re-serializing
+            target = self._preset_dir / (self._sanitize_filename(preset.name) + '.json')
+            try:
+                _write_atomic(target, raw)
+            except Exception:
+                return None
+            self._index_preset(target, preset.name, preset.category)
+        else:
+            # Save to preset directory, filling in missing fields
             self.save_preset(
                 name=preset.name,
                 parameters=preset.parameters,
@@ -684,9 +797,7 @@ class PresetStorage:
                 tags=preset.tags
             )
 
-            return preset.name
-        except Exception:
-            return None
+        return preset.name
 
     def export_preset(self, name: str, filepath: str) -> bool:
         """Export preset to external file.
@@ -703,8 +814,7 @@ class PresetStorage:
             return False
 
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(preset.to_dict(), f, indent=2)
+            _write_atomic(Path(filepath), _dumps(preset.to_dict()))
             return True
         except Exception:
             return False
@@ -22,11 +22,44 @@ Usage:
 
 from dataclasses import dataclass
 from enum import Enum, auto
-from typing import Optional, List
+from typing import Optional, List, Tuple
 import numpy as np
 import threading
 import time
 
+try:
+    from numba import jit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    # Fallback: no-op decorator if numba not installed
+    def jit(*args, **kwargs):
+        def decorator(func):
+            return func
+        return decorator
+
+
+@jit(nopython=True, cache=True, fastmath=True, boundscheck=False)
+def _copy_and_peak(dst, src):
+    """JIT-compiled copy that tracks the peak absolute value in one pass.
+
+    Args:
+        dst: Destination buffer, same length as src
+        src: Samples to copy
+
+    Returns:
+        Peak absolute value of src (0.0 if empty)
+    """
+    peak = 0.0
+    for i in range(len(src)):
+        value = src[i]
+        dst[i] = value
+        magnitude = abs(value)
+        if magnitude > peak:
+            peak = magnitude
+    return peak
+
 
 class RecordingState(Enum):
     """Recording state enumeration."""
@@ -56,7 +89,14 @@ class AudioRecorder:
     """Real-time audio recorder with ring buffer.
 
     Records audio samples in real-time from the audio callback.
-    Uses a growing buffer strategy for unlimited recording duration.
+    Samples are written into fixed-size pages allocated up front for the
+    maximum duration, so recording never reallocates or copies.
+
+    add_samples does not take the main lock, which readers and control
+    operations may hold for a long copy. It snapshots the write position
+    under a small position lock, copies outside it, and publishes the new
+    position only if start/clear/undo have not replaced the take
+    meanwhile (tracked by a generation counter).
 
     Attributes:
         state: Current recording state
@@ -67,8 +107,8 @@ class AudioRecorder:
 
     # Default settings
     DEFAULT_SAMPLE_RATE = 44100
-    INITIAL_BUFFER_SIZE = 44100 * 60  # 1 minute initial
-    BUFFER_GROW_SIZE = 44100 * 30     # 30 second chunks
+    PAGE_SIZE = 44100 * 30            # 30 second buffer pages
+    SCRATCH_SIZE = 4096               # Initial peak scratch (audio blocks)
 
     # Maximum recording duration (30 minutes)
     MAX_DURATION_SAMPLES = 44100 * 60 * 30
@@ -87,6 +127,11 @@ class AudioRecorder:
         self._sample_rate = sample_rate
         self._lock = threading.Lock()
 
+        # Guards the (generation, write position, pages) triple. Held only
+        # for O(1) work, so the audio thread never waits on a long reader.
+        self._position_lock = threading.Lock()
+        self._generation = 0
+
         # Calculate max samples
         if max_duration_seconds is not None:
             self._max_samples = int(max_duration_seconds * sample_rate)
@@ -98,11 +143,19 @@ class AudioRecorder:
         self._write_position = 0
         self._peak_level = 0.0
 
-        # Audio buffer (pre-allocated)
-        self._buffer = np.zeros(self.INITIAL_BUFFER_SIZE, dtype=np.float32)
+        # Audio buffer: pages of PAGE_SIZE samples covering the full maximum
+        # duration, so the audio thread never allocates. Pages are left
+        # uninitialized and only committed by the OS when first written.
+        # Pages released by dropped or replaced takes are reused first.
+        self._pages: List[np.ndarray] = []
+        self._free_pages: List[np.ndarray] = []
+        self._ensure_capacity(self._max_samples)
 
-        # Undo support - store previous takes
-        self._undo_stack: List[np.ndarray] = []
+        # Reused |samples| buffer for peak checks, grown to the largest block
+        self._abs_scratch = np.empty(self.SCRATCH_SIZE, dtype=np.float32)
+
+        # Undo support - previous takes keep their pages: (pages, length, peak)
+        self._undo_stack: List[Tuple[List[np.ndarray], int, float]] = []
         self._max_undo = 3
 
         # Timing
@@ -182,13 +235,8 @@ class AudioRecorder:
         """Start recording immediately."""
         with self._lock:
             if self._state in [RecordingState.IDLE, RecordingState.ARMED]:
-                # Save current recording to undo stack if any
-                if self._write_position > 0:
-                    self._push_undo()
-
-                # Reset for new recording
-                self._write_position = 0
-                self._peak_level = 0.0
+                # Save current recording to undo stack and reset
+                self._reset_take()
                 self._start_time = time.time()
                 self._state = RecordingState.RECORDING
                 self._notify_state_change()
@@ -230,7 +278,7 @@ class AudioRecorder:
 
         # Auto-start if armed and input detected
         if self._state == RecordingState.ARMED:
-            peak = np.abs(samples).max()
+            peak = self._peak_abs(samples)
             if peak > 0.01:  # Threshold for auto-start
                 with self._lock:
                     self._state = RecordingState.RECORDING
@@ -239,45 +287,114 @@ class AudioRecorder:
             else:
                 return False
 
-        num_samples = len(samples)
-
-        with self._lock:
-            # Check if we have space
-            if self._write_position + num_samples > self._max_samples:
-                # Recording full
-                return False
+        # Snapshot the take being written; the copy itself is unlocked
+        with self._position_lock:
+            generation = self._generation
+            write_position = self._write_position
+            pages = self._pages
+        end = write_position + len(samples)
 
-            # Grow buffer if needed
-            if self._write_position + num_samples > len(self._buffer):
-                self._grow_buffer()
+        # Check if we have space
+        if end > self._max_samples:
+            # Recording full
+            return False
 
-            # Copy samples
-            self._buffer[self._write_position:self._write_position + num_samples] = samples
+        peak = self._write_pages(pages, write_position, samples)
 
-            # Update peak level
-            peak = np.abs(samples).max()
+        # Publish, unless start/clear/undo replaced the take meanwhile
+        with self._position_lock:
+            if self._generation != generation:
+                return False
             if peak > self._peak_level:
                 self._peak_level = peak
+            self._write_position = end
 
-            self._write_position += num_samples
-
-            # Notify level update (occasionally)
-            if self._on_level_update and self._write_position % 4410 == 0:
-                try:
-                    self._on_level_update(self._peak_level)
-                except Exception:
-                    pass
+        # Notify level update (occasionally)
+        if self._on_level_update and end % 4410 == 0:
+            try:
+                self._on_level_update(self._peak_level)
+            except Exception:
+                pass
 
         return True
 
-    def _grow_buffer(self):
-        """Grow the recording buffer."""
-        new_size = len(self._buffer) + self.BUFFER_GROW_SIZE
-        new_size = min(new_size, self._max_samples)
+    def _ensure_capacity(self, num_samples: int):
+        """Add pages until the buffer holds at least num_samples.
 
-        new_buffer = np.zeros(new_size, dtype=np.float32)
-        new_buffer[:len(self._buffer)] = self._buffer
-        self._buffer = new_buffer
+        Args:
+            num_samples: Required capacity in samples
+        """
+        pages = self._pages
+        free_pages = self._free_pages
+        while len(pages) * self.PAGE_SIZE < num_samples:
+            if free_pages:
+                pages.append(free_pages.pop())
+            else:
+                # Never read past the write position, so no need to zero
+                pages.append(np.empty(self.PAGE_SIZE, dtype=np.float32))
+
+    def _write_pages(self, pages: List[np.ndarray], position: int,
+                     samples: np.ndarray) -> float:
+        """Copy samples into the pages, splitting at page boundaries.
+
+        Args:
+            pages: Pages of the take being written
+            position: Sample position to write at
+            samples: Samples to write
+
+        Returns:
+            Peak absolute value of the samples
+        """
+        page_size = self.PAGE_SIZE
+        num_samples = len(samples)
+        peak = 0.0
+        done = 0
+        while done < num_samples:
+            page, offset = divmod(position + done, page_size)
+            count = min(num_samples - done, page_size - offset)
+            dst = pages[page][offset:offset + count]
+            src = samples[done:done + count]
+            if NUMBA_AVAILABLE:
+                peak = max(peak, _copy_and_peak(dst, src))
+            else:
+                dst[:] = src
+                peak = max(peak, self._peak_abs(src))
+            done += count
+        return peak
+
+    def _peak_abs(self, samples: np.ndarray) -> float:
+        """Peak absolute value, computed in a reused scratch buffer.
+
+        Args:
+            samples: Audio samples
+
+        Returns:
+            Peak absolute value (0.0 if empty)
+        """
+        num_samples = len(samples)
+        if num_samples == 0:
+            return 0.0
+        if num_samples > len(self._abs_scratch):
+            self._abs_scratch = np.empty(num_samples, dtype=np.float32)
+        scratch = self._abs_scratch[:num_samples]
+        np.abs(samples, out=scratch)
+        return float(scratch.max())
+
+    def _read_pages(self, num_samples: int) -> np.ndarray:
+        """Gather the first num_samples recorded samples into one array.
+
+        Args:
+            num_samples: Number of samples to read
+
+        Returns:
+            Contiguous copy of the samples
+        """
+        page_size = self.PAGE_SIZE
+        audio = np.empty(num_samples, dtype=np.float32)
+        for page, start in zip(self._pages, range(0, num_samples, page_size)):
+            count = min(page_size, num_samples - start)
+            audio[start:start + count] = page[:count]
+        return audio
 
     def get_audio(self) -> np.ndarray:
         """Get recorded audio.
@@ -286,7 +403,9 @@ class AudioRecorder:
             Copy of recorded audio samples
         """
         with self._lock:
-            return self._buffer[:self._write_position].copy()
+            with self._position_lock:
+                num_samples = self._write_position
+            return self._read_pages(num_samples)
 
     def get_info(self) -> RecordingInfo:
         """Get recording information.
@@ -306,44 +425,63 @@ class AudioRecorder:
         with self._lock:
             if self._state == RecordingState.IDLE:
                 # Save to undo first
-                if self._write_position > 0:
-                    self._push_undo()
-
-                self._write_position = 0
-                self._peak_level = 0.0
+                self._reset_take()
 
     def undo(self) -> bool:
         """Restore previous recording from undo stack.
 
+        Not available while recording or paused.
+
         Returns:
             True if undo was performed
         """
         with self._lock:
+            if self._state in (RecordingState.RECORDING, RecordingState.PAUSED):
+                return False
             if len(self._undo_stack) == 0:
                 return False
 
-            # Restore from undo
-            previous = self._undo_stack.pop()
+            # Swap the previous take's pages back in; current ones are recycled
+            with self._position_lock:
+                pages, length, peak = self._undo_stack.pop()
+                self._free_pages.extend(self._pages)
+                self._pages = pages
+                self._ensure_capacity(self._max_samples)
+                self._write_position = length
+                self._peak_level = peak
+                self._generation += 1
 
-            # Ensure buffer is large enough
-            if len(previous) > len(self._buffer):
-                self._buffer = np.zeros(len(previous), dtype=np.float32)
+            return True
 
-            self._buffer[:len(previous)] = previous
-            self._write_position = len(previous)
-            self._peak_level = np.abs(previous).max() if len(previous) > 0 else 0.0
+    def _reset_take(self):
+        """Move the current take to the undo stack and start an empty one.
 
-            return True
+        Called with self._lock held. Bumping the generation makes any
+        audio block still being written discard itself instead of
+        publishing a stale write position.
+        """
+        with self._position_lock:
+            if self._write_position > 0:
+                self._push_undo()
+            self._write_position = 0
+            self._peak_level = 0.0
+            self._generation += 1
 
     def _push_undo(self):
         """Push current recording to undo stack."""
         if self._write_position > 0:
-            # Save copy of current recording
-            self._undo_stack.append(self._buffer[:self._write_position].copy())
-
-            # Limit undo stack size
+            # Hand the used pages to the undo stack instead of copying them
+            used = -(-self._write_position // self.PAGE_SIZE)
+            self._undo_stack.append(
+                (self._pages[:used], self._write_position, self._peak_level)
+            )
+            self._pages = self._pages[used:]
+            self._ensure_capacity(self._max_samples)
+
+            # Limit undo stack size, recycling the dropped take's pages
             while len(self._undo_stack) > self._max_undo:
-                self._undo_stack.pop(0)
+                dropped_pages, _, _ = self._undo_stack.pop(0)
+                self._free_pages.extend(dropped_pages)
 
     def _notify_state_change(self):
         """Notify callback of state change."""
@@ -355,3 +493,8 @@ class AudioRecorder:
 
     def __repr__(self) -> str:
         return f"AudioRecorder({self._state.name}, {self.duration_seconds:.2f}s)"
+
+
+# Compile the copy kernel at import, not on the first audio callback
+if NUMBA_AVAILABLE:
+    _copy_and_peak(np.zeros(1, dtype=np.float32), np.zeros(1, dtype=np.float32))
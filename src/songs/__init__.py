@@ -23,7 +23,8 @@ Usage:
 
 from .song import Song, SongEvent
 from .player import SongPlayer
-from .demo_songs import get_all_songs, get_song_by_name, DEMO_SONGS
+from . import demo_songs
+from .demo_songs import get_all_songs, get_song_by_name
 
 __all__ = [
     'Song',
@@ -33,3 +34,10 @@ __all__ = [
     'get_song_by_name',
     'DEMO_SONGS',
 ]
+
+
+def __getattr__(name):
+    """Provide DEMO_SONGS without building the songs at import (PEP 562)."""
+    if name != 'DEMO_SONGS':
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return demo_songs.DEMO_SONGS
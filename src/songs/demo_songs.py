@@ -8,7 +8,8 @@ Provides three demo songs:
 3. Synth Demo - Electronic sequence, Fat Bass preset
 """
 
-from typing import List, Optional
+from functools import lru_cache
+from typing import List, Optional, Tuple
 from .song import Song, SongEvent
 
 
@@ -599,18 +600,28 @@ def _create_synth_demo() -> Song:
     )
 
 
-# Pre-built demo songs
-DEMO_SONGS: List[Song] = [
-    _create_twinkle_twinkle(),
-    _create_fur_elise(),
-    _create_synth_demo(),
+# Demo song builders, run on first use rather than at import
+_CREATORS = (
+    _create_twinkle_twinkle,
+    _create_fur_elise,
+    _create_synth_demo,
     # New showcase songs (BOLT-009)
-    _create_ambient_pad(),
-    _create_retro_arp(),
-    _create_bass_groove(),
-    _create_dreamy_lead(),
-    _create_techno_pulse(),
-]
+    _create_ambient_pad,
+    _create_retro_arp,
+    _create_bass_groove,
+    _create_dreamy_lead,
+    _create_techno_pulse,
+)
+
+
+@lru_cache(maxsize=1)
+def _build_demos() -> Tuple[Song, ...]:
+    """Build the demo songs once.
+
+    Returns:
+        Tuple of Song objects
+    """
+    return tuple(create() for create in _CREATORS)
 
 
 def get_all_songs() -> List[Song]:
@@ -619,7 +630,7 @@ def get_all_songs() -> List[Song]:
     Returns:
         List of Song objects
     """
-    return DEMO_SONGS.copy()
+    return list(_build_demos())
 
 
 def get_song_by_name(name: str) -> Optional[Song]:
@@ -631,7 +642,17 @@ def get_song_by_name(name: str) -> Optional[Song]:
     Returns:
         Song object if found, None otherwise
     """
-    for song in DEMO_SONGS:
-        if song.name.lower() == name.lower():
+    name = name.lower()
+    for song in _build_demos():
+        if song.name.lower() == name:
             return song
     return None
+
+
+def __getattr__(name):
+    """Build DEMO_SONGS on first access (PEP 562)."""
+    if name != 'DEMO_SONGS':
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = list(_build_demos())
+    globals()[name] = value
+    return value
@@ -330,6 +330,22 @@ class TestDemoSongs:
         song = get_song_by_name("Unknown Song")
         assert song is None
 
+    def test_demo_songs_built_lazily_once(self):
+        """Songs should be built on first use, then shared."""
+        import importlib
+        import songs
+        from songs import demo_songs
+
+        demo_songs = importlib.reload(demo_songs)
+        assert demo_songs._build_demos.cache_info().currsize == 0
+
+        all_songs = demo_songs.get_all_songs()
+        assert demo_songs.get_all_songs() == all_songs
+        assert demo_songs.get_all_songs() is not all_songs
+        assert demo_songs._build_demos.cache_info().misses == 1
+        assert demo_songs.DEMO_SONGS == all_songs
+        assert songs.DEMO_SONGS is demo_songs.DEMO_SONGS
+
     def test_twinkle_twinkle_preset(self):
         """Twinkle Twinkle should use Soft Pad."""
         song = get_song_by_name("Twinkle Twinkle")
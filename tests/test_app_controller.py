@@ -447,3 +447,10 @@ class TestAppController:
         assert buffer is not None
         assert len(buffer) == controller.buffer_size
 
+    def test_get_song_list_returns_copy(self):
+        """Should return the cached song names as a fresh list."""
+        controller = AppController()
+        songs = controller.get_song_list()
+        assert len(songs) > 0
+        songs.clear()
+        assert controller.get_song_list() != []
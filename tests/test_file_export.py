@@ -11,6 +11,7 @@ import tempfile
 import wave
 import struct
 from pathlib import Path
+from unittest.mock import patch
 
 # Add src to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
@@ -146,6 +147,118 @@ class TestFileExporterWAV16:
             if Path(filepath).exists():
                 Path(filepath).unlink()
 
+    def test_int16_rounds_to_nearest(self):
+        """Samples should round to the nearest integer, not truncate."""
+        exporter = FileExporter()
+        audio = np.array([0.9 / 32767.0, -0.9 / 32767.0, 0.5], dtype=np.float32)
+
+        samples = np.frombuffer(
+            exporter._convert_to_int16(audio, dither=False), dtype=np.int16
+        )
+
+        assert samples.tolist() == [1, -1, 16384]
+
+
+class TestFileExporterMonoToStereo:
+    """Tests for mono to stereo byte duplication."""
+
+    def test_duplicates_each_sample(self):
+        """Each sample should be written to left and right in order."""
+        exporter = FileExporter()
+
+        for sample_width in (2, 3, 4):
+            mono = bytes(range(sample_width * 4))
+
+            stereo = exporter._mono_to_stereo(mono, sample_width)
+
+            expected = b''.join(
+                mono[i:i + sample_width] * 2
+                for i in range(0, len(mono), sample_width)
+            )
+            assert stereo == expected
+
+
+class TestFileExporterDither:
+    """Tests for triangular dither noise."""
+
+    def test_tpdf_noise_range(self):
+        """Noise should stay within one LSB and be centered on zero."""
+        exporter = FileExporter()
+        lsb = 1.0 / 32768.0
+
+        noise = exporter._tpdf_noise(10000, lsb, np.float32)
+
+        assert len(noise) == 10000
+        assert noise.dtype == np.float32
+        assert np.abs(noise).max() <= lsb
+        assert abs(noise.mean()) < lsb * 0.05
+
+    def test_xorshift_dither_range(self):
+        """JIT dither kernel should add noise within one LSB and advance state."""
+        from recording.file_export import _add_tpdf_xorshift
+        lsb = 1.0 / 32768.0
+        state = np.array([12345, 67890], dtype=np.int64)
+        work = np.zeros(5000, dtype=np.float32)
+
+        _add_tpdf_xorshift(work, lsb, state)
+
+        assert np.abs(work).max() <= lsb
+        assert abs(work.mean()) < lsb * 0.05
+        assert np.count_nonzero(work) > 4900
+        assert state[0] != 12345 and state[1] != 67890
+        assert 0 < state[0] < 2 ** 32 and 0 < state[1] < 2 ** 32
+
+
+class TestFileExporterSoundfile:
+    """Tests for the optional libsndfile backend."""
+
+    def test_soundfile_roundtrip(self):
+        """Stereo 16-bit export via soundfile should read back correctly."""
+        soundfile = pytest.importorskip('soundfile')
+        exporter = FileExporter()
+        audio = np.array([0.0, 0.5, -0.5, 1.5], dtype=np.float32)
+
+        with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as f:
+            filepath = f.name
+
+        try:
+            config = ExportConfig(bit_depth=16, channels=2, dither=False)
+            exporter.export_wav(audio, filepath, config)
+
+            data, sample_rate = soundfile.read(filepath)
+            assert sample_rate == 44100
+            assert data.shape == (4, 2)
+            assert np.allclose(data[:, 0], [0.0, 0.5, -0.5, 1.0], atol=1e-3)
+        finally:
+            if Path(filepath).exists():
+                Path(filepath).unlink()
+
+    def test_soundfile_matches_numpy_path(self):
+        """Both backends should write identical integer samples."""
+        pytest.importorskip('soundfile')
+        from recording import file_export
+
+        audio = np.array(
+            [0.0, 0.25, -0.25, 0.5, -0.5, 0.999, -0.999, 1.0, -1.0, 1.5, -1.5],
+            dtype=np.float32
+        )
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for bit_depth in (16, 24):
+                config = ExportConfig(bit_depth=bit_depth, channels=2, dither=False)
+                sf_path = os.path.join(tmpdir, f'sf_{bit_depth}.wav')
+                np_path = os.path.join(tmpdir, f'np_{bit_depth}.wav')
+
+                FileExporter().export_wav(audio, sf_path, config)
+                with patch.object(file_export, 'SOUNDFILE_AVAILABLE', False):
+                    FileExporter().export_wav(audio, np_path, config)
+
+                with wave.open(sf_path, 'rb') as sf_wav, \
+                        wave.open(np_path, 'rb') as np_wav:
+                    assert sf_wav.getparams() == np_wav.getparams()
+                    assert (sf_wav.readframes(len(audio))
+                            == np_wav.readframes(len(audio)))
+
 
 class TestFileExporterWAV24:
     """Tests for 24-bit WAV export."""
@@ -172,6 +285,18 @@ class TestFileExporterWAV24:
             if Path(filepath).exists():
                 Path(filepath).unlink()
 
+    def test_int24_packing(self):
+        """Should pack samples as little-endian 3-byte integers."""
+        exporter = FileExporter()
+        audio = np.array([0.0, 0.5, -0.5, 1.0, -1.0], dtype=np.float32)
+
+        packed = exporter._convert_to_int24(audio, dither=False)
+
+        expected = b''.join(
+            struct.pack('<i', round(float(s) * 8388607.0))[:3] for s in audio
+        )
+        assert packed == expected
+
 
 class TestFileExporterWAV32:
     """Tests for 32-bit float WAV export."""
@@ -194,6 +319,30 @@ class TestFileExporterWAV32:
             if Path(filepath).exists():
                 Path(filepath).unlink()
 
+    def test_float32_clip(self):
+        """Float conversion should clip unless told the input is in range."""
+        exporter = FileExporter()
+        audio = np.array([0.5, 1.5, -2.0], dtype=np.float32)
+
+        clipped = np.frombuffer(exporter._convert_to_float32(audio), dtype=np.float32)
+        unclipped = np.frombuffer(
+            exporter._convert_to_float32(audio, skip_clip=True), dtype=np.float32
+        )
+
+        np.testing.assert_array_equal(clipped, [0.5, 1.0, -1.0])
+        np.testing.assert_array_equal(unclipped, audio)
+        assert audio[1] == 1.5
+
+    def test_clip_unit_skips_in_range_audio(self):
+        """In-range audio should be passed through without a copy."""
+        from recording.file_export import _clip_unit
+        in_range = np.array([-1.0, 0.0, 1.0], dtype=np.float32)
+        out_of_range = np.array([-1.5, 0.0], dtype=np.float32)
+
+        assert _clip_unit(in_range) is in_range
+        np.testing.assert_array_equal(_clip_unit(out_of_range), [-1.0, 0.0])
+        assert out_of_range[0] == -1.5
+
 
 class TestFileExporterNormalize:
     """Tests for audio normalization."""
@@ -245,6 +394,31 @@ class TestFileExporterNormalize:
             if Path(filepath).exists():
                 Path(filepath).unlink()
 
+    def test_normalize_leaves_caller_audio_unchanged(self):
+        """Export should not scale the caller's float32 array."""
+        exporter = FileExporter()
+        audio = np.array([0.0, 0.25, -0.5], dtype=np.float32)
+        original = audio.copy()
+
+        with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as f:
+            filepath = f.name
+
+        try:
+            config = ExportConfig(bit_depth=16, normalize=True, normalize_headroom_db=0.0)
+            exporter.export_wav(audio, filepath, config)
+            np.testing.assert_array_equal(audio, original)
+        finally:
+            if Path(filepath).exists():
+                Path(filepath).unlink()
+
+    def test_normalize_in_place(self):
+        """In-place normalization should scale the given buffer."""
+        exporter = FileExporter()
+        audio = np.array([0.0, 0.25, -0.5], dtype=np.float32)
+        result = exporter._normalize(audio, 0.0, in_place=True)
+        assert result is audio
+        np.testing.assert_allclose(audio, [0.0, 0.5, -1.0])
+
 
 class TestFileExporterValidation:
     """Tests for input validation."""
@@ -264,6 +438,20 @@ class TestFileExporterValidation:
             if Path(filepath).exists():
                 Path(filepath).unlink()
 
+    def test_creates_missing_directory_once(self):
+        """Should create the output directory and remember it."""
+        exporter = FileExporter()
+        audio = np.zeros(10, dtype=np.float32)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            out_dir = Path(tmp) / 'a' / 'b'
+            exporter.export_wav(audio, str(out_dir / 'one.wav'))
+            exporter.export_wav(audio, str(out_dir / 'two.wav'))
+
+            assert (out_dir / 'one.wav').exists()
+            assert (out_dir / 'two.wav').exists()
+            assert exporter._ensured_dirs == {out_dir}
+
 
 class TestFileExporterProgress:
     """Tests for progress callback."""
@@ -291,6 +479,40 @@ class TestFileExporterProgress:
             if Path(filepath).exists():
                 Path(filepath).unlink()
 
+    def test_chunked_write_matches_single_pass(self):
+        """Chunked writing should produce the same samples as one conversion."""
+        exporter = FileExporter()
+        exporter.EXPORT_CHUNK_SIZE = 7
+        audio = np.linspace(-1.0, 1.0, 50, dtype=np.float32)
+        progress_values = []
+
+        with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as f:
+            filepath = f.name
+
+        try:
+            exporter._write_wav_file(
+                filepath, audio,
+                lambda chunk: exporter._convert_to_int16(chunk, dither=False),
+                44100, 2, 2, 1, progress_values.append
+            )
+
+            expected = exporter._mono_to_stereo(
+                exporter._convert_to_int16(audio, dither=False), 2
+            )
+            with wave.open(filepath, 'rb') as wav:
+                assert wav.getnframes() == 50
+                assert wav.readframes(50) == expected
+
+            # One update per chunk except the last, increasing
+            assert len(progress_values) == 7
+            assert progress_values == sorted(progress_values)
+
+            data = Path(filepath).read_bytes()
+            assert struct.unpack('<I', data[4:8])[0] == len(data) - 8
+        finally:
+            if Path(filepath).exists():
+                Path(filepath).unlink()
+
 
 class TestFileExporterInfo:
     """Tests for export info."""
@@ -329,6 +551,14 @@ class TestFileExporterInfo:
         # 60 seconds * 44100 samples * 2 bytes = ~5.3 MB
         assert "MB" in info['estimated_size_formatted']
 
+    def test_format_size_units(self):
+        """Sizes should switch units at 1 KB and 1 MB."""
+        exporter = FileExporter()
+        assert exporter._format_size(1023) == "1023 B"
+        assert exporter._format_size(1024) == "1.0 KB"
+        assert exporter._format_size(1536) == "1.5 KB"
+        assert exporter._format_size(1 << 20) == "1.0 MB"
+
 
 class TestFileExporterRepr:
     """Tests for string representation."""
@@ -13,7 +13,8 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from gui.styles import (
     COLORS, FONTS, DIMENSIONS, ColorScheme,
-    configure_dark_theme, create_panel_frame, create_slider_with_label
+    configure_dark_theme, create_panel_frame, create_slider_with_label,
+    MeterService, level_meter_color
 )
 
 
@@ -241,3 +242,51 @@ class TestCreateSliderWithLabel:
         )
         # Initial value should be formatted
         assert value_label.cget('text') == '50%'
+
+
+class TestMeterService:
+    """Tests for the shared level meter canvas."""
+
+    @pytest.fixture
+    def root(self):
+        """Create a root window for testing."""
+        root = tk.Tk()
+        root.withdraw()
+        yield root
+        root.destroy()
+
+    def test_color_policy(self):
+        """Default policy should map levels to green/yellow/red."""
+        assert level_meter_color(0.5) == ColorScheme.success
+        assert level_meter_color(0.8) == ColorScheme.warning
+        assert level_meter_color(0.95) == ColorScheme.error
+
+    def test_meters_share_canvas(self, root):
+        """Registered meters should be items on the same canvas."""
+        meters = MeterService(root)
+        a = meters.register('a', y=4, thickness=6)
+        b = meters.register('b', y=12, thickness=6)
+
+        assert a != b
+        assert set(meters.canvas.find_all()) == {a, b}
+
+    def test_update_sets_color(self, root):
+        """Updating a meter should recolor it per its policy."""
+        meters = MeterService(root)
+        item = meters.register('rec_level')
+        meters.update('rec_level', 0.95)
+
+        assert meters.canvas.itemcget(item, 'fill') == ColorScheme.error
+
+    def test_unregister_removes_bar(self, root):
+        """Unregistering should delete the bar and forget the name."""
+        meters = MeterService(root)
+        meters.register('a')
+        b = meters.register('b')
+
+        meters.unregister('a')
+        meters.unregister('missing')
+
+        assert set(meters.canvas.find_all()) == {b}
+        with pytest.raises(KeyError):
+            meters.update('a', 0.5)
@@ -11,7 +11,7 @@ import sys
 import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
-from gui.styles import configure_dark_theme
+from gui.styles import configure_dark_theme, MeterService
 from gui.main_window import StatusBar, PresetPanel, MainWindow
 
 
@@ -51,6 +51,11 @@ class TestStatusBar:
         assert hasattr(bar, 'cpu_label')
         assert bar.cpu_label.cget('text') == 'CPU: 0%'
 
+    def test_has_meter_service(self, root):
+        """Should host the shared level meter canvas."""
+        bar = StatusBar(root)
+        assert isinstance(bar.meters, MeterService)
+
     def test_set_status(self, root):
         """Should update status message."""
         bar = StatusBar(root)
@@ -167,6 +172,11 @@ class TestMainWindow:
         assert window is not None
         assert window.title() == "KarokeLite Mini Synthesizer"
 
+    def test_recording_meter_in_status_bar(self, window):
+        """Recording panel should draw its meter on the status bar's canvas."""
+        assert window.recording_panel._meter_service is window.status_bar.meters
+        assert window.recording_panel._meter_canvas is window.status_bar.meters.canvas
+
     def test_has_osc1_panel(self, window):
         """Should have oscillator 1 panel."""
         assert hasattr(window, 'osc1_panel')
@@ -248,6 +258,10 @@ class TestMainWindow:
         window.set_status("Test status")
         assert window.status_bar.status_label.cget('text') == "Test status"
 
+    def test_waveform_not_visible_when_withdrawn(self, window):
+        """Should report waveform hidden while the window is withdrawn."""
+        assert window.is_waveform_visible() is False
+
     def test_on_note_on_callback(self):
         """Should call note on callback via keyboard widget."""
         notes = []
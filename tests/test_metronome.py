@@ -312,6 +312,16 @@ class TestMetronomeTapTempo:
         result = metro.tap_tempo(10.0)
         assert result is None
 
+    def test_tap_tempo_uses_last_eight_taps(self):
+        """Only the last 8 taps should contribute to the average."""
+        metro = Metronome()
+        # Slow taps (1 s) followed by 8 fast taps (0.5 s)
+        for i in range(4):
+            metro.tap_tempo(float(i))
+        for i in range(1, 9):
+            result = metro.tap_tempo(3.0 + 0.5 * i)
+        assert abs(result - 120.0) < 0.01
+
 
 class TestMetronomeAccent:
     """Tests for accent functionality."""
@@ -364,3 +374,34 @@ class TestClickSound:
         """Values should be distinct."""
         assert ClickSound.HIGH != ClickSound.LOW
         assert ClickSound.LOW != ClickSound.SILENT
+
+
+class TestClickGeneration:
+    """Tests for click synthesis and caching."""
+
+    def test_click_matches_exact_envelope(self):
+        """Table envelope should match the directly computed decay."""
+        metro = Metronome(sample_rate=44100)
+        n = int(Metronome.CLICK_DURATION * 44100)
+        attack = int(Metronome.CLICK_ATTACK * 44100)
+        t = np.arange(n) / 44100
+        envelope = np.zeros(n)
+        envelope[:attack] = np.linspace(0, 1, attack)
+        envelope[attack:] = np.exp(-5 * np.linspace(0, 1, n - attack))
+        expected = np.sin(2 * np.pi * Metronome.CLICK_FREQUENCY_HIGH * t) * envelope
+        np.testing.assert_allclose(metro._click_high, expected, atol=1e-5)
+
+    def test_clicks_shared_per_sample_rate(self):
+        """Instances with the same sample rate should reuse click buffers."""
+        a = Metronome(sample_rate=48000)
+        b = Metronome(sample_rate=48000)
+        c = Metronome(sample_rate=22050)
+        assert a._click_low is b._click_low
+        assert len(c._click_low) == int(Metronome.CLICK_DURATION * 22050)
+
+    def test_common_rates_prebuilt(self):
+        """Clicks for 44.1 and 48 kHz should be built at import."""
+        from recording.metronome import _CLICK_CACHE
+        for rate in (44100, 48000):
+            click = _CLICK_CACHE[(rate, Metronome.CLICK_FREQUENCY_HIGH)]
+            assert Metronome(sample_rate=rate)._click_high is click
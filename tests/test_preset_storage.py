@@ -10,6 +10,7 @@ import tempfile
 import shutil
 import json
 from pathlib import Path
+from unittest.mock import patch
 
 # Add src to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
@@ -43,6 +44,15 @@ class TestPreset:
         assert preset.created_at != ""
         assert preset.modified_at != ""
 
+    def test_preset_keeps_given_timestamps(self):
+        """Provided timestamps should not be replaced."""
+        preset = Preset(name="Test", parameters={}, created_at="2024-01-01T00:00:00")
+        assert preset.created_at == "2024-01-01T00:00:00"
+        assert preset.modified_at > preset.created_at
+
+        factory = PresetStorage().load_preset_full('Init')
+        assert factory.created_at == factory.modified_at == PresetStorage._FACTORY_TS
+
     def test_preset_to_dict(self):
         """Should convert to dict."""
         preset = Preset(
@@ -55,6 +65,20 @@ class TestPreset:
         assert d['parameters']['key'] == 'value'
         assert d['author'] == "Me"
 
+    def test_preset_to_dict_all_fields(self):
+        """Should include every field and share nested values."""
+        from dataclasses import fields
+        preset = Preset(name="Test", parameters={'key': 1}, tags=['a'])
+        d = preset.to_dict()
+        assert list(d) == [f.name for f in fields(Preset)]
+        assert d['parameters'] is preset.parameters
+        assert d['tags'] is preset.tags
+
+    def test_preset_uses_slots(self):
+        """Preset instances should not carry a __dict__."""
+        preset = Preset(name="Test", parameters={})
+        assert not hasattr(preset, '__dict__')
+
     def test_preset_from_dict(self):
         """Should create from dict."""
         data = {
@@ -67,6 +91,33 @@ class TestPreset:
         assert preset.parameters['key'] == 'value'
         assert preset.author == "Me"
 
+    def test_preset_from_dict_validates(self):
+        """Should reject data that does not match the preset schema."""
+        from recording import preset_storage
+        validators = [preset_storage._check_preset_data]
+        if preset_storage.FASTJSONSCHEMA_AVAILABLE:
+            validators.append(preset_storage._validate_preset_data)
+
+        valid = {
+            'name': 'Test', 'parameters': {'a': 1.0, 'b': 'sine', 'c': True},
+            'tags': ['x'], 'version': '1.0'
+        }
+        invalid = [
+            [],
+            {'name': 5},
+            {'parameters': []},
+            {'parameters': {'a': [1, 2]}},
+            {'tags': [1]},
+        ]
+        for validate in validators:
+            validate(valid)
+            for data in invalid:
+                with pytest.raises(ValueError):
+                    validate(data)
+
+        with pytest.raises(ValueError):
+            Preset.from_dict({'name': 'Bad', 'tags': 'not-a-list'})
+
 
 class TestPresetStorageInit:
     """Tests for PresetStorage initialization."""
@@ -115,6 +166,50 @@ class TestPresetStorageFactoryPresets:
         assert storage.is_factory_preset('Fat Bass')
         assert not storage.is_factory_preset('NonExistent')
 
+    def test_factory_presets_read_only(self):
+        """Factory parameters should be shared read-only mappings."""
+        storage = PresetStorage()
+        params = storage.load_preset('Init')
+
+        with pytest.raises(TypeError):
+            params['filter_cutoff'] = 1.0
+        assert storage.load_preset('Init') is params
+
+        # Full presets get their own mutable copy
+        preset = storage.load_preset_full('Init')
+        preset.parameters['filter_cutoff'] = 1.0
+        assert params['filter_cutoff'] == 2000.0
+
+    def test_factory_presets_loaded_once(self):
+        """Factory presets should come from the bundled JSON file, parsed once."""
+        from recording import preset_storage
+        with open(preset_storage._FACTORY_PRESETS_PATH, 'rb') as f:
+            bundled = json.load(f)
+
+        first = PresetStorage.FACTORY_PRESETS
+        assert PresetStorage().FACTORY_PRESETS is first
+        assert list(first) == list(bundled)
+        assert dict(first['Fat Bass']) == bundled['Fat Bass']
+
+    def test_factory_preset_names_cached(self):
+        """Factory names should be one shared tuple; callers get their own list."""
+        names = PresetStorage.FACTORY_PRESET_NAMES
+        assert isinstance(names, tuple)
+        assert PresetStorage().FACTORY_PRESET_NAMES is names
+        assert names == tuple(PresetStorage.FACTORY_PRESETS)
+
+        storage = PresetStorage()
+        listed = storage.get_factory_preset_names()
+        listed.append('Mine')
+        assert storage.get_factory_preset_names() == list(names)
+
+    def test_save_factory_parameters_as_user_preset(self):
+        """Factory parameters should be savable as a user preset."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            storage = PresetStorage(preset_dir=tmpdir)
+            assert storage.save_preset('My Init', storage.load_preset('Init'))
+            assert storage.load_preset('My Init') == dict(storage.load_preset('Init'))
+
 
 class TestPresetStorageSaveLoad:
     """Tests for save/load functionality."""
@@ -169,6 +264,33 @@ class TestPresetStorageSaveLoad:
             result = storage.load_preset('NonExistent')
             assert result is None
 
+    def test_save_rejects_what_load_rejects(self):
+        """Presets that would fail validation on load should not be written."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            storage = PresetStorage(preset_dir=tmpdir)
+            for params in ({'x': 1.0, 'y': None}, {'x': [1, 2]}, {'x': {'a': 1}}):
+                assert storage.save_preset('P', params) is False
+                assert not storage.preset_exists('P')
+            assert storage.save_preset('P', {}, tags=[1]) is False
+
+            assert storage.save_preset('P', {'x': 1.0, 'w': 'saw', 'on': True, 'n': 3})
+            assert storage.load_preset_full('P').parameters['w'] == 'saw'
+            assert storage.export_preset('P', str(Path(tmpdir) / 'p.export'))
+
+    def test_failed_save_keeps_previous_file(self):
+        """An interrupted save should leave the old preset and no temp file."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            storage = PresetStorage(preset_dir=tmpdir)
+            storage.save_preset('MyPreset', {'filter_cutoff': 1500})
+
+            with patch('recording.preset_storage.os.replace', side_effect=OSError):
+                assert storage.save_preset('MyPreset', {'filter_cutoff': 300}) is False
+
+            assert storage.load_preset('MyPreset') == {'filter_cutoff': 1500}
+            assert sorted(p.name for p in Path(tmpdir).iterdir()) == [
+                PresetStorage.INDEX_FILENAME, 'mypreset.json'
+            ]
+
 
 class TestPresetStorageDelete:
     """Tests for preset deletion."""
@@ -253,6 +375,137 @@ class TestPresetStorageCategory:
             assert 'lead' in by_category
             assert 'Lead1' in by_category['lead']
 
+    def test_list_by_category_only_populated_in_order(self):
+        """Only used categories should appear, in CATEGORIES order."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            storage = PresetStorage(preset_dir=tmpdir)
+            storage.save_preset('Pad1', {}, category='pad')
+            storage.save_preset('Odd1', {}, category='not-a-category')
+            storage.save_preset('Bass1', {}, category='bass')
+
+            by_category = storage.list_presets_by_category()
+
+            assert list(by_category) == ['bass', 'pad', 'uncategorized']
+            assert by_category['uncategorized'] == (
+                list(PresetStorage.FACTORY_PRESET_NAMES) + ['Odd1']
+            )
+
+
+class TestPresetStorageJsonBackend:
+    """Tests for the JSON encode/decode helpers."""
+
+    def test_roundtrip_with_and_without_orjson(self):
+        """Presets should save and load with either JSON backend."""
+        from recording import preset_storage
+        backends = [False]
+        if preset_storage.ORJSON_AVAILABLE:
+            backends.append(True)
+
+        for use_orjson in backends:
+            with patch.object(preset_storage, 'ORJSON_AVAILABLE', use_orjson), \
+                    tempfile.TemporaryDirectory() as tmpdir:
+                storage = PresetStorage(preset_dir=tmpdir)
+                storage.save_preset('Zoë Pad', {'filter_cutoff': 1500.5}, category='pad')
+
+                assert storage.load_preset('Zoë Pad') == {'filter_cutoff': 1500.5}
+                assert storage.list_presets_by_category(include_factory=False) == {
+                    'pad': ['Zoë Pad']
+                }
+
+    def test_saved_compact_exported_pretty(self):
+        """Saved presets should be compact; exports should stay indented."""
+        from recording import preset_storage
+        backends = [False]
+        if preset_storage.ORJSON_AVAILABLE:
+            backends.append(True)
+
+        for use_orjson in backends:
+            with patch.object(preset_storage, 'ORJSON_AVAILABLE', use_orjson), \
+                    tempfile.TemporaryDirectory() as tmpdir:
+                storage = PresetStorage(preset_dir=tmpdir)
+                storage.save_preset('Lead', {'filter_cutoff': 900.0})
+                saved = (Path(tmpdir) / 'lead.json').read_text()
+                assert '\n' not in saved and ', ' not in saved
+
+                export_path = Path(tmpdir) / 'lead.export'
+                assert storage.export_preset('Lead', str(export_path))
+                exported = export_path.read_text()
+                assert '\n  "name"' in exported
+                assert json.loads(exported) == json.loads(saved)
+
+
+class TestPresetStorageIndex:
+    """Tests for the preset metadata index."""
+
+    def test_index_reused_for_unchanged_files(self):
+        """Unchanged files should be listed from the persisted index."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            PresetStorage(preset_dir=tmpdir).save_preset('Bass1', {}, category='bass')
+            path = Path(tmpdir) / 'bass1.json'
+            stat = path.stat()
+
+            # Same mtime, unparseable content: only the index can supply it
+            path.write_text('not json')
+            os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+            storage = PresetStorage(preset_dir=tmpdir)
+            assert storage.list_presets_by_category(include_factory=False) == {
+                'bass': ['Bass1']
+            }
+
+    def test_index_refreshes_changed_and_removed_files(self):
+        """Modified files should be re-read and deleted files dropped."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            storage = PresetStorage(preset_dir=tmpdir)
+            storage.save_preset('Keep', {})
+            storage.save_preset('Gone', {})
+            storage.list_presets()
+
+            path = Path(tmpdir) / 'keep.json'
+            data = json.loads(path.read_text())
+            data['name'] = 'Renamed'
+            path.write_text(json.dumps(data))
+            os.utime(path, ns=(0, path.stat().st_mtime_ns + 1))
+            (Path(tmpdir) / 'gone.json').unlink()
+
+            assert storage.list_presets(include_factory=False) == ['Renamed']
+            assert list(storage._index) == ['keep.json']
+
+    def test_large_preset_files_indexed(self):
+        """Files above the mmap threshold should parse with either backend."""
+        from recording import preset_storage
+        backends = [False]
+        if preset_storage.ORJSON_AVAILABLE:
+            backends.append(True)
+
+        for use_orjson in backends:
+            with patch.object(preset_storage, 'ORJSON_AVAILABLE', use_orjson), \
+                    tempfile.TemporaryDirectory() as tmpdir:
+                storage = PresetStorage(preset_dir=tmpdir)
+                storage.save_preset('Big', {}, category='pad',
+                                    description='x' * preset_storage._MMAP_THRESHOLD)
+                assert (Path(tmpdir) / 'big.json').stat().st_size >= preset_storage._MMAP_THRESHOLD
+
+                assert PresetStorage(preset_dir=tmpdir).list_presets_by_category(
+                    include_factory=False
+                ) == {'pad': ['Big']}
+
+    def test_parallel_read_of_many_unindexed_files(self):
+        """Directories above the thread threshold should index every file."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            storage = PresetStorage(preset_dir=tmpdir)
+            count = PresetStorage.PARALLEL_READ_THRESHOLD + 4
+            for i in range(count):
+                storage.save_preset(f'Pad {i:02d}', {}, category='pad')
+            (Path(tmpdir) / 'broken.json').write_text('not json')
+            os.remove(Path(tmpdir) / PresetStorage.INDEX_FILENAME)
+
+            by_category = PresetStorage(preset_dir=tmpdir).list_presets_by_category(
+                include_factory=False
+            )
+            assert list(by_category) == ['pad']
+            assert sorted(by_category['pad']) == [f'Pad {i:02d}' for i in range(count)]
+
 
 class TestPresetStorageExists:
     """Tests for preset_exists."""
@@ -274,6 +527,58 @@ class TestPresetStorageExists:
         storage = PresetStorage()
         assert not storage.preset_exists('NonExistent123')
 
+    def test_exists_tracks_disk_changes(self):
+        """Should see presets present at startup and pick up listings."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            PresetStorage(preset_dir=tmpdir).save_preset('Early', {})
+            storage = PresetStorage(preset_dir=tmpdir)
+            assert storage.preset_exists('Early')
+
+            # Added by another process, seen after the next listing
+            shutil.copy(Path(tmpdir) / 'early.json', Path(tmpdir) / 'late.json')
+            storage.list_presets()
+            assert storage.preset_exists('Late')
+
+            storage.delete_preset('Early')
+            assert not storage.preset_exists('Early')
+
+    def test_presets_from_other_instances_found(self):
+        """Presets written by another instance should be found without a listing."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            a = PresetStorage(preset_dir=tmpdir)
+            b = PresetStorage(preset_dir=tmpdir)
+            a.save_preset('My Bass', {'filter_cutoff': 300})
+
+            assert b.preset_exists('My Bass')
+            assert b.load_preset('My Bass') == {'filter_cutoff': 300}
+            assert b.load_preset_full('My Bass').name == 'My Bass'
+            assert b.delete_preset('My Bass')
+            assert a.load_preset('My Bass') is None
+            assert not a.preset_exists('My Bass')
+
+    def test_exists_skips_stat_on_map_hit(self):
+        """Known user presets should be answered from the map alone."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            storage = PresetStorage(preset_dir=tmpdir)
+            storage.save_preset('Known', {})
+
+            with patch.object(Path, 'is_file', side_effect=AssertionError):
+                assert storage.preset_exists('Known')
+
+    def test_lookups_use_name_to_path_map(self):
+        """Loads and deletes should resolve through the tracked path map."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            storage = PresetStorage(preset_dir=tmpdir)
+            storage.save_preset('My Lead', {'filter_cutoff': 800})
+            assert storage._name_to_path == {'my_lead': Path(tmpdir) / 'my_lead.json'}
+            assert storage.load_preset_full('My Lead').parameters == {'filter_cutoff': 800}
+
+            # Removed by another process: nothing to delete, entry dropped
+            (Path(tmpdir) / 'my_lead.json').unlink()
+            assert storage.delete_preset('My Lead') is False
+            assert storage._name_to_path == {}
+            assert storage.load_preset('My Lead') is None
+
 
 class TestPresetStorageSanitize:
     """Tests for filename sanitization."""
@@ -292,6 +597,14 @@ class TestPresetStorageSanitize:
             storage.save_preset('Preset:Test/Ver<1>', {})
             assert storage.preset_exists('Preset:Test/Ver<1>')
 
+    def test_sanitize_filename_output(self):
+        """Should lowercase, replace unsafe characters and collapse underscores."""
+        storage = PresetStorage()
+        assert storage._sanitize_filename('My Cool Preset') == 'my_cool_preset'
+        assert storage._sanitize_filename('Preset:Test/Ver<1>') == 'preset_test_ver_1'
+        assert storage._sanitize_filename(' A|B**C\\ ') == 'a_b_c'
+        assert storage._sanitize_filename('???') == 'preset'
+
 
 class TestPresetStorageImportExport:
     """Tests for import/export functionality."""
@@ -334,6 +647,36 @@ class TestPresetStorageImportExport:
             loaded = storage.load_preset('Imported')
             assert loaded['resonance'] == 0.8
 
+    def test_import_copies_complete_file(self):
+        """A complete preset file should be stored byte for byte."""
+        with tempfile.TemporaryDirectory() as src_dir, \
+                tempfile.TemporaryDirectory() as tmpdir:
+            source = PresetStorage(preset_dir=src_dir)
+            source.save_preset('Shared Bass', {'filter_cutoff': 400.0}, category='bass')
+            external_path = Path(src_dir) / 'shared_bass.json'
+
+            storage = PresetStorage(preset_dir=tmpdir)
+            assert storage.import_preset(str(external_path)) == 'Shared Bass'
+
+            imported = Path(tmpdir) / 'shared_bass.json'
+            assert imported.read_bytes() == external_path.read_bytes()
+            assert storage.list_presets_by_category(include_factory=False) == {
+                'bass': ['Shared Bass']
+            }
+
+    def test_import_invalid_file(self):
+        """Should return None for unreadable files."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            bad_path = Path(tmpdir) / 'bad.txt'
+            bad_path.write_text('not json')
+
+            storage = PresetStorage(preset_dir=tmpdir)
+            assert storage.import_preset(str(bad_path)) is None
+
+            bad_path.write_text(json.dumps({'name': 'Bad', 'parameters': {'a': None}}))
+            assert storage.import_preset(str(bad_path)) is None
+            assert not storage.preset_exists('Bad')
+
     def test_export_factory_preset(self):
         """Should be able to export factory presets."""
         with tempfile.TemporaryDirectory() as tmpdir:
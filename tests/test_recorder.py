@@ -7,6 +7,7 @@ import pytest
 import numpy as np
 import sys
 import os
+from unittest.mock import patch
 
 # Add src to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
@@ -163,6 +164,65 @@ class TestAudioRecorderAddSamples:
             recorder.add_samples(samples)
         assert recorder.duration_samples == 10240
 
+    def test_add_samples_across_pages(self):
+        """Blocks spanning page boundaries should be recorded contiguously."""
+        class SmallPageRecorder(AudioRecorder):
+            PAGE_SIZE = 8
+
+        recorder = SmallPageRecorder(sample_rate=8, max_duration_seconds=6)
+        recorder.start()
+        audio = np.linspace(-1.0, 1.0, 45).astype(np.float32)
+        for block in (audio[:5], audio[5:22], audio[22:24], audio[24:]):
+            assert recorder.add_samples(block)
+
+        assert len(recorder._pages) == 6
+        np.testing.assert_array_equal(recorder.get_audio(), audio)
+
+    def test_full_duration_preallocated(self):
+        """Pages for the whole maximum duration should exist before recording."""
+        class SmallPageRecorder(AudioRecorder):
+            PAGE_SIZE = 8
+
+        recorder = SmallPageRecorder(sample_rate=8, max_duration_seconds=11)
+        pages = list(recorder._pages)
+        assert len(pages) == 11
+
+        recorder.start()
+        for _ in range(11):
+            assert recorder.add_samples(np.ones(8, dtype=np.float32))
+        assert not recorder.add_samples(np.ones(1, dtype=np.float32))
+
+        assert all(a is b for a, b in zip(recorder._pages, pages))
+        assert len(recorder._pages) == 11
+        assert recorder.get_audio().sum() == 88
+
+    def test_copy_and_peak_paths_agree(self):
+        """The fused kernel and the NumPy fallback should record the same data."""
+        from recording import recorder as recorder_module
+        audio = np.array([0.1, -0.9, 0.4, 0.2, -0.3], dtype=np.float32)
+
+        dst = np.zeros(5, dtype=np.float32)
+        assert recorder_module._copy_and_peak(dst, audio) == pytest.approx(0.9)
+        np.testing.assert_array_equal(dst, audio)
+
+        for use_kernel in (False, True):
+            with patch.object(recorder_module, 'NUMBA_AVAILABLE', use_kernel):
+                recorder = AudioRecorder()
+                recorder.start()
+                recorder.add_samples(audio[:2])
+                recorder.add_samples(audio[2:])
+                np.testing.assert_array_equal(recorder.get_audio(), audio)
+                assert recorder.peak_level == pytest.approx(0.9)
+
+    def test_add_samples_does_not_take_lock(self):
+        """The audio thread should not block on the recorder lock."""
+        recorder = AudioRecorder()
+        recorder.start()
+        with recorder._lock:
+            assert recorder.add_samples(np.full(256, 0.25, dtype=np.float32))
+        assert recorder.duration_samples == 256
+        assert recorder.peak_level == 0.25
+
 
 class TestAudioRecorderArmed:
     """Tests for armed recording (auto-start)."""
@@ -178,6 +238,18 @@ class TestAudioRecorderArmed:
 
         assert recorder.state == RecordingState.RECORDING
 
+    def test_peak_check_reuses_scratch(self):
+        """Peak checks should reuse the scratch buffer, growing it only when needed."""
+        recorder = AudioRecorder()
+        scratch = recorder._abs_scratch
+        assert recorder._peak_abs(np.array([0.2, -0.7], dtype=np.float64)) == pytest.approx(0.7)
+        assert recorder._peak_abs(np.zeros(0, dtype=np.float32)) == 0.0
+        assert recorder._abs_scratch is scratch
+
+        big = np.full(AudioRecorder.SCRATCH_SIZE + 1, -0.5, dtype=np.float32)
+        assert recorder._peak_abs(big) == 0.5
+        assert len(recorder._abs_scratch) == len(big)
+
     def test_armed_no_start_on_silence(self):
         """Should not start on silence."""
         recorder = AudioRecorder()
@@ -305,6 +377,92 @@ class TestAudioRecorderUndo:
         assert len(audio) == 2
         assert np.allclose(audio, first)
 
+    def test_undo_swaps_pages_without_copying(self):
+        """Takes should move between buffer and undo stack by page, not by copy."""
+        class SmallPageRecorder(AudioRecorder):
+            PAGE_SIZE = 4
+
+        recorder = SmallPageRecorder(sample_rate=4, max_duration_seconds=2)
+        takes = [np.full(6, 0.1 * (i + 1), dtype=np.float32) for i in range(5)]
+        take_pages = []
+        for take in takes:
+            recorder.start()
+            recorder.add_samples(take)
+            take_pages.append(recorder._pages[:2])
+            recorder.stop()
+
+        # Only three earlier takes are kept; take 1's pages were recycled
+        assert len(recorder._undo_stack) == 3
+        assert len(recorder._free_pages) == 2
+        assert all(a is b for a, b in zip(recorder._free_pages, take_pages[0]))
+
+        for expected in (takes[3], takes[2], takes[1]):
+            assert recorder.undo()
+            np.testing.assert_array_equal(recorder.get_audio(), expected)
+            assert recorder.peak_level == expected[0]
+        assert all(a is b for a, b in zip(recorder._pages, take_pages[1]))
+        assert not recorder.undo()
+
+    def test_undo_refused_while_recording(self):
+        """Undo should not replace a take that is being recorded."""
+        recorder = AudioRecorder()
+        recorder.start()
+        recorder.add_samples(np.full(4, 0.1, dtype=np.float32))
+        recorder.stop()
+        recorder.start()
+        recorder.add_samples(np.full(8, 0.2, dtype=np.float32))
+
+        assert recorder.can_undo
+        assert not recorder.undo()
+        recorder.pause()
+        assert not recorder.undo()
+        recorder.stop()
+        assert recorder.undo()
+        assert recorder.duration_samples == 4
+
+    def test_reset_during_callback_not_overwritten(self):
+        """A clear or undo landing mid-callback should win over the stale block."""
+        recorder = AudioRecorder()
+        recorder.start()
+        recorder.add_samples(np.full(1000, 0.1, dtype=np.float32))
+        recorder.stop()
+        recorder.start()
+        recorder.add_samples(np.full(500, 0.2, dtype=np.float32))
+
+        write_pages = recorder._write_pages
+
+        def interrupted(control):
+            def write(pages, position, samples):
+                peak = write_pages(pages, position, samples)
+                control()
+                return peak
+            return write
+
+        def stop_and_clear():
+            recorder.stop()
+            recorder.clear()
+
+        with patch.object(recorder, '_write_pages', interrupted(stop_and_clear)):
+            assert not recorder.add_samples(np.full(256, 0.9, dtype=np.float32))
+        assert recorder.duration_samples == 0
+        assert recorder.peak_level == 0.0
+
+        # Undo restores the 500-sample take; the in-flight block must not
+        # replace its length
+        recorder.start()
+        recorder.add_samples(np.full(300, 0.3, dtype=np.float32))
+
+        def stop_and_undo():
+            recorder.stop()
+            recorder.undo()
+
+        with patch.object(recorder, '_write_pages', interrupted(stop_and_undo)):
+            assert not recorder.add_samples(np.full(256, 0.9, dtype=np.float32))
+        np.testing.assert_array_equal(
+            recorder.get_audio(), np.full(500, 0.2, dtype=np.float32)
+        )
+        assert recorder.peak_level == pytest.approx(0.2)
+
 
 class TestAudioRecorderCallback:
     """Tests for state change callback."""
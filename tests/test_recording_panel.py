@@ -5,13 +5,16 @@ test_recording_panel - Unit tests for recording GUI panel.
 
 import pytest
 import tkinter as tk
+import threading
 import sys
 import os
+from unittest.mock import patch
 
 # Add src to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from gui.recording_panel import RecordingPanel
+from gui.styles import MeterService
 
 
 @pytest.fixture
@@ -199,6 +202,19 @@ class TestRecordingPanelUpdateLevel:
         # Should show ~0 dB
         assert "0" in panel._level_label.cget('text')
 
+    def test_duration_and_level_share_frame(self, panel, root):
+        """Duration and level updates should coalesce into one repaint."""
+        panel.update_duration(3.0)
+        job = panel._frame_job
+        panel.update_level(0.5)
+
+        assert job is not None
+        assert panel._frame_job == job
+
+        root.update()
+        assert panel._frame_job is None
+        assert "00:03" in panel._time_label.cget('text')
+
 
 class TestRecordingPanelUpdateState:
     """Tests for state updates from external source."""
@@ -237,6 +253,32 @@ class TestRecordingPanelUpdateState:
         assert not panel.is_recording
         assert panel._status_label.cget('text') == 'IDLE'
 
+    def test_update_state_repeated_is_noop(self, panel, root):
+        """Repeating the current state should not touch the widgets."""
+        panel.update_state('RECORDING')
+        panel._set_status('CUSTOM')
+        panel.update_state('RECORDING')
+
+        assert panel._status_label.cget('text') == 'CUSTOM'
+
+    def test_internal_stop_syncs_last_state(self, panel, root):
+        """Internal transitions should keep the external state cache in sync."""
+        panel._start_recording()
+        panel.update_state('RECORDING')
+
+        assert panel._status_label.cget('text') == 'RECORDING'
+
+    def test_update_state_idle_after_stop(self, panel, root):
+        """Controller IDLE after an internal stop should replace STOPPED."""
+        panel._start_recording()
+        panel._stop_recording()
+        assert panel._status_label.cget('text') == 'STOPPED'
+
+        panel.update_state('IDLE')
+
+        assert not panel.is_recording
+        assert panel._status_label.cget('text') == 'IDLE'
+
 
 class TestRecordingPanelCanUndo:
     """Tests for undo availability."""
@@ -321,3 +363,146 @@ class TestRecordingPanelClear:
         assert len(cleared) == 1
         assert panel._duration == 0.0
         assert not panel._has_recording
+
+
+class TestRecordingPanelLazy:
+    """Tests for deferred widget creation."""
+
+    def test_lazy_defers_widgets(self, root):
+        """Lazy panel should not build widgets until mapped."""
+        panel = RecordingPanel(root, lazy=True)
+
+        assert not panel._widgets_built
+        assert not hasattr(panel, '_record_btn')
+
+    def test_lazy_replays_stashed_state(self, root):
+        """State set before mapping should be applied when widgets are built."""
+        panel = RecordingPanel(root, lazy=True)
+        panel.update_state('ARMED')
+        panel.update_duration(65.5)
+        panel.set_has_recording(True)
+        panel.set_info("1.0 MB")
+
+        panel._lazy_init()
+
+        assert panel._widgets_built
+        assert panel.is_armed
+        assert panel._status_label.cget('text') == 'ARMED'
+        assert "01:05" in panel._time_label.cget('text')
+        assert panel._info_label.cget('text') == "1.0 MB"
+        assert str(panel._export_btn.cget('state')) == 'normal'
+
+
+class TestRecordingPanelExport:
+    """Tests for background export."""
+
+    def test_export_runs_off_tk_thread(self, root):
+        """Export callback should run on the I/O worker, not the Tk thread."""
+        calls = []
+        done = threading.Event()
+
+        def on_export(path):
+            calls.append((path, threading.current_thread()))
+            done.set()
+
+        panel = RecordingPanel(root, on_export=on_export)
+        panel.pack()
+
+        with patch('gui.recording_panel.filedialog.asksaveasfilename',
+                   return_value='take.wav'):
+            panel._on_export_click()
+
+        assert panel._status_label.cget('text') == 'EXPORTING'
+        assert done.wait(timeout=2.0)
+        assert calls[0][0] == 'take.wav'
+        assert calls[0][1] is not threading.main_thread()
+
+    def test_export_restores_status(self, root):
+        """Status should be restored once the export finishes."""
+        panel = RecordingPanel(root, on_export=lambda path: None)
+        panel.pack()
+        panel._stop_recording()
+
+        with patch('gui.recording_panel.filedialog.asksaveasfilename',
+                   return_value='take.wav'):
+            panel._on_export_click()
+
+        for _ in range(50):
+            root.update()
+            if not panel._exporting:
+                break
+            root.after(panel.EXPORT_POLL_INTERVAL)
+
+        assert not panel._exporting
+        assert panel._status_label.cget('text') == 'STOPPED'
+
+    def test_export_keeps_newer_status(self, root):
+        """A state change during export should not be overwritten."""
+        release = threading.Event()
+        panel = RecordingPanel(root, on_export=lambda path: release.wait(2.0))
+        panel.pack()
+        panel._stop_recording()
+
+        with patch('gui.recording_panel.filedialog.asksaveasfilename',
+                   return_value='take.wav'):
+            panel._on_export_click()
+
+        assert str(panel._record_btn.cget('state')) == 'disabled'
+        assert str(panel._arm_btn.cget('state')) == 'disabled'
+
+        panel.update_state('ARMED')
+        release.set()
+        for _ in range(50):
+            root.update()
+            if not panel._exporting:
+                break
+            root.after(panel.EXPORT_POLL_INTERVAL)
+
+        assert not panel._exporting
+        assert panel._status_label.cget('text') == 'ARMED'
+        assert str(panel._record_btn.cget('state')) == 'normal'
+
+    def test_destroy_cancels_export_poll(self, root):
+        """Destroying mid-export should cancel the pending poll."""
+        release = threading.Event()
+        panel = RecordingPanel(root, on_export=lambda path: release.wait(2.0))
+        panel.pack()
+
+        with patch('gui.recording_panel.filedialog.asksaveasfilename',
+                   return_value='take.wav'):
+            panel._on_export_click()
+        job = panel._export_job
+        assert job is not None
+
+        panel.destroy()
+        release.set()
+
+        assert panel._export_job is None
+        assert job not in root.tk.call('after', 'info')
+
+    def test_export_cancelled_dialog(self, root):
+        """Cancelling the dialog should not start an export."""
+        calls = []
+        panel = RecordingPanel(root, on_export=calls.append)
+        panel.pack()
+
+        with patch('gui.recording_panel.filedialog.asksaveasfilename',
+                   return_value=''):
+            panel._on_export_click()
+
+        assert not panel._exporting
+        assert calls == []
+
+
+class TestRecordingPanelSharedMeter:
+    """Tests for drawing on a shared MeterService."""
+
+    def test_destroy_unregisters_shared_meter(self, root):
+        """A destroyed panel should remove its bar from a shared meter canvas."""
+        meters = MeterService(root)
+        panel = RecordingPanel(root, meter_service=meters)
+        assert len(meters.canvas.find_all()) == 1
+
+        panel.destroy()
+
+        assert meters.canvas.find_all() == ()
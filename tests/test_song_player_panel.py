@@ -0,0 +1,105 @@
+# Tests for Song Player Panel
+"""
+test_song_player_panel - Unit tests for song player GUI panel.
+"""
+
+import pytest
+import tkinter as tk
+import time
+import sys
+import os
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from gui.song_player_panel import SongPlayerPanel
+
+
+@pytest.fixture
+def root():
+    """Create tkinter root window for testing."""
+    root = tk.Tk()
+    root.withdraw()
+    yield root
+    root.destroy()
+
+
+def _wait_until(root, condition, interval=SongPlayerPanel.LOAD_POLL_INTERVAL):
+    """Pump Tk events until condition() holds or a few seconds pass."""
+    for _ in range(200):
+        root.update()
+        if condition():
+            return True
+        root.after(interval)
+    return False
+
+
+class TestSongPlayerPanelSelection:
+    """Tests for song selection and loading."""
+
+    def test_play_after_set_song_list_loads_default(self, root):
+        """PLAY on a fresh panel should load the auto-selected song first."""
+        loaded = []
+
+        def on_song_select(name):
+            loaded.append(name)
+
+        panel = SongPlayerPanel(root, on_song_select=on_song_select)
+        panel.pack()
+        panel.set_song_list(['Twinkle', 'Fur Elise'])
+
+        assert panel.selected_song == 'Twinkle'
+        panel._on_play_click()
+
+        assert _wait_until(root, lambda: panel.is_playing)
+        assert loaded == ['Twinkle']
+
+    def test_selected_song_setter_loads_song(self, root):
+        """Setting selected_song should load that song once."""
+        loaded = []
+        panel = SongPlayerPanel(
+            root,
+            on_song_select=loaded.append,
+            song_list=['Twinkle', 'Fur Elise']
+        )
+        panel.pack()
+
+        panel.selected_song = 'Fur Elise'
+        panel.selected_song = 'Fur Elise'
+        panel._on_play_click()
+
+        assert _wait_until(root, lambda: panel.is_playing)
+        assert loaded == ['Fur Elise']
+
+    def test_selected_song_setter_ignores_unknown(self, root):
+        """Unknown names should not change the selection."""
+        panel = SongPlayerPanel(root, song_list=['Twinkle'])
+        panel.selected_song = 'Missing'
+
+        assert panel.selected_song == ''
+
+
+class TestSongPlayerPanelDestroy:
+    """Tests for tearing the panel down with jobs pending."""
+
+    def test_destroy_cancels_pending_jobs(self, root):
+        """Destroy should cancel the load poll and progress flush jobs."""
+        panel = SongPlayerPanel(
+            root,
+            on_song_select=lambda name: time.sleep(0.2),
+            song_list=['Twinkle']
+        )
+        panel.pack()
+        root.update()
+
+        panel.selected_song = 'Twinkle'
+        panel._on_play_click()
+        panel.update_progress(1.0, 10.0)
+        jobs = [panel._load_poll_job, panel._flush_job]
+        assert None not in jobs
+
+        panel.destroy()
+
+        pending = root.tk.call('after', 'info')
+        assert panel._load_poll_job is None and panel._flush_job is None
+        assert not set(jobs) & set(pending)